@@ -0,0 +1,40 @@
+"""create database view indexes table
+
+Revision ID: 003
+Revises: 002
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'database_view_indexes',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('database_id', sa.Integer(),
+                  sa.ForeignKey('databases.id', ondelete='CASCADE')),
+        sa.Column('view_id', sa.String(100)),
+        sa.Column('record_id', sa.Integer(),
+                  sa.ForeignKey('database_records.id', ondelete='CASCADE')),
+        sa.Column('signature', sa.String(40)),
+        sa.Column('sort_key', sa.String(500)),
+    )
+    op.create_index('ix_database_view_indexes_id', 'database_view_indexes', ['id'])
+    op.create_index('ix_database_view_indexes_record_id', 'database_view_indexes', ['record_id'])
+    op.create_index(
+        'ix_database_view_indexes_order',
+        'database_view_indexes',
+        ['database_id', 'view_id', 'sort_key', 'record_id']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_database_view_indexes_order', table_name='database_view_indexes')
+    op.drop_index('ix_database_view_indexes_record_id', table_name='database_view_indexes')
+    op.drop_index('ix_database_view_indexes_id', table_name='database_view_indexes')
+    op.drop_table('database_view_indexes')
@@ -0,0 +1,29 @@
+"""add covering indexes to database relations
+
+Revision ID: 004
+Revises: 003
+"""
+from alembic import op
+
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_database_relations_source',
+        'database_relations',
+        ['source_record_id', 'relation_type', 'target_record_id']
+    )
+    op.create_index(
+        'ix_database_relations_target',
+        'database_relations',
+        ['target_record_id', 'relation_type', 'source_record_id']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_database_relations_target', table_name='database_relations')
+    op.drop_index('ix_database_relations_source', table_name='database_relations')
@@ -0,0 +1,22 @@
+"""add materialized computed values to database records
+
+Revision ID: 005
+Revises: 004
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('database_records', sa.Column('computed', sa.JSON(), nullable=True))
+    op.add_column('database_records', sa.Column('computed_version', sa.String(16), nullable=True))
+
+
+def downgrade():
+    op.drop_column('database_records', 'computed_version')
+    op.drop_column('database_records', 'computed')
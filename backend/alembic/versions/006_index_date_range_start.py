@@ -0,0 +1,91 @@
+"""rebuild property indexes on the start date of date range values
+
+Revision ID: 006
+Revises: 005
+"""
+import hashlib
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+# 이 리비전 시점의 값으로 고정 (앱 코드가 바뀌어도 마이그레이션은 그대로여야 한다)
+INDEXED_TEXT_LENGTH = 255
+COLUMN_PREFIX = 'prop_'
+INDEX_PREFIX = 'ix_database_records_prop_'
+
+databases = sa.table('databases', sa.column('schema', sa.JSON()), sa.column('views', sa.JSON()))
+
+
+def _digest(property_name):
+    return hashlib.sha1(property_name.encode('utf-8')).hexdigest()[:16]
+
+
+def _path_literal(property_name, member=''):
+    path = f'$."{property_name}"{member}'
+    return "'" + path.replace("'", "''") + "'"
+
+
+def _indexed_properties(schema, views):
+    """스키마의 indexed 프로퍼티와 캘린더 뷰의 date_property (수식/롤업 제외)"""
+    properties = schema.get('properties', schema) if isinstance(schema, dict) else {}
+    if not isinstance(properties, dict):
+        properties = {}
+    properties = {name: config for name, config in properties.items() if isinstance(config, dict)}
+
+    names = {name for name, config in properties.items() if config.get('indexed')}
+    for view in (views or {}).values():
+        if isinstance(view, dict) and view.get('type') == 'calendar' and view.get('date_property'):
+            names.add(view['date_property'])
+    names -= {name for name, config in properties.items() if config.get('type') in ('formula', 'rollup')}
+    return {name for name in names if '"' not in name and '\\' not in name}
+
+
+def _indexed_names(bind):
+    names = set()
+    for schema, views in bind.execute(sa.select([databases.c.schema, databases.c.views])):
+        names |= _indexed_properties(schema, views)
+    return names
+
+
+def _rebuild(value_sql):
+    """프로퍼티 인덱스를 value_sql(프로퍼티명 -> 값 SQL) 식으로 다시 만든다"""
+    bind = op.get_bind()
+    mysql = bind.dialect.name in ('mysql', 'mariadb')
+    for property_name in sorted(_indexed_names(bind)):
+        value = value_sql(property_name).replace(':', '\\:')
+        index_name = INDEX_PREFIX + _digest(property_name)
+        if mysql:
+            column_name = COLUMN_PREFIX + _digest(property_name)
+            op.execute(sa.text(
+                f"ALTER TABLE database_records DROP INDEX IF EXISTS {index_name}, "
+                f"DROP COLUMN IF EXISTS {column_name}"
+            ))
+            op.execute(sa.text(
+                f"ALTER TABLE database_records "
+                f"ADD COLUMN {column_name} VARCHAR({INDEXED_TEXT_LENGTH}) "
+                f"AS (LEFT(JSON_UNQUOTE({value}), {INDEXED_TEXT_LENGTH})) VIRTUAL, "
+                f"ADD INDEX {index_name} (database_id, {column_name})"
+            ))
+        else:
+            op.execute(sa.text(f"DROP INDEX IF EXISTS {index_name}"))
+            op.execute(sa.text(
+                f"CREATE INDEX {index_name} ON database_records (database_id, {value})"
+            ))
+
+
+def upgrade():
+    def value_sql(property_name):
+        start, value = _path_literal(property_name, '.start'), _path_literal(property_name)
+        return f"coalesce(json_extract(data, {start}), json_extract(data, {value}))"
+    _rebuild(value_sql)
+
+
+def downgrade():
+    def value_sql(property_name):
+        return f"json_extract(data, {_path_literal(property_name)})"
+    _rebuild(value_sql)
@@ -0,0 +1,20 @@
+"""add rollup aggregate state to database records
+
+Revision ID: 007
+Revises: 006
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('database_records', sa.Column('rollup_state', sa.JSON(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('database_records', 'rollup_state')
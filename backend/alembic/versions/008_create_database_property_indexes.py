@@ -0,0 +1,57 @@
+"""record the property indexes each database needs
+
+Revision ID: 008
+Revises: 007
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+databases = sa.table(
+    'databases', sa.column('id', sa.Integer()), sa.column('schema', sa.JSON()), sa.column('views', sa.JSON())
+)
+
+
+def _indexed_properties(schema, views):
+    """스키마의 indexed 프로퍼티와 캘린더 뷰의 date_property (수식/롤업 제외)"""
+    properties = schema.get('properties', schema) if isinstance(schema, dict) else {}
+    if not isinstance(properties, dict):
+        properties = {}
+    properties = {name: config for name, config in properties.items() if isinstance(config, dict)}
+
+    names = {name for name, config in properties.items() if config.get('indexed')}
+    for view in (views or {}).values():
+        if isinstance(view, dict) and view.get('type') == 'calendar' and view.get('date_property'):
+            names.add(view['date_property'])
+    names -= {name for name, config in properties.items() if config.get('type') in ('formula', 'rollup')}
+    return {name for name in names if '"' not in name and '\\' not in name}
+
+
+def upgrade():
+    property_indexes = op.create_table(
+        'database_property_indexes',
+        sa.Column('database_id', sa.Integer(),
+                  sa.ForeignKey('databases.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('property_name', sa.String(200), primary_key=True),
+        sa.Column('ready', sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+
+    # 006에서 지금 스키마의 indexed 프로퍼티 인덱스를 모두 만들었으므로 ready로 기록한다
+    bind = op.get_bind()
+    rows = [
+        {'database_id': database_id, 'property_name': property_name, 'ready': True}
+        for database_id, schema, views in bind.execute(
+            sa.select([databases.c.id, databases.c.schema, databases.c.views])
+        )
+        for property_name in sorted(_indexed_properties(schema, views))
+    ]
+    if rows:
+        op.bulk_insert(property_indexes, rows)
+
+
+def downgrade():
+    op.drop_table('database_property_indexes')
@@ -1,12 +1,13 @@
 # backend/app/api/v1/api.py
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import auth, pages, databases
+from app.api.v1.endpoints import auth, pages, databases, views
 
 api_router = APIRouter()
 api_router.include_router(auth.router, tags=["authentication"])
 api_router.include_router(pages.router, prefix="/pages", tags=["pages"])
 api_router.include_router(databases.router, prefix="/databases", tags=["databases"])
+api_router.include_router(views.router, prefix="/databases", tags=["views"])
 
 # backend/app/main.py
 from fastapi import FastAPI
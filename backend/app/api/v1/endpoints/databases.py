@@ -1,56 +1,143 @@
 # backend/app/api/v1/endpoints/databases.py
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+import json
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Union
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
+from starlette.background import BackgroundTask
 
 from app import crud, models, schemas
 from app.api import deps
+from app.db.session import SessionLocal
+from app.models.database import Database, DatabaseRecord
+from app.schemas.database import RelationConfig
+from app.services.database_automation import TriggerType, database_automation
+from app.services.database_relations import DatabaseRelationManager, LinkChanges, relation_graph
+from app.services.database.database_dependency import (
+    CircularDependencyError, DependencyGraph, DependencyRecompute, changed_computed_properties,
+    record_values, workspace_graph
+)
+from app.services.database.database_patch import PatchError, apply_json_patch, merge_patch
+from app.services.database.database_property_index import PropertyIndexManager
+from app.services.database.database_schema import parse_database_id, schema_properties
+from app.services.database.database_sort import SortDirection, SortType
+from app.services.database.database_view_index import ViewSortIndex
+from app.services.database.database_view_plan import get_view_plans, invalidate_view_plans
+from app.services.database.database_view_query import GROUPABLE_TYPES, ViewQuery, combine_filters
 
 router = APIRouter()
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# 캘린더 조회 한 번에 요청할 수 있는 최대 기간 (일)
+CALENDAR_MAX_DAYS = 366
+
 @router.get("/", response_model=List[schemas.Database])
 def read_databases(
+    response: Response,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    after: Optional[str] = None,
     current_user: models.User = Depends(deps.get_current_user),
 ) -> Any:
     """Retrieve databases"""
-    databases = crud.database.get_multi_by_owner(
-        db=db, owner_id=current_user.id, skip=skip, limit=limit
-    )
+    try:
+        databases = crud.database.get_multi_by_owner(
+            db=db, owner_id=current_user.id, skip=skip, limit=limit, after=after
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    next_cursor = crud.database.next_cursor(databases, limit)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return databases
 
+async def _validate_relations(db: Session, database_id: Optional[int],
+                              old_schema: Optional[Dict], new_schema: Optional[Dict]) -> None:
+    """새로 추가되거나 설정이 바뀐 관계 프로퍼티 검증 (대상이 없거나 순환이 생기면 400)"""
+    old_properties = schema_properties(old_schema)
+    manager = DatabaseRelationManager(db)
+    for name, config in schema_properties(new_schema).items():
+        if config.get("type") != "relation" or old_properties.get(name) == config:
+            continue
+        try:
+            relation_config = RelationConfig(**(config.get("relation_config") or {}))
+        except ValidationError:
+            relation_config = None
+        target_id = parse_database_id(relation_config.database_id) if relation_config else None
+        if target_id is None or not await manager.validate_relation(database_id, target_id, relation_config):
+            raise HTTPException(status_code=400, detail=f"Invalid relation property: {name}")
+
 @router.post("/", response_model=schemas.Database)
-def create_database(
+async def create_database(
     *,
     db: Session = Depends(deps.get_db),
     database_in: schemas.DatabaseCreate,
+    background_tasks: BackgroundTasks,
     current_user: models.User = Depends(deps.get_current_user),
 ) -> Any:
-    """Create new database"""
+    """Create new database
+
+    Relation properties must point to an existing database. Secondary
+    indexes for indexed properties are built in the background after the
+    response.
+    """
+    await _validate_relations(db, None, None, database_in.schema)
     database = crud.database.create(
         db=db, obj_in=database_in, owner_id=current_user.id
     )
+    relation_graph.refresh(database.id, database.schema)
+    _schedule_property_indexes(background_tasks, PropertyIndexManager(db).record(database))
     return database
 
 @router.put("/{id}", response_model=schemas.Database)
-def update_database(
+async def update_database(
     *,
     db: Session = Depends(deps.get_db),
     id: int,
     database_in: schemas.DatabaseUpdate,
+    background_tasks: BackgroundTasks,
     current_user: models.User = Depends(deps.get_current_user),
 ) -> Any:
-    """Update a database"""
+    """Update a database
+
+    When formula or rollup settings change, the stored computed values are
+    recalculated in the background after the response. Secondary indexes for
+    newly indexed properties are built the same way. New or changed relation
+    properties must point to an existing database without closing a cycle
+    through other databases.
+    """
     database = crud.database.get(db=db, id=id)
     if not database:
         raise HTTPException(status_code=404, detail="Database not found")
     if not crud.user.is_superuser(current_user) and (database.owner_id != current_user.id):
         raise HTTPException(status_code=400, detail="Not enough permissions")
+    update_data = database_in.dict(exclude_unset=True)
+    changed_computed = set()
+    if "schema" in update_data:
+        await _validate_relations(db, database.id, database.schema, update_data["schema"])
+        changed_computed = changed_computed_properties(database.schema, update_data["schema"])
+        # 저장하기 전에 워크스페이스 전체의 계산 프로퍼티 순환 검사
+        schemas_by_id = dict(
+            db.query(Database.id, Database.schema)
+            .filter(Database.owner_id == database.owner_id)
+        )
+        schemas_by_id[database.id] = update_data["schema"]
+        try:
+            DependencyGraph(schemas_by_id)
+        except CircularDependencyError as e:
+            raise HTTPException(status_code=400, detail=str(e))
     database = crud.database.update(
         db=db, db_obj=database, obj_in=database_in
     )
+    invalidate_view_plans(database.id)
+    relation_graph.refresh(database.id, database.schema)
+    if "schema" in update_data or "views" in update_data:
+        _schedule_property_indexes(background_tasks, PropertyIndexManager(db).record(database))
+    if changed_computed:
+        background_tasks.add_task(_refresh_computed, database.owner_id, database.id, changed_computed)
     return database
 
 @router.get("/{id}", response_model=schemas.Database)
@@ -73,6 +160,7 @@ def delete_database(
     *,
     db: Session = Depends(deps.get_db),
     id: int,
+    background_tasks: BackgroundTasks,
     current_user: models.User = Depends(deps.get_current_user),
 ) -> Any:
     """Delete database"""
@@ -81,12 +169,29 @@ def delete_database(
         raise HTTPException(status_code=404, detail="Database not found")
     if not crud.user.is_superuser(current_user) and (database.owner_id != current_user.id):
         raise HTTPException(status_code=400, detail="Not enough permissions")
+    indexed = {index.property_name for index in database.property_indexes}
     database = crud.database.remove(db=db, id=id)
+    relation_graph.remove(id)
+    # 다른 데이터베이스가 쓰지 않게 된 인덱스는 응답 후 지운다
+    _schedule_property_indexes(background_tasks, indexed)
     return database
 
+def _schedule_property_indexes(background_tasks: BackgroundTasks, property_names: Set[str]) -> None:
+    if property_names:
+        background_tasks.add_task(_apply_property_indexes, property_names)
+
+def _apply_property_indexes(property_names: Set[str]) -> None:
+    """기록이 바뀐 프로퍼티의 보조 인덱스를 응답 후 만들거나 지운다 (요청과 별도 세션)"""
+    db = SessionLocal()
+    try:
+        for database_id in PropertyIndexManager(db).apply(property_names):
+            invalidate_view_plans(database_id)
+    finally:
+        db.close()
+
 # Database Records API
 @router.post("/{database_id}/records/", response_model=schemas.DatabaseRecord)
-def create_database_record(
+async def create_database_record(
     *,
     db: Session = Depends(deps.get_db),
     database_id: int,
@@ -99,28 +204,621 @@ def create_database_record(
         raise HTTPException(status_code=404, detail="Database not found")
     if not crud.user.is_superuser(current_user) and (database.owner_id != current_user.id):
         raise HTTPException(status_code=400, detail="Not enough permissions")
-    record = crud.database_record.create(
+    record = crud.database_record.create_with_database(
         db=db,
-        obj_in=record_in
+        obj_in=record_in,
+        database_id=database_id
+    )
+    await DependencyRecompute(db).refresh_stale(
+        workspace_graph(db, database.owner_id), database_id, [record]
+    )
+    ViewSortIndex(db).on_record_saved(database, record)
+    return record
+
+@router.post("/{database_id}/records/bulk", response_model=schemas.DatabaseRecordBulkResult)
+async def bulk_database_records(
+    *,
+    db: Session = Depends(deps.get_db),
+    database_id: int,
+    bulk_in: schemas.DatabaseRecordBulk,
+    current_user: models.User = Depends(deps.get_current_user),
+) -> Any:
+    """Create, patch and delete many database records in one transaction"""
+    database = crud.database.get(db=db, id=database_id)
+    if not database:
+        raise HTTPException(status_code=404, detail="Database not found")
+    if not crud.user.is_superuser(current_user) and (database.owner_id != current_user.id):
+        raise HTTPException(status_code=400, detail="Not enough permissions")
+    results, changes = await crud.database_record.bulk_write(
+        db=db, database=database, bulk_in=bulk_in
+    )
+
+    # 커밋된 변경을 이벤트 종류별로 모아서 자동화에 한 번에 전달
+    events = {TriggerType.ON_CREATE: [], TriggerType.ON_UPDATE: [], TriggerType.ON_DELETE: []}
+    for record_id, (old, new) in changes.items():
+        if old is None:
+            events[TriggerType.ON_CREATE].append({**new, "id": record_id})
+        elif new is None:
+            events[TriggerType.ON_DELETE].append({**old, "id": record_id})
+        else:
+            events[TriggerType.ON_UPDATE].append({**new, "id": record_id})
+    for event_type, records in events.items():
+        await database_automation.handle_events(event_type, records, database_id)
+
+    return {"results": results}
+
+@router.put("/{database_id}/records/{record_id}", response_model=schemas.DatabaseRecord)
+async def update_database_record(
+    *,
+    db: Session = Depends(deps.get_db),
+    database_id: int,
+    record_id: int,
+    record_in: schemas.DatabaseRecordUpdate,
+    current_user: models.User = Depends(deps.get_current_user),
+) -> Any:
+    """Update a database record"""
+    database = crud.database.get(db=db, id=database_id)
+    if not database:
+        raise HTTPException(status_code=404, detail="Database not found")
+    if not crud.user.is_superuser(current_user) and (database.owner_id != current_user.id):
+        raise HTTPException(status_code=400, detail="Not enough permissions")
+    record = crud.database_record.get(db=db, id=record_id)
+    if not record or record.database_id != database_id:
+        raise HTTPException(status_code=404, detail="Record not found")
+    if record_in.data is not None:
+        previous = record_values(record)
+        changed = crud.database_record.update_data(db=db, db_obj=record, data=record_in.data)
+        await _record_data_changed(db, database, record, changed, previous)
+    return record
+
+@router.patch("/{database_id}/records/{record_id}", response_model=schemas.DatabaseRecord)
+async def patch_database_record(
+    *,
+    db: Session = Depends(deps.get_db),
+    database_id: int,
+    record_id: int,
+    patch: Union[List[Dict[str, Any]], Dict[str, Any]] = Body(...),
+    current_user: models.User = Depends(deps.get_current_user),
+) -> Any:
+    """Patch a database record's data
+
+    An object body is applied as a JSON Merge Patch (RFC 7396), a list body as
+    JSON Patch operations (RFC 6902). Only the changed top-level keys are written.
+    """
+    database = crud.database.get(db=db, id=database_id)
+    if not database:
+        raise HTTPException(status_code=404, detail="Database not found")
+    if not crud.user.is_superuser(current_user) and (database.owner_id != current_user.id):
+        raise HTTPException(status_code=400, detail="Not enough permissions")
+    record = crud.database_record.get(db=db, id=record_id)
+    if not record or record.database_id != database_id:
+        raise HTTPException(status_code=404, detail="Record not found")
+    old_data = dict(record.data or {})
+    try:
+        if isinstance(patch, list):
+            data = apply_json_patch(old_data, patch)
+        else:
+            data = merge_patch(old_data, patch)
+    except PatchError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    previous = record_values(record)
+    changed = crud.database_record.update_data(db=db, db_obj=record, data=data)
+    await _record_data_changed(db, database, record, changed, previous)
+    return record
+
+async def _record_data_changed(
+    db: Session, database: Database, record: DatabaseRecord, changed: List[str], previous: Dict[str, Any]
+) -> None:
+    """바뀐 프로퍼티에 의존하는 계산 값, 뷰 인덱스, 참조하는 롤업 갱신 (previous는 바뀌기 전 값)"""
+    if not changed:
+        return
+    recomputed = await DependencyRecompute(db).run(
+        workspace_graph(db, database.owner_id), database.id, [record.id], changed, {record.id: previous}
     )
+    index = ViewSortIndex(db)
+    index.on_record_saved(database, record)
+    index.on_records_saved(r for r in recomputed if r.id != record.id)
+
+async def _recompute_referrers(db: Session, database: Database, referrers: LinkChanges) -> None:
+    """관계가 바뀐 레코드들에서 그 관계를 읽는 롤업과 의존하는 계산 값, 뷰 인덱스 갱신"""
+    if not referrers:
+        return
+    recomputed = await DependencyRecompute(db).run_links(workspace_graph(db, database.owner_id), referrers)
+    ViewSortIndex(db).on_records_saved(recomputed)
+
+async def _refresh_computed(owner_id: Any, database_id: int, properties: Set[str]) -> None:
+    """계산 프로퍼티 설정이 바뀐 데이터베이스의 계산 값을 응답 후 다시 계산 (요청과 별도 세션)"""
+    db = SessionLocal()
+    try:
+        await DependencyRecompute(db).refresh_configuration(
+            workspace_graph(db, owner_id), database_id, properties
+        )
+    finally:
+        db.close()
+
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """fields 파라미터(쉼표로 구분한 프로퍼티 이름)를 목록으로 (없으면 None = 전체)"""
+    if fields is None:
+        return None
+    return list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+
+def _parse_sorts(sorts: Optional[str]) -> List[Dict[str, Any]]:
+    """sorts 파라미터(JSON 정렬 규칙 목록)를 검사해서 반환 (없으면 빈 목록)"""
+    try:
+        sort_config = json.loads(sorts) if sorts else []
+        if not isinstance(sort_config, list):
+            raise ValueError
+        for rule in sort_config:
+            if not isinstance(rule, dict) or not isinstance(rule.get("property"), str):
+                raise ValueError
+            SortType(rule.get("type", SortType.TEXT))
+            SortDirection(rule.get("direction", SortDirection.ASCENDING))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid sorts")
+    return sort_config
+
+def _ndjson_lines(stream_db: Session, records: Iterable[DatabaseRecord],
+                  fields: Optional[List[str]]) -> Iterator[str]:
+    """레코드를 한 줄에 하나씩 JSON으로 (스트림이 끝나거나 중단되면 세션을 닫는다)"""
+    try:
+        for record in records:
+            if fields is None:
+                yield schemas.DatabaseRecord.from_orm(record).json() + "\n"
+            else:
+                yield json.dumps(record.to_dict(fields)) + "\n"
+    finally:
+        stream_db.close()
+
+def _project_records(records: List[DatabaseRecord], fields: Optional[List[str]]) -> List[Any]:
+    """응답용 레코드 (fields가 있으면 그 프로퍼티만 담은 dict)"""
+    if fields is None:
+        return records
+    return [record.to_dict(fields) for record in records]
+
+@router.delete("/{database_id}/records/{record_id}", response_model=schemas.DatabaseRecord)
+async def delete_database_record(
+    *,
+    db: Session = Depends(deps.get_db),
+    database_id: int,
+    record_id: int,
+    current_user: models.User = Depends(deps.get_current_user),
+) -> Any:
+    """Delete database record"""
+    database = crud.database.get(db=db, id=database_id)
+    if not database:
+        raise HTTPException(status_code=404, detail="Database not found")
+    if not crud.user.is_superuser(current_user) and (database.owner_id != current_user.id):
+        raise HTTPException(status_code=400, detail="Not enough permissions")
+    record = crud.database_record.get(db=db, id=record_id)
+    if not record or record.database_id != database_id:
+        raise HTTPException(status_code=404, detail="Record not found")
+    ViewSortIndex(db).on_record_deleted(database_id, record_id)
+    referrers = await DatabaseRelationManager(db).handle_record_removal(record_id)
+    record = crud.database_record.remove(db=db, id=record_id)
+    await _recompute_referrers(db, database, referrers)
     return record
 
 @router.get("/{database_id}/records/", response_model=List[schemas.DatabaseRecord])
-def read_database_records(
+async def read_database_records(
+    *,
+    db: Session = Depends(deps.get_db),
+    request: Request,
+    response: Response,
+    database_id: int,
+    skip: int = 0,
+    limit: Optional[int] = None,
+    filters: Optional[str] = None,
+    view_id: Optional[str] = None,
+    after: Optional[str] = None,
+    fields: Optional[str] = None,
+    sorts: Optional[str] = None,
+    current_user: models.User = Depends(deps.get_current_user),
+) -> Any:
+    """Retrieve database records
+
+    With `Accept: application/x-ndjson` the records are streamed one JSON line
+    at a time (all matching records unless limit is given). Streamed records
+    carry their stored computed values; compare computed_version to detect
+    values that have not been refreshed since the schema changed.
+
+    `fields` (comma separated property names) limits data and computed to
+    those properties; properties without a value are left out. skip is
+    ignored when an after cursor is given.
+
+    `sorts` (a JSON list of sort rules) orders the records without a view sort
+    index; only the requested page is kept while the matching records are
+    scanned, and X-Next-Cursor continues after its last sort key. It takes
+    precedence over view_id's order.
+    """
+    database = crud.database.get(db=db, id=database_id)
+    if not database:
+        raise HTTPException(status_code=404, detail="Database not found")
+    if not crud.user.is_superuser(current_user) and (database.owner_id != current_user.id):
+        raise HTTPException(status_code=400, detail="Not enough permissions")
+    try:
+        filters = json.loads(filters) if filters else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid filters")
+    sort_config = _parse_sorts(sorts)
+    if sort_config:
+        view_id = None
+    if view_id is not None and not ViewSortIndex(db).ensure(database, view_id):
+        view_id = None
+    plans = get_view_plans(database)
+    fields = _parse_fields(fields)
+    window_args = dict(
+        db=db, database_id=database_id, sort_config=sort_config, option_ranks=plans.option_ranks,
+        skip=skip, filters=filters, after=after, indexed=plans.indexed, computed=plans.computed,
+        fields=fields
+    )
+
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        # 응답을 보내는 동안 읽으므로 요청 세션과 별도의 세션을 쓰고 스트림이 끝나면 닫는다
+        stream_db = SessionLocal()
+        try:
+            if sort_config:
+                records, _ = crud.database_record.get_sorted_window(
+                    **{**window_args, "db": stream_db}, limit=limit
+                )
+            else:
+                records = crud.database_record.stream_by_database(
+                    db=stream_db, database_id=database_id, skip=skip, limit=limit,
+                    filters=filters, view_id=view_id, after=after, indexed=plans.indexed,
+                    computed=plans.computed, fields=fields
+                )
+        except ValueError:
+            stream_db.close()
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        except Exception:
+            stream_db.close()
+            raise
+        return StreamingResponse(
+            _ndjson_lines(stream_db, records, fields), media_type=NDJSON_MEDIA_TYPE,
+            # 스트림을 시작하기 전에 연결이 끊겨도 세션을 닫는다
+            background=BackgroundTask(stream_db.close)
+        )
+
+    if limit is None:
+        limit = 100
+    try:
+        if sort_config:
+            records, next_cursor = crud.database_record.get_sorted_window(**window_args, limit=limit)
+        else:
+            records = crud.database_record.get_multi_by_database(
+                db=db, database_id=database_id, skip=skip, limit=limit,
+                filters=filters, view_id=view_id, after=after, indexed=plans.indexed,
+                computed=plans.computed, fields=fields
+            )
+            next_cursor = crud.database_record.records_cursor(
+                db, records=records, limit=limit, view_id=view_id, filters=filters
+            )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    # 계산 프로퍼티 설정이 바뀐 뒤 아직 갱신되지 않은 레코드만 다시 계산
+    await DependencyRecompute(db).refresh_stale(
+        workspace_graph(db, database.owner_id), database_id, records
+    )
+    return _project_records(records, fields)
+
+@router.get("/{database_id}/views/{view_id}/query", response_model=schemas.ViewQueryResult)
+async def query_database_view(
     *,
     db: Session = Depends(deps.get_db),
     database_id: int,
+    view_id: str,
     skip: int = 0,
     limit: int = 100,
+    filters: Optional[str] = None,
+    after: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: models.User = Depends(deps.get_current_user),
+) -> Any:
+    """Filter, sort, group and paginate a view's records in one pass
+
+    The view's saved filters are combined with the optional filters parameter
+    and records come back in the view's sort order. The first page (no cursor)
+    also carries the total, per-group counts for the view's group_by property
+    and per-month counts for its date_property. Records carry only the fields
+    parameter's properties, or the view's visible properties when it has them.
+    Later pages are read from the next_cursor of the previous one; skip only
+    applies to the first page and is ignored when a cursor is given.
+    """
+    database = crud.database.get(db=db, id=database_id)
+    if not database:
+        raise HTTPException(status_code=404, detail="Database not found")
+    if not crud.user.is_superuser(current_user) and (database.owner_id != current_user.id):
+        raise HTTPException(status_code=400, detail="Not enough permissions")
+    plans = get_view_plans(database)
+    plan = plans.view(view_id)
+    if plan is None:
+        raise HTTPException(status_code=404, detail="View not found")
+    try:
+        filters = json.loads(filters) if filters else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid filters")
+
+    view_query = plan.query
+    fields = _parse_fields(fields) if fields is not None else plan.columns
+    sort_view_id = view_id if ViewSortIndex(db).ensure(database, view_id) else None
+    query_args = dict(
+        db=db, database_id=database_id, filters=filters, view_id=sort_view_id, after=after,
+        indexed=plans.indexed, computed=plans.computed, plan=plan,
+        fields=view_query.query_fields(fields)
+    )
+    try:
+        if after is None:
+            # 개수를 세야 하므로 전체를 한 번 훑으면서 페이지 구간만 남긴다
+            result = view_query.run(
+                crud.database_record.stream_by_database(**query_args), skip=skip, limit=limit
+            )
+        else:
+            # 커서가 이미 위치를 가리키므로 skip은 적용하지 않는다
+            result = {"records": crud.database_record.get_multi_by_database(
+                **query_args, limit=limit
+            )}
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    result["next_cursor"] = crud.database_record.records_cursor(
+        db, records=result["records"], limit=limit, view_id=sort_view_id, filters=filters, plan=plan
+    )
+    await DependencyRecompute(db).refresh_stale(
+        workspace_graph(db, database.owner_id), database_id, result["records"]
+    )
+    result["records"] = _project_records(result["records"], fields)
+    return result
+
+@router.get("/{database_id}/views/{view_id}/board", response_model=schemas.BoardResult)
+async def read_database_view_board(
+    *,
+    db: Session = Depends(deps.get_db),
+    database_id: int,
+    view_id: str,
+    group_by: Optional[str] = None,
+    per_group: int = Query(20, ge=1, le=200),
+    filters: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: models.User = Depends(deps.get_current_user),
+) -> Any:
+    """Board columns: per-group counts and the first cards of each group
+
+    Groups by the view's group_by (or the group_by parameter), which must be a
+    select, multi_select or person property. Each group's next_cursor loads more
+    cards through the board records endpoint.
+    """
+    database = crud.database.get(db=db, id=database_id)
+    if not database:
+        raise HTTPException(status_code=404, detail="Database not found")
+    if not crud.user.is_superuser(current_user) and (database.owner_id != current_user.id):
+        raise HTTPException(status_code=400, detail="Not enough permissions")
+    plans = get_view_plans(database)
+    plan = plans.view(view_id)
+    if plan is None:
+        raise HTTPException(status_code=404, detail="View not found")
+    view_query = ViewQuery(plan.view, database.schema, group_by) if group_by else plan.query
+    if view_query.group_type not in GROUPABLE_TYPES:
+        raise HTTPException(status_code=400, detail="Cannot group by this property")
+    try:
+        filters = json.loads(filters) if filters else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid filters")
+
+    fields = _parse_fields(fields) if fields is not None else plan.columns
+
+    sort_view_id = view_id if ViewSortIndex(db).ensure(database, view_id) else None
+    records = crud.database_record.stream_by_database(
+        db=db, database_id=database_id, filters=filters, view_id=sort_view_id,
+        indexed=plans.indexed, computed=plans.computed, plan=plan,
+        fields=view_query.query_fields(fields)
+    )
+    groups = view_query.board(records, per_group)
+
+    for group in groups:
+        cards = group["records"]
+        if group["count"] > len(cards):
+            # 그룹 카드 조회(board/records)와 같은 조건으로 커서를 만든다
+            group["next_cursor"] = crud.database_record.records_cursor(
+                db, records=cards, limit=len(cards), view_id=sort_view_id,
+                filters=combine_filters(filters, view_query.group_filter(group["value"])), plan=plan
+            )
+    await DependencyRecompute(db).refresh_stale(
+        workspace_graph(db, database.owner_id), database_id,
+        list({record.id: record for group in groups for record in group["records"]}.values())
+    )
+    for group in groups:
+        group["records"] = _project_records(group["records"], fields)
+    return {"group_by": view_query.group_by, "groups": groups}
+
+@router.get("/{database_id}/views/{view_id}/board/records", response_model=schemas.ViewQueryResult)
+async def read_database_view_board_group(
+    *,
+    db: Session = Depends(deps.get_db),
+    database_id: int,
+    view_id: str,
+    group: Optional[str] = None,
+    group_by: Optional[str] = None,
+    after: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=200),
+    filters: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: models.User = Depends(deps.get_current_user),
+) -> Any:
+    """More cards of one board group (omit group for the empty-value group)"""
+    database = crud.database.get(db=db, id=database_id)
+    if not database:
+        raise HTTPException(status_code=404, detail="Database not found")
+    if not crud.user.is_superuser(current_user) and (database.owner_id != current_user.id):
+        raise HTTPException(status_code=400, detail="Not enough permissions")
+    plans = get_view_plans(database)
+    plan = plans.view(view_id)
+    if plan is None:
+        raise HTTPException(status_code=404, detail="View not found")
+    view_query = ViewQuery(plan.view, database.schema, group_by) if group_by else plan.query
+    if view_query.group_type not in GROUPABLE_TYPES:
+        raise HTTPException(status_code=400, detail="Cannot group by this property")
+    try:
+        filters = json.loads(filters) if filters else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid filters")
+
+    fields = _parse_fields(fields) if fields is not None else plan.columns
+
+    sort_view_id = view_id if ViewSortIndex(db).ensure(database, view_id) else None
+    group_filters = combine_filters(filters, view_query.group_filter(group))
+    try:
+        records = crud.database_record.get_multi_by_database(
+            db=db, database_id=database_id, limit=limit, filters=group_filters,
+            view_id=sort_view_id, after=after, indexed=plans.indexed, computed=plans.computed, plan=plan,
+            predicate=view_query.group_predicate(group), fields=fields
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    await DependencyRecompute(db).refresh_stale(
+        workspace_graph(db, database.owner_id), database_id, records
+    )
+    return {
+        "records": _project_records(records, fields),
+        "next_cursor": crud.database_record.records_cursor(
+            db, records=records, limit=limit, view_id=sort_view_id, filters=group_filters, plan=plan
+        ),
+    }
+
+@router.get("/{database_id}/views/{view_id}/calendar", response_model=schemas.CalendarResult)
+async def read_database_view_calendar(
+    *,
+    db: Session = Depends(deps.get_db),
+    database_id: int,
+    view_id: str,
+    start: date = Query(..., alias="from"),
+    end: date = Query(..., alias="to"),
+    date_property: Optional[str] = None,
+    filters: Optional[str] = None,
+    fields: Optional[str] = None,
     current_user: models.User = Depends(deps.get_current_user),
 ) -> Any:
-    """Retrieve database records"""
+    """Records of a calendar view between two dates (inclusive), bucketed by day"""
     database = crud.database.get(db=db, id=database_id)
     if not database:
         raise HTTPException(status_code=404, detail="Database not found")
     if not crud.user.is_superuser(current_user) and (database.owner_id != current_user.id):
         raise HTTPException(status_code=400, detail="Not enough permissions")
-    records = crud.database_record.get_multi_by_database(
-        db=db, database_id=database_id, skip=skip, limit=limit
+    plans = get_view_plans(database)
+    plan = plans.view(view_id)
+    if plan is None:
+        raise HTTPException(status_code=404, detail="View not found")
+    view_query = plan.query
+    if date_property and date_property != view_query.date_property:
+        view_query = ViewQuery({**plan.view, "date_property": date_property}, database.schema)
+    property_config = plans.properties.get(view_query.date_property) or {}
+    if property_config.get("type") != "date":
+        raise HTTPException(status_code=400, detail="Not a date property")
+    if end < start or (end - start).days >= CALENDAR_MAX_DAYS:
+        raise HTTPException(status_code=400, detail="Invalid date range")
+    try:
+        filters = json.loads(filters) if filters else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid filters")
+
+    fields = _parse_fields(fields) if fields is not None else plan.columns
+
+    records = crud.database_record.get_by_date_range(
+        db=db, database_id=database_id, property_name=view_query.date_property,
+        start=start, end=end, filters=filters, indexed=plans.indexed, computed=plans.computed,
+        plan=plan, fields=view_query.query_fields(fields)
+    )
+    await DependencyRecompute(db).refresh_stale(
+        workspace_graph(db, database.owner_id), database_id, records
     )
-    return records
\ No newline at end of file
+    days = view_query.calendar(records)
+    return {
+        "date_property": view_query.date_property,
+        "days": {day: _project_records(day_records, fields) for day, day_records in days.items()},
+    }
+
+@router.get("/{database_id}/relations", response_model=Dict[int, Dict[str, List[int]]])
+async def read_database_record_relations(
+    *,
+    db: Session = Depends(deps.get_db),
+    database_id: int,
+    record_ids: List[int] = Query(...),
+    current_user: models.User = Depends(deps.get_current_user),
+) -> Any:
+    """Retrieve forward and reverse relations for many records at once"""
+    database = crud.database.get(db=db, id=database_id)
+    if not database:
+        raise HTTPException(status_code=404, detail="Database not found")
+    if not crud.user.is_superuser(current_user) and (database.owner_id != current_user.id):
+        raise HTTPException(status_code=400, detail="Not enough permissions")
+    record_ids = [
+        record_id for record_id, in db.query(DatabaseRecord.id).filter(
+            DatabaseRecord.database_id == database_id,
+            DatabaseRecord.id.in_(record_ids)
+        )
+    ]
+    return await DatabaseRelationManager(db).get_bidirectional_relations_batch(record_ids)
+
+@router.post("/{database_id}/relations/bulk", response_model=schemas.RelationBulkLinkResult)
+async def bulk_link_database_records(
+    *,
+    db: Session = Depends(deps.get_db),
+    database_id: int,
+    links_in: schemas.RelationBulkLink,
+    current_user: models.User = Depends(deps.get_current_user),
+) -> Any:
+    """Link many source records through a relation property in one transaction"""
+    database = crud.database.get(db=db, id=database_id)
+    if not database:
+        raise HTTPException(status_code=404, detail="Database not found")
+    if not crud.user.is_superuser(current_user) and (database.owner_id != current_user.id):
+        raise HTTPException(status_code=400, detail="Not enough permissions")
+    property_config = schema_properties(database.schema).get(links_in.property_name) or {}
+    if property_config.get("type") != "relation" or not property_config.get("relation_config"):
+        raise HTTPException(status_code=400, detail="Not a relation property")
+
+    links = {}
+    for link in links_in.links:
+        links.setdefault(link.record_id, []).extend(link.related_ids)
+    found = {
+        record_id for record_id, in db.query(DatabaseRecord.id).filter(
+            DatabaseRecord.database_id == database_id,
+            DatabaseRecord.id.in_(list(links))
+        )
+    }
+    if len(found) != len(links):
+        raise HTTPException(status_code=404, detail="Record not found")
+
+    relation_config = RelationConfig(**property_config["relation_config"])
+    target_database_id = parse_database_id(relation_config.database_id)
+    if target_database_id is None:
+        raise HTTPException(status_code=400, detail="Invalid relation target database")
+    # 관련 레코드는 모두 관계 프로퍼티가 가리키는 데이터베이스에 있어야 한다
+    related_ids = {related_id for related_ids in links.values() for related_id in related_ids}
+    found = {
+        record_id for record_id, in db.query(DatabaseRecord.id).filter(
+            DatabaseRecord.database_id == target_database_id,
+            DatabaseRecord.id.in_(list(related_ids))
+        )
+    }
+    if len(found) != len(related_ids):
+        raise HTTPException(status_code=404, detail="Related record not found")
+
+    added, removed = await DatabaseRelationManager(db).bulk_link(
+        links_in.property_name, links, relation_config
+    )
+
+    # 연결이 바뀐 원본 레코드(와 역방향 관계의 관련 레코드)의 롤업 다시 계산
+    referrers = LinkChanges()
+    for record_id, related_id in added:
+        referrers.link(database_id, links_in.property_name, record_id, added=[related_id])
+    for record_id, related_id in removed:
+        referrers.link(database_id, links_in.property_name, record_id, removed=[related_id])
+    if relation_config.reverse_property and (added or removed):
+        # 역방향 연결은 바뀐 내용을 돌려받지 않으므로 다시 계산한다
+        referrers.touch(
+            target_database_id, relation_config.reverse_property,
+            {related_id for _, related_id in added + removed}
+        )
+    await _recompute_referrers(db, database, referrers)
+    return {"created": len(added), "deleted": len(removed)}
\ No newline at end of file
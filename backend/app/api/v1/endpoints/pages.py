@@ -1,6 +1,6 @@
 
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
@@ -10,15 +10,23 @@ router = APIRouter()
 
 @router.get("/", response_model=List[schemas.Page])
 def read_pages(
+    response: Response,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    after: Optional[str] = None,
     current_user: models.User = Depends(deps.get_current_user),
 ) -> Any:
     """Retrieve pages"""
-    pages = crud.page.get_multi_by_owner(
-        db=db, owner_id=current_user.id, skip=skip, limit=limit
-    )
+    try:
+        pages = crud.page.get_multi_by_owner(
+            db=db, owner_id=current_user.id, skip=skip, limit=limit, after=after
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    next_cursor = crud.page.next_cursor(pages, limit)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return pages
 
 @router.post("/", response_model=schemas.Page)
@@ -1,31 +1,34 @@
-
-from typing import Any
+# backend/app/api/v1/endpoints/views.py
+from typing import Any, Optional
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from app import crud
+
+from app import crud, models, schemas
 from app.api import deps
-from app.schemas.database import ViewConfig
+from app.services.database.database_view_plan import invalidate_view_plans
 
 router = APIRouter()
 
-@router.post("/{database_id}/views/{view_id}/clone")
-async def clone_view(
+@router.post("/{database_id}/views/{view_id}/clone", response_model=schemas.ViewClone)
+def clone_view(
     *,
     db: Session = Depends(deps.get_db),
     database_id: int,
     view_id: str,
-    new_name: str = None
+    new_name: Optional[str] = None,
+    current_user: models.User = Depends(deps.get_current_user),
 ) -> Any:
     """뷰 복제"""
+    database = crud.database.get(db=db, id=database_id)
+    if not database:
+        raise HTTPException(status_code=404, detail="Database not found")
+    if not crud.user.is_superuser(current_user) and (database.owner_id != current_user.id):
+        raise HTTPException(status_code=400, detail="Not enough permissions")
     try:
-        cloned_view = await crud.database_view.clone_view(
-            db=db,
-            database_id=database_id,
-            view_id=view_id,
-            new_name=new_name
+        clone_id, cloned_view = crud.database.clone_view(
+            db=db, db_obj=database, view_id=view_id, new_name=new_name
         )
-        return cloned_view
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
+    invalidate_view_plans(database.id)
+    return {"view_id": clone_id, "view": cloned_view}
@@ -0,0 +1,3 @@
+from .crud_user import user
+from .database import database, database_record
+from .page import page
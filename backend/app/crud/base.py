@@ -1,7 +1,9 @@
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect
+from sqlalchemy.orm import Query, Session
+from app.core.cursor import encode_cursor, decode_cursor
 from app.db.base_class import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
@@ -15,8 +17,32 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def get(self, db: Session, id: Any) -> Optional[ModelType]:
         return db.query(self.model).filter(self.model.id == id).first()
 
-    def get_multi(self, db: Session, *, skip: int = 0, limit: int = 100) -> List[ModelType]:
-        return db.query(self.model).offset(skip).limit(limit).all()
+    def get_multi(
+        self, db: Session, *, skip: int = 0, limit: int = 100, after: Optional[str] = None
+    ) -> List[ModelType]:
+        query = self.after_id(db.query(self.model), after)
+        return query.order_by(self.model.id).offset(self.page_offset(skip, after)).limit(limit).all()
+
+    def after_id(self, query: Query, after: Optional[str]) -> Query:
+        """after 커서(마지막으로 본 id) 다음부터 읽도록 제한 (OFFSET 대신 인덱스 범위 조회)"""
+        if after is None:
+            return query
+        last_id = decode_cursor(after).get("id")
+        if not isinstance(last_id, int):
+            raise ValueError("Invalid cursor")
+        return query.filter(self.model.id > last_id)
+
+    @staticmethod
+    def page_offset(skip: int, after: Optional[str]) -> int:
+        """커서가 있으면 커서 위치부터 읽으므로 skip은 무시한다"""
+        return 0 if after is not None else skip
+
+    @staticmethod
+    def next_cursor(items: List[ModelType], limit: int) -> Optional[str]:
+        """id 순으로 읽은 페이지가 가득 찼으면 다음 페이지 커서"""
+        if not items or len(items) < limit:
+            return None
+        return encode_cursor({"id": items[-1].id})
 
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         obj_in_data = jsonable_encoder(obj_in)
@@ -27,12 +53,12 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         return db_obj
 
     def update(self, db: Session, *, db_obj: ModelType, obj_in: Union[UpdateSchemaType, Dict[str, Any]]) -> ModelType:
-        obj_data = jsonable_encoder(db_obj)
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
             update_data = obj_in.dict(exclude_unset=True)
-        for field in obj_data:
+        # 객체 전체를 인코딩하지 않고 매핑된 컬럼 이름만 확인
+        for field in inspect(self.model).column_attrs.keys():
             if field in update_data:
                 setattr(db_obj, field, update_data[field])
         db.add(db_obj)
@@ -1,19 +1,471 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from app.models.database import Database, DatabaseRecord
-from app.schemas.database import DatabaseCreate, DatabaseUpdate
+from itertools import islice
+import copy
+from datetime import date, datetime, timedelta
+import json
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import JSON, String, and_, or_, func, literal, type_coerce
+from sqlalchemy.orm import Session, defer
+from sqlalchemy.orm.attributes import set_committed_value
+from app.models.database import Database, DatabaseRecord, DatabaseViewIndex
+from app.schemas.database import (
+    DatabaseCreate, DatabaseUpdate, DatabaseRecordCreate, DatabaseRecordUpdate,
+    DatabaseRecordBulk
+)
+from app.services.database.database_bulk import batched, delete_results, plan_updates
+from app.services.database.database_cursor import (
+    decode_records_cursor, encode_records_cursor, records_cursor_hash
+)
+from app.services.database.database_dependency import DependencyRecompute, record_values, workspace_graph
+from app.services.database.database_filter import DatabaseFilter
+from app.services.database.database_filter_sql import FilterSQLTranslator
+from app.services.database.database_patch import changed_keys
+from app.services.database.database_property_index import indexed_expression, start_expression
+from app.services.database.database_sort import DatabaseSort
+from app.services.database.database_view_index import ViewSortIndex
+from app.services.database.database_view_plan import ViewPlan
+from app.services.database_relations import DatabaseRelationManager, LinkChanges
 from .base import CRUDBase
 
+# 스트리밍 조회 시 한 번에 가져오는 행 수
+STREAM_BATCH_SIZE = 500
+
+# SQLite에서 JSON 값을 그대로 꺼내는 -> 연산자를 지원하는 최소 버전
+SQLITE_JSON_ARROW_VERSION = (3, 38)
+
+# 레코드 id -> (이전 데이터, 새 데이터). 생성은 이전 데이터가, 삭제는 새 데이터가 None
+RecordChanges = Dict[int, Tuple[Optional[Dict], Optional[Dict]]]
+
 class CRUDDatabase(CRUDBase[Database, DatabaseCreate, DatabaseUpdate]):
     def get_multi_by_owner(
-        self, db: Session, *, owner_id: int, skip: int = 0, limit: int = 100
+        self, db: Session, *, owner_id: int, skip: int = 0, limit: int = 100,
+        after: Optional[str] = None
     ) -> List[Database]:
         return (
-            db.query(self.model)
+            self.after_id(db.query(self.model), after)
             .filter(Database.owner_id == owner_id)
-            .offset(skip)
+            .order_by(Database.id)
+            .offset(self.page_offset(skip, after))
             .limit(limit)
             .all()
         )
 
-database = CRUDDatabase(Database)
\ No newline at end of file
+    def clone_view(
+        self, db: Session, *, db_obj: Database, view_id: str, new_name: Optional[str] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """뷰 설정을 복사해 새 뷰로 추가하고 (새 view_id, 설정) 반환"""
+        views = dict(db_obj.views or {})
+        view = views.get(view_id)
+        if not isinstance(view, dict):
+            raise ValueError("View not found")
+
+        clone_id, suffix = f"{view_id}_copy", 2
+        while clone_id in views:
+            clone_id, suffix = f"{view_id}_copy_{suffix}", suffix + 1
+        # 이름만 다른 뷰는 같은 실행 계획을 공유한다 (database_view_plan 참고)
+        clone = copy.deepcopy(view)
+        clone["name"] = new_name or f"{view.get('name') or view_id} (copy)"
+        views[clone_id] = clone
+
+        db_obj.views = views
+        db.commit()
+        db.refresh(db_obj)
+        return clone_id, clone
+
+class CRUDDatabaseRecord(CRUDBase[DatabaseRecord, DatabaseRecordCreate, DatabaseRecordUpdate]):
+    def create_with_database(
+        self, db: Session, *, obj_in: DatabaseRecordCreate, database_id: int
+    ) -> DatabaseRecord:
+        obj_in_data = jsonable_encoder(obj_in)
+        db_obj = self.model(**obj_in_data, database_id=database_id)
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def update_data(
+        self, db: Session, *, db_obj: DatabaseRecord, data: Dict[str, Any]
+    ) -> List[str]:
+        """레코드 data를 새 값으로 바꾸되 바뀐 최상위 키만 JSON_SET/JSON_REMOVE로 기록
+
+        data 전체를 다시 쓰지 않으므로 긴 텍스트가 있는 레코드도 바뀐 값만큼만 전송한다.
+        바뀐 키 목록을 반환한다.
+        """
+        old_data = db_obj.data
+        changed = sorted(changed_keys(old_data or {}, data))
+        if not changed:
+            return []
+
+        if old_data is None or any('"' in key or "\\" in key for key in changed):
+            value = data  # 경로로 나타낼 수 없는 키가 있으면 전체를 기록
+        else:
+            value = self._data_patch(db.get_bind().dialect.name, data, changed)
+
+        now = datetime.utcnow()
+        (
+            db.query(self.model)
+            .filter(DatabaseRecord.id == db_obj.id)
+            .update({"data": value, "updated_at": now}, synchronize_session=False)
+        )
+        db.commit()
+        set_committed_value(db_obj, "data", data)
+        set_committed_value(db_obj, "updated_at", now)
+        return changed
+
+    @staticmethod
+    def _data_patch(dialect_name: str, data: Dict[str, Any], changed: List[str]):
+        """data 컬럼에서 바뀐 키만 고치는 SQL 식"""
+        expression = DatabaseRecord.data
+        removed = [f'$."{key}"' for key in changed if key not in data]
+        if removed:
+            expression = func.json_remove(expression, *removed)
+
+        arguments = []
+        for key in changed:
+            if key in data:
+                value = json.dumps(data[key])
+                # JSON 텍스트를 문자열이 아닌 JSON 값으로 넣도록 변환
+                if dialect_name in ("mysql", "mariadb"):
+                    value = func.json_extract(value, "$")
+                else:
+                    value = func.json(value)
+                arguments += [f'$."{key}"', value]
+        if arguments:
+            expression = func.json_set(expression, *arguments)
+        return expression
+
+    def get_multi_by_ids(self, db: Session, *, ids: List[int]) -> List[DatabaseRecord]:
+        records = []
+        for batch in batched(ids):
+            records.extend(db.query(self.model).filter(DatabaseRecord.id.in_(batch)))
+        return records
+
+    async def bulk_write(
+        self, db: Session, *, database: Database, bulk_in: DatabaseRecordBulk
+    ) -> Tuple[List[Dict[str, Any]], RecordChanges]:
+        """레코드 생성/수정/삭제를 한 트랜잭션에서 일괄 반영 (커밋 한 번)
+
+        수정은 data에 JSON Merge Patch로 병합한다. 삭제할 레코드는 뷰 인덱스와 관계에서 뺀 뒤
+        지운다. 바뀐 레코드의 계산 값과 뷰 인덱스, 삭제된 레코드를 참조하던 레코드의 롤업도
+        같은 트랜잭션에서 갱신한다. (항목별 결과, 레코드별 변경)을 반환한다.
+        """
+        database_id = database.id
+        delete_ids = list(dict.fromkeys(bulk_in.delete))
+        current = self._data_by_ids(
+            db, database_id, [patch.id for patch in bulk_in.update] + delete_ids
+        )
+        original = dict(current)
+        results: List[Dict[str, Any]] = []
+        changes: RecordChanges = {}
+        try:
+            records_in = [jsonable_encoder(record_in) for record_in in bulk_in.create]
+            mappings = [{**record_in, "database_id": database_id} for record_in in records_in]
+            # 생성된 id를 결과에 돌려주기 위해 return_defaults 사용
+            for batch in batched(mappings):
+                db.bulk_insert_mappings(self.model, batch, return_defaults=True)
+            for index, mapping in enumerate(mappings):
+                changes[mapping["id"]] = (None, mapping["data"])
+                results.append({"action": "create", "index": index, "id": mapping["id"], "success": True})
+
+            update_results, updated = plan_updates(current, bulk_in.update, set(delete_ids))
+            results += update_results
+            for record_id, data in updated.items():
+                changes[record_id] = (original[record_id], data)
+            db.bulk_update_mappings(self.model, [
+                {"id": record_id, "data": data} for record_id, data in updated.items()
+            ])
+
+            deleted = {record_id: current[record_id] for record_id in delete_ids if record_id in current}
+            ViewSortIndex(db).delete_records(database_id, list(deleted))
+            referrers = DatabaseRelationManager(db).detach_records(deleted)
+            for batch in batched(list(deleted)):
+                (
+                    db.query(self.model)
+                    .filter(DatabaseRecord.id.in_(batch))
+                    .delete(synchronize_session=False)
+                )
+            results += delete_results(bulk_in.delete, set(deleted))
+            changes.update((record_id, (data, None)) for record_id, data in deleted.items())
+
+            await self._bulk_recompute(db, database, changes, referrers)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        return results, changes
+
+    async def _bulk_recompute(
+        self, db: Session, database: Database, changes: RecordChanges, referrers: LinkChanges
+    ) -> None:
+        """일괄 쓰기 후 계산 값, 뷰 인덱스, 참조하는 롤업 갱신 (커밋은 호출한 쪽에서)"""
+        saved = self.get_multi_by_ids(db=db, ids=[
+            record_id for record_id, (old, new) in changes.items() if new is not None
+        ])
+        created = [record for record in saved if changes[record.id][0] is None]
+        updated_ids = [record.id for record in saved if changes[record.id][0] is not None]
+
+        graph = workspace_graph(db, database.owner_id)
+        recompute = DependencyRecompute(db)
+        await recompute.refresh_records(graph, database.id, created)
+        changed = set()
+        previous = {}
+        for record in saved:
+            old, new = changes[record.id]
+            if old is not None:
+                changed.update(name for name in set(old) | set(new) if old.get(name) != new.get(name))
+                previous[record.id] = {**old, **(record.computed or {})}
+        recomputed = await recompute.update(graph, database.id, updated_ids, changed, previous)
+        recomputed += await recompute.update_links(graph, referrers)
+
+        saved_ids = {record.id for record in saved}
+        ViewSortIndex(db).save_all(saved + [record for record in recomputed if record.id not in saved_ids])
+
+    def get_multi_by_database(
+        self, db: Session, *, database_id: int, skip: int = 0, limit: int = 100,
+        filters: Optional[Any] = None, view_id: Optional[str] = None,
+        after: Optional[str] = None, indexed: Iterable[str] = (), computed: Iterable[str] = (),
+        predicate: Optional[Callable[[Dict], bool]] = None, plan: Optional[ViewPlan] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[DatabaseRecord]:
+        """fields를 주면 그 프로퍼티만 읽어 온다 (record.field_data / to_dict(fields) 참고)"""
+        skip = self.page_offset(skip, after)
+        query, predicate = self._records_query(
+            db, database_id=database_id, filters=filters, view_id=view_id, after=after,
+            indexed=indexed, computed=computed, predicate=predicate, plan=plan
+        )
+        if predicate is None:
+            query, projected = self._project(db, query, fields)
+            records = query.offset(skip).limit(limit).all()
+            return list(self._projected(records)) if projected else records
+
+        # 나머지 조건은 메모리에서 검사한 뒤 페이지를 자른다
+        matched = (record for record in query.yield_per(STREAM_BATCH_SIZE) if predicate(record_values(record)))
+        return list(islice(matched, skip, skip + limit))
+
+    def stream_by_database(
+        self, db: Session, *, database_id: int, skip: int = 0, limit: Optional[int] = None,
+        filters: Optional[Any] = None, view_id: Optional[str] = None,
+        after: Optional[str] = None, indexed: Iterable[str] = (), computed: Iterable[str] = (),
+        predicate: Optional[Callable[[Dict], bool]] = None, plan: Optional[ViewPlan] = None,
+        fields: Optional[List[str]] = None
+    ) -> Iterator[DatabaseRecord]:
+        """get_multi_by_database와 같은 결과를 서버 측 커서로 조금씩 읽어서 반환
+
+        결과 전체를 메모리에 올리지 않으므로 내보내기 등 큰 조회에 사용한다.
+        """
+        skip = self.page_offset(skip, after)
+        query, predicate = self._records_query(
+            db, database_id=database_id, filters=filters, view_id=view_id, after=after,
+            indexed=indexed, computed=computed, predicate=predicate, plan=plan
+        )
+        query = query.execution_options(stream_results=True)
+        if predicate is None:
+            query, projected = self._project(db, query, fields)
+            query = query.offset(skip)
+            if limit is not None:
+                query = query.limit(limit)
+            records = query.yield_per(STREAM_BATCH_SIZE)
+            return self._projected(records) if projected else iter(records)
+
+        matched = (
+            record for record in query.yield_per(STREAM_BATCH_SIZE)
+            if predicate(record_values(record))
+        )
+        return islice(matched, skip, None if limit is None else skip + limit)
+
+    def get_sorted_window(
+        self, db: Session, *, database_id: int, sort_config: List[Dict],
+        option_ranks: Optional[Dict[str, Dict[str, int]]] = None, skip: int = 0,
+        limit: Optional[int] = 100, filters: Optional[Any] = None, after: Optional[str] = None,
+        indexed: Iterable[str] = (), computed: Iterable[str] = (), fields: Optional[List[str]] = None
+    ) -> Tuple[List[DatabaseRecord], Optional[str]]:
+        """sort_config 순서로 정렬한 [skip, skip + limit) 구간과 다음 페이지 커서
+
+        뷰 정렬 인덱스가 없는 임의 정렬이므로 조건에 맞는 레코드를 한 번 훑으면서
+        구간에 들 레코드만 힙에 남긴다 (DatabaseSort.sort_window).
+        """
+        if fields is not None:
+            # 정렬 키를 계산할 프로퍼티도 함께 읽어 온다
+            fields = list(dict.fromkeys(fields + [rule["property"] for rule in sort_config]))
+        records = self.stream_by_database(
+            db, database_id=database_id, filters=filters, indexed=indexed, computed=computed,
+            fields=fields
+        )
+        return DatabaseSort(option_ranks).sort_window(
+            records, sort_config, limit=limit, after=after, skip=skip,
+            scope=records_cursor_hash(filters, None, None),
+            get_data=lambda record: {**record.field_data(), **(record.computed or {})},
+            get_id=attrgetter("id")
+        )
+
+    def get_by_date_range(
+        self, db: Session, *, database_id: int, property_name: str, start: date, end: date,
+        filters: Optional[Any] = None, indexed: Iterable[str] = (), computed: Iterable[str] = (),
+        plan: Optional[ViewPlan] = None, fields: Optional[List[str]] = None
+    ) -> List[DatabaseRecord]:
+        """날짜 프로퍼티가 [start, end] 안에 드는 레코드 (날짜 순)
+
+        날짜 값은 ISO 문자열이므로 문자열 범위로 비교하고, 프로퍼티가 indexed이면
+        (database_id, 날짜) 인덱스의 범위 탐색이 된다. 기간({"start", "end"}) 값은
+        시작 날짜로 비교한다.
+        """
+        query, predicate = self._records_query(
+            db, database_id=database_id, filters=filters, view_id=None, after=None, indexed=indexed,
+            computed=computed, plan=plan
+        )
+        dialect_name = db.get_bind().dialect.name
+        dialect = "mysql" if dialect_name in ("mysql", "mariadb") else "sqlite"
+        if property_name in set(indexed):
+            value = indexed_expression(dialect, property_name)
+        else:
+            value = start_expression(dialect, property_name)
+        # 끝 날짜의 시각이 붙은 값까지 포함하도록 다음 날 0시 전까지
+        query = (
+            query.filter(value >= start.isoformat(), value < (end + timedelta(days=1)).isoformat())
+            .order_by(None)
+            .order_by(value, DatabaseRecord.id)
+        )
+        if predicate is None:
+            query, projected = self._project(db, query, fields)
+            records = query.all()
+            return list(self._projected(records)) if projected else records
+        return [record for record in query.yield_per(STREAM_BATCH_SIZE) if predicate(record_values(record))]
+
+    @staticmethod
+    def _project(db: Session, query, fields: Optional[List[str]]) -> Tuple[Any, bool]:
+        """data 대신 fields만 담은 JSON 객체를 SQL에서 만들어 읽도록 바꾼 (쿼리, 적용 여부)
+
+        JSON 경로로 쓸 수 없는 이름이 있거나 SQLite가 -> 연산자를 지원하지 않으면
+        data 전체를 읽는다 (응답은 어느 쪽이든 to_dict(fields)로 자른다).
+        """
+        if fields is None or any('"' in name or "\\" in name for name in fields):
+            return query, False
+        dialect = db.get_bind().dialect
+        if dialect.name in ("mysql", "mariadb"):
+            # MariaDB는 JSON_EXTRACT 결과를 JSON으로 보고 그대로 객체에 넣는다
+            extract = lambda path: func.json_extract(DatabaseRecord.data, path)
+        elif (dialect.server_version_info or ()) >= SQLITE_JSON_ARROW_VERSION:
+            # SQLite의 json_extract는 true/false를 1/0으로 바꾸므로 JSON 그대로 꺼내는 -> 사용
+            extract = lambda path: DatabaseRecord.data.op("->")(literal(path, String))
+        else:
+            return query, False
+
+        pairs = []
+        for name in fields:
+            pairs += [name, extract(f'$."{name}"')]
+        projection = type_coerce(func.json_object(*pairs), JSON)
+        return query.options(defer(DatabaseRecord.data)).add_columns(projection), True
+
+    @staticmethod
+    def _projected(rows: Iterable[Tuple[DatabaseRecord, Optional[Dict]]]) -> Iterator[DatabaseRecord]:
+        """(레코드, 잘라 온 data) 행을 projected_data가 채워진 레코드로"""
+        for record, data in rows:
+            record.projected_data = {
+                name: value for name, value in (data or {}).items() if value is not None
+            }
+            yield record
+
+    def _data_by_ids(self, db: Session, database_id: int, ids: List[int]) -> Dict[int, Dict]:
+        """데이터베이스에 속한 레코드들의 {id: data}"""
+        ids = list(dict.fromkeys(ids))
+        data = {}
+        for batch in batched(ids):
+            data.update(
+                (record_id, record_data or {}) for record_id, record_data in
+                db.query(DatabaseRecord.id, DatabaseRecord.data)
+                .filter(DatabaseRecord.database_id == database_id, DatabaseRecord.id.in_(batch))
+            )
+        return data
+
+    def _records_query(
+        self, db: Session, *, database_id: int, filters: Optional[Any],
+        view_id: Optional[str], after: Optional[str], indexed: Iterable[str] = (),
+        computed: Iterable[str] = (), predicate: Optional[Callable[[Dict], bool]] = None,
+        plan: Optional[ViewPlan] = None
+    ) -> Tuple[Any, Optional[Callable[[Dict], bool]]]:
+        """(정렬된 레코드 쿼리, 메모리에서 검사할 잔여 필터 조건) 반환
+
+        indexed는 보조 인덱스가 있는 프로퍼티로, 이 프로퍼티 조건은 인덱스 식으로 비교한다.
+        computed는 수식/롤업 프로퍼티로, 이 프로퍼티 조건은 computed 컬럼에 대해 비교한다.
+        잔여 조건은 data에 계산 값을 합친 값(record_values)에 대해 메모리에서 검사하며,
+        predicate는 필터로 나타낼 수 없어 추가로 검사할 조건이다.
+        plan이 있으면 미리 변환해 둔 뷰 필터를 filters와 AND로 함께 적용한다.
+        """
+        query = db.query(self.model).filter(DatabaseRecord.database_id == database_id)
+        dialect_name = db.get_bind().dialect.name
+        predicates = []
+
+        # 변환 가능한 필터 조건은 data(JSON) 컬럼에 대한 SQL 조건으로 내려보낸다
+        where, residual = FilterSQLTranslator(dialect_name, indexed, computed).translate(filters)
+        if where is not None:
+            query = query.filter(where)
+        if residual is not None:
+            predicates.append(DatabaseFilter().compile(residual))
+        if plan is not None:
+            where, plan_predicate = plan.translate(dialect_name)
+            if where is not None:
+                query = query.filter(where)
+            if plan_predicate is not None:
+                predicates.append(plan_predicate)
+        if predicate is not None:
+            predicates.append(predicate)
+        if view_id is not None:
+            # 뷰 정렬 인덱스가 있으면 정렬 없이 인덱스 순서대로 읽는다
+            query = ViewSortIndex.order_query(query, database_id, view_id)
+            if after is not None:
+                signature = ViewSortIndex(db).stored_signature(database_id, view_id)
+                query = self._after_sort_key(query, after, view_id, records_cursor_hash(filters, plan, signature))
+        else:
+            if after is not None:
+                query = self._after_record(query, after, records_cursor_hash(filters, plan, None))
+            query = query.order_by(DatabaseRecord.id)
+
+        if len(predicates) < 2:
+            return query, predicates[0] if predicates else None
+        return query, lambda data: all(check(data) for check in predicates)
+
+    def records_cursor(
+        self, db: Session, *, records: List[DatabaseRecord], limit: int,
+        view_id: Optional[str] = None, filters: Optional[Any] = None, plan: Optional[ViewPlan] = None
+    ) -> Optional[str]:
+        """get_multi_by_database로 읽은 페이지가 가득 찼으면 다음 페이지 커서
+
+        filters/plan은 페이지를 읽을 때 넘긴 값이다. 커서에 필터와 정렬의 해시를 넣어서
+        조건이 다른 조회에는 쓸 수 없게 한다.
+        """
+        if not records or len(records) < limit:
+            return None
+
+        last = records[-1]
+        if view_id is None:
+            return encode_records_cursor(last.id, None, records_cursor_hash(filters, plan, None))
+
+        sort_key, signature = (
+            db.query(DatabaseViewIndex.sort_key, DatabaseViewIndex.signature)
+            .filter(DatabaseViewIndex.database_id == last.database_id,
+                    DatabaseViewIndex.view_id == view_id,
+                    DatabaseViewIndex.record_id == last.id)
+            .first()
+        ) or (None, None)
+        return encode_records_cursor(
+            last.id, view_id, records_cursor_hash(filters, plan, signature), sort_key
+        )
+
+    def _after_record(self, query, after: str, cursor_hash: str):
+        """id 순서에서 커서 다음 레코드부터"""
+        payload = decode_records_cursor(after, None, cursor_hash)
+        return query.filter(DatabaseRecord.id > payload["id"])
+
+    def _after_sort_key(self, query, after: str, view_id: str, cursor_hash: str):
+        """뷰 인덱스 순서 (sort_key, record_id)에서 커서 다음 레코드부터"""
+        payload = decode_records_cursor(after, view_id, cursor_hash)
+        return query.filter(or_(
+            DatabaseViewIndex.sort_key > payload["k"],
+            and_(DatabaseViewIndex.sort_key == payload["k"],
+                 DatabaseViewIndex.record_id > payload["id"])
+        ))
+
+database = CRUDDatabase(Database)
+database_record = CRUDDatabaseRecord(DatabaseRecord)
\ No newline at end of file
@@ -6,11 +6,13 @@ from .base import CRUDBase
 
 class CRUDPage(CRUDBase[Page, PageCreate, PageUpdate]):
     def get_multi_by_owner(
-        self, db: Session, *, owner_id: int, skip: int = 0, limit: int = 100
+        self, db: Session, *, owner_id: int, skip: int = 0, limit: int = 100,
+        after: Optional[str] = None
     ) -> List[Page]:
         return (
-            db.query(self.model)
+            self.after_id(db.query(self.model), after)
             .filter(Page.owner_id == owner_id)
+            .order_by(Page.id)
             .offset(skip)
             .limit(limit)
             .all()
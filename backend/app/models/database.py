@@ -1,7 +1,8 @@
 # backend/app/models/database.py
-from sqlalchemy import Column, Integer, String, JSON, DateTime, ForeignKey, Table
+from sqlalchemy import Boolean, Column, Integer, String, JSON, DateTime, ForeignKey, Table, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
+from typing import Dict, Iterable, Optional
 from .base import Base
 
 # 데이터베이스와 뷰 설정을 위한 테이블
@@ -19,6 +20,8 @@ class Database(Base):
 
     # 관계 설정
     records = relationship("DatabaseRecord", back_populates="database", cascade="all, delete-orphan")
+    view_indexes = relationship("DatabaseViewIndex", cascade="all, delete-orphan", passive_deletes=True)
+    property_indexes = relationship("DatabasePropertyIndex", cascade="all, delete-orphan", passive_deletes=True)
     page = relationship("Page", back_populates="databases")
 
     def to_dict(self):
@@ -40,26 +43,79 @@ class DatabaseRecord(Base):
     id = Column(Integer, primary_key=True, index=True)
     database_id = Column(Integer, ForeignKey('databases.id'))
     data = Column(JSON)    # 실제 레코드 데이터
+    computed = Column(JSON, nullable=True)  # 저장된 수식/롤업 계산 값
+    computed_version = Column(String(16), nullable=True)  # 계산 값을 만든 설정 버전
+    rollup_state = Column(JSON, nullable=True)  # 롤업별 누적 상태 (증분 갱신용)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # 관계 설정
     database = relationship("Database", back_populates="records")
 
-    def to_dict(self):
+    @property
+    def projected_data(self) -> Optional[Dict]:
+        """fields로 조회할 때 SQL에서 잘라 온 data 일부 (이때 data 컬럼은 읽지 않는다)
+
+        매핑되는 컬럼이 아니므로 인스턴스에만 보관한다.
+        """
+        return self.__dict__.get("_projected_data")
+
+    @projected_data.setter
+    def projected_data(self, value: Optional[Dict]) -> None:
+        self.__dict__["_projected_data"] = value
+
+    def field_data(self, fields: Optional[Iterable[str]] = None) -> Dict:
+        """fields에 해당하는 data (fields가 없으면 읽어 온 data 전체, 값이 없는 필드는 제외)"""
+        data = self.projected_data if self.projected_data is not None else (self.data or {})
+        if fields is None:
+            return data
+        return {name: data[name] for name in fields if data.get(name) is not None}
+
+    def to_dict(self, fields: Optional[Iterable[str]] = None):
+        computed = self.computed
+        if fields is not None and computed:
+            computed = {name: computed[name] for name in fields if name in computed}
         return {
             "id": self.id,
             "database_id": self.database_id,
-            "data": self.data,
+            "data": self.data if fields is None else self.field_data(fields),
+            "computed": computed,
+            "computed_version": self.computed_version,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat()
         }
 
+# 뷰 정렬 순서를 유지하는 보조 인덱스 (정렬된 뷰마다 레코드당 한 행)
+class DatabaseViewIndex(Base):
+    __tablename__ = "database_view_indexes"
+
+    id = Column(Integer, primary_key=True, index=True)
+    database_id = Column(Integer, ForeignKey('databases.id', ondelete="CASCADE"))
+    view_id = Column(String(100))
+    record_id = Column(Integer, ForeignKey('database_records.id', ondelete="CASCADE"), index=True)
+    signature = Column(String(40))  # 인덱스를 만들 때 사용한 정렬 설정의 해시
+    sort_key = Column(String(500))  # 순서를 보존하도록 인코딩한 정렬 키
+
+    __table_args__ = (
+        Index("ix_database_view_indexes_order", "database_id", "view_id", "sort_key", "record_id"),
+    )
+
+# 데이터베이스별로 보조 인덱스가 필요한 프로퍼티 (인덱스 생성/삭제는 백그라운드에서)
+class DatabasePropertyIndex(Base):
+    __tablename__ = "database_property_indexes"
+
+    database_id = Column(Integer, ForeignKey('databases.id', ondelete="CASCADE"), primary_key=True)
+    property_name = Column(String(200), primary_key=True)
+    ready = Column(Boolean, default=False, nullable=False)  # 인덱스가 만들어져서 조회에 쓸 수 있는지
+
 # 관계형 필드를 위한 연결 테이블
 DatabaseRelation = Table(
     'database_relations',
     Base.metadata,
     Column('source_record_id', Integer, ForeignKey('database_records.id')),
     Column('target_record_id', Integer, ForeignKey('database_records.id')),
-    Column('relation_type', String(50))
+    Column('relation_type', String(50)),
+    # 레코드별 관계 조회를 인덱스만으로 처리하는 커버링 인덱스
+    Index('ix_database_relations_source', 'source_record_id', 'relation_type', 'target_record_id'),
+    Index('ix_database_relations_target', 'target_record_id', 'relation_type', 'source_record_id')
 )
\ No newline at end of file
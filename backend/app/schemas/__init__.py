@@ -0,0 +1,8 @@
+from .database import DatabaseRecord, DatabaseRecordCreate, DatabaseRecordUpdate
+from .database import RelationLink, RelationBulkLink, RelationBulkLinkResult
+
+from .database import DatabaseRecordPatch, DatabaseRecordBulk, DatabaseRecordBulkItem, DatabaseRecordBulkResult
+from .database import ViewQueryGroup, ViewQueryResult
+from .database import BoardGroup, BoardResult
+from .database import CalendarResult
+from .database import ViewType, ViewConfig, ViewClone
\ No newline at end of file
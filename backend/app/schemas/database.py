@@ -1,4 +1,5 @@
 # backend/app/schemas/database.py
+from datetime import datetime
 from enum import Enum
 from typing import Optional, Dict, List, Union
 from pydantic import BaseModel
@@ -83,4 +84,123 @@ class PropertyConfig(BaseModel):
     rollup_config: Optional[RollupConfig] = None
 
     # 수식 설정
-    formula_config: Optional[FormulaConfig] = None
\ No newline at end of file
+    formula_config: Optional[FormulaConfig] = None
+
+    # 필터/정렬용 보조 인덱스 생성 여부
+    indexed: bool = False
+
+
+class RelationLink(BaseModel):
+    record_id: int
+    related_ids: List[int]
+
+
+class RelationBulkLink(BaseModel):
+    property_name: str
+    links: List[RelationLink]
+
+
+class RelationBulkLinkResult(BaseModel):
+    created: int
+    deleted: int
+
+
+class DatabaseRecordBase(BaseModel):
+    data: Dict
+
+
+class DatabaseRecordCreate(DatabaseRecordBase):
+    pass
+
+
+class DatabaseRecordUpdate(DatabaseRecordBase):
+    data: Optional[Dict] = None
+
+
+class DatabaseRecord(DatabaseRecordBase):
+    id: int
+    database_id: int
+    computed: Optional[Dict] = None
+    computed_version: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        orm_mode = True
+
+
+class DatabaseRecordPatch(BaseModel):
+    id: int
+    data: Dict
+
+
+class DatabaseRecordBulk(BaseModel):
+    create: List[DatabaseRecordCreate] = []
+    update: List[DatabaseRecordPatch] = []
+    delete: List[int] = []
+
+
+class DatabaseRecordBulkItem(BaseModel):
+    action: str  # create / update / delete
+    index: int  # 요청 목록에서의 위치
+    id: Optional[int] = None
+    success: bool
+    error: Optional[str] = None
+
+
+class DatabaseRecordBulkResult(BaseModel):
+    results: List[DatabaseRecordBulkItem]
+
+
+class ViewQueryGroup(BaseModel):
+    value: Optional[str] = None  # None은 값이 비어 있는 레코드 그룹
+    count: int
+
+
+class ViewQueryResult(BaseModel):
+    records: List[DatabaseRecord]
+    # 첫 페이지(커서 없이 요청)에서만 채워진다
+    total: Optional[int] = None
+    groups: Optional[List[ViewQueryGroup]] = None
+    date_buckets: Optional[Dict[str, int]] = None  # {"YYYY-MM": 레코드 수}
+    next_cursor: Optional[str] = None
+
+
+class BoardGroup(ViewQueryGroup):
+    records: List[DatabaseRecord]  # 뷰 순서상 앞쪽 카드
+    next_cursor: Optional[str] = None  # 그룹의 다음 카드를 읽는 커서
+
+
+class BoardResult(BaseModel):
+    group_by: str
+    groups: List[BoardGroup]
+
+
+class CalendarResult(BaseModel):
+    date_property: str
+    days: Dict[str, List[DatabaseRecord]]  # 날짜(YYYY-MM-DD)별 레코드
+
+
+class ViewType(str, Enum):
+    TABLE = "table"
+    BOARD = "board"
+    CALENDAR = "calendar"
+    GALLERY = "gallery"
+
+
+class ViewConfig(BaseModel):
+    type: ViewType = ViewType.TABLE
+    name: Optional[str] = None
+    filters: Optional[Union[Dict, List[Dict]]] = None
+    sorts: Optional[List[Dict]] = None
+    group_by: Optional[str] = None  # 보드 그룹 프로퍼티
+    date_property: Optional[str] = None  # 캘린더 날짜 프로퍼티
+    properties: Optional[List[str]] = None  # 표시할 프로퍼티 (없으면 전체)
+
+    class Config:
+        extra = "allow"
+
+
+class ViewClone(BaseModel):
+    view_id: str
+    view: ViewConfig
\ No newline at end of file
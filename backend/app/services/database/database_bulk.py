@@ -0,0 +1,51 @@
+# backend/app/services/database_bulk.py
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Set, Tuple, TypeVar
+
+from app.services.database.database_patch import merge_patch
+
+# 일괄 쓰기에서 한 문장에 담는 레코드 수
+BULK_BATCH_SIZE = 1000
+
+T = TypeVar("T")
+
+
+def batched(items: Sequence[T], size: int = BULK_BATCH_SIZE) -> Iterator[Sequence[T]]:
+    """items를 size개씩 나눈 조각 (IN 목록과 다중 INSERT가 너무 길어지지 않도록)"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def plan_updates(
+    current: Dict[int, Dict[str, Any]], updates: Iterable[Any], removing: Set[int]
+) -> Tuple[List[Dict[str, Any]], Dict[int, Dict[str, Any]]]:
+    """수정 항목을 현재 data에 JSON Merge Patch로 병합 (DB에는 쓰지 않음)
+
+    없는 레코드나 같은 요청에서 삭제되는 레코드는 그 항목만 실패로 남긴다.
+    같은 레코드를 여러 번 고치면 순서대로 병합한다. current를 갱신하며
+    (항목별 결과, 레코드 id -> 병합된 data)를 반환한다.
+    """
+    results = []
+    updated = {}
+    for index, patch in enumerate(updates):
+        result = {"action": "update", "index": index, "id": patch.id, "success": False}
+        if patch.id not in current:
+            result["error"] = "Record not found"
+        elif patch.id in removing:
+            result["error"] = "Record is deleted in the same request"
+        else:
+            current[patch.id] = merge_patch(current[patch.id], patch.data)
+            updated[patch.id] = current[patch.id]
+            result["success"] = True
+        results.append(result)
+    return results, updated
+
+
+def delete_results(delete_ids: Iterable[int], deleted: Set[int]) -> List[Dict[str, Any]]:
+    """삭제 항목별 결과 (지우지 못한 id는 실패)"""
+    results = []
+    for index, record_id in enumerate(delete_ids):
+        result = {"action": "delete", "index": index, "id": record_id, "success": record_id in deleted}
+        if record_id not in deleted:
+            result["error"] = "Record not found"
+        results.append(result)
+    return results
@@ -1,61 +1,26 @@
 # backend/app/services/database_compute.py
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Union
 from datetime import datetime
 from statistics import mean
-from app.schemas.database import RollupFunction, FormulaType
-import re
-import operator
-from typing import Callable
+from app.schemas.database import RollupFunction, FormulaType, FormulaConfig
+from app.services.database_formula import compile_formula, evaluate_batch
 
 
 class FormulaEvaluator:
-    def __init__(self):
-        self.operators = {
-            '+': operator.add,
-            '-': operator.sub,
-            '*': operator.mul,
-            '/': operator.truediv,
-            '>': operator.gt,
-            '<': operator.lt,
-            '>=': operator.ge,
-            '<=': operator.le,
-            '==': operator.eq,
-            '!=': operator.ne,
-        }
-
-        self.functions = {
-            'now': lambda: datetime.now(),
-            'today': lambda: datetime.now().date(),
-            'if': lambda condition, true_val, false_val: true_val if condition else false_val,
-            'concat': lambda *args: ''.join(str(arg) for arg in args),
-            'length': len,
-            'round': round,
-            'abs': abs,
-        }
-
     def evaluate(self, formula: str, record_data: Dict[str, Any]) -> Any:
-        # 프로퍼티 참조 처리 (예: prop("필드명"))
-        formula = self._replace_property_references(formula, record_data)
+        # 수식은 텍스트 기준으로 한 번만 파싱하고, 이후에는 캐시된 함수를 재사용
+        compiled = compile_formula(formula)
 
         try:
-            # 파이썬 eval로 수식 계산 (보안상 제한된 환경에서 실행)
-            return eval(formula, {"__builtins__": {}}, {
-                **self.operators,
-                **self.functions
-            })
+            return compiled(record_data)
         except Exception as e:
             print(f"Formula evaluation error: {e}")
             return None
 
-    def _replace_property_references(self, formula: str, record_data: Dict[str, Any]) -> str:
-        """프로퍼티 참조를 실제 값으로 대체"""
-        pattern = r'prop\("([^"]*)"\)'
-
-        def replacer(match):
-            field_name = match.group(1)
-            return repr(record_data.get(field_name))
-
-        return re.sub(pattern, replacer, formula)
+    @staticmethod
+    def cache_info():
+        """수식 캐시 적중/실패 횟수 반환"""
+        return compile_formula.cache_info()
 
 
 class RollupCalculator:
@@ -103,6 +68,27 @@ class DatabaseCompute:
         )
         return self._convert_formula_result(result, formula_config["output_type"])
 
+    async def compute_formula_batch(self,
+                                    formula_config: Union[FormulaConfig, Dict],
+                                    records_data: List[Dict]) -> List[Any]:
+        """레코드 집합 전체의 수식 프로퍼티를 한 번에 계산"""
+        if isinstance(formula_config, dict):
+            formula_config = FormulaConfig(**formula_config)
+
+        expression = formula_config.expression
+        output_type = formula_config.output_type
+
+        def evaluate_row(record_data: Dict) -> Any:
+            return self.formula_evaluator.evaluate(expression, record_data)
+
+        # 벡터 계산 결과는 float이므로 숫자/불리언 출력일 때만 사용
+        if output_type in (FormulaType.NUMBER, FormulaType.BOOLEAN):
+            results = evaluate_batch(compile_formula(expression), records_data, evaluate_row)
+        else:
+            results = [evaluate_row(record_data or {}) for record_data in records_data]
+
+        return [self._convert_formula_result(result, output_type) for result in results]
+
     async def compute_rollup(self,
                              rollup_config: Dict,
                              related_records: List[Dict],
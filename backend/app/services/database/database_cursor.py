@@ -0,0 +1,38 @@
+# backend/app/services/database_cursor.py
+from typing import Any, Dict, Optional
+
+from app.core.cursor import encode_cursor, decode_cursor
+from app.services.database.database_filter import filter_hash, normalize_filters
+from app.services.database.database_view_plan import ViewPlan
+
+
+def records_cursor_hash(filters: Optional[Any], plan: Optional[ViewPlan], signature: Optional[str]) -> str:
+    """커서를 만든 조회의 필터, 뷰 필터, 정렬(뷰 인덱스 서명) 해시"""
+    return filter_hash({
+        "filters": normalize_filters(filters),
+        "view_filters": plan.filters if plan is not None else None,
+        "sorts": signature,
+    })[:16]
+
+
+def encode_records_cursor(record_id: int, view_id: Optional[str], cursor_hash: str,
+                          sort_key: Optional[str] = None) -> str:
+    """페이지 마지막 레코드 다음부터 읽는 커서 (뷰 순서면 뷰 인덱스 정렬 키 포함)"""
+    payload = {"v": view_id, "h": cursor_hash, "id": record_id}
+    if view_id is not None:
+        payload["k"] = sort_key
+    return encode_cursor(payload)
+
+
+def decode_records_cursor(after: str, view_id: Optional[str], cursor_hash: str) -> Dict[str, Any]:
+    """encode_records_cursor로 만든 커서를 읽음
+
+    다른 뷰이거나 필터/정렬이 다른 조회에서 만든 커서는 ValueError
+    """
+    payload = decode_cursor(after)
+    if (payload.get("v") != view_id or payload.get("h") != cursor_hash
+            or not isinstance(payload.get("id"), int)):
+        raise ValueError("Invalid cursor")
+    if view_id is not None and not isinstance(payload.get("k"), str):
+        raise ValueError("Invalid cursor")
+    return payload
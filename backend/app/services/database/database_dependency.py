@@ -0,0 +1,633 @@
+# backend/app/services/database_dependency.py
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from collections import defaultdict
+from datetime import date, datetime
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.models.database import Database, DatabaseRecord, DatabaseRelation
+from app.schemas.database import PropertyType, FormulaConfig, RollupConfig
+from app.services.database.database_compute import DatabaseCompute, RollupCalculator
+from app.services.database.database_filter import filter_hash
+from app.services.database.database_schema import parse_database_id, schema_properties
+from app.services.database_formula import compile_formula
+from app.services.database_relations import LinkChanges
+from app.services.database_rollup import RollupState
+
+# (데이터베이스 id, 프로퍼티명)
+Node = Tuple[int, str]
+
+# 프로퍼티 값이 바뀐 레코드와 바뀌기 전 값 {노드: {레코드 id: 이전 값}}
+Changes = Dict[Node, Dict[int, Any]]
+
+# 바뀌기 전 값을 모름 (이 값을 읽는 롤업은 누적 상태 대신 다시 계산한다)
+UNKNOWN = object()
+
+# 캐시에 두는 워크스페이스 의존 그래프 수
+WORKSPACE_GRAPH_CACHE_SIZE = 64
+
+# 워크스페이스별 의존 그래프 캐시 {(owner_id, 데이터베이스별 updated_at): 그래프}
+_workspace_graphs = LRUCache(WORKSPACE_GRAPH_CACHE_SIZE)
+
+# 설정 변경 후 다시 계산할 때 한 번에 읽는 레코드 수
+REFRESH_BATCH_SIZE = 1000
+
+
+class CircularDependencyError(ValueError):
+    """프로퍼티 의존 관계에 순환이 있을 때"""
+
+    def __init__(self, cycle: List[Node]):
+        self.cycle = cycle
+        path = " -> ".join(f"{database_id}.{name}" for database_id, name in cycle)
+        super().__init__(f"Circular property dependency: {path}")
+
+
+def _computed_configs(schema: Optional[Dict]) -> Dict[str, Dict]:
+    return {
+        property_name: config
+        for property_name, config in schema_properties(schema).items()
+        if config.get("type") in (PropertyType.FORMULA, PropertyType.ROLLUP)
+    }
+
+
+def computed_version(schema: Optional[Dict]) -> str:
+    """계산 프로퍼티(수식/롤업) 설정의 해시. 레코드에 저장된 계산 값의 버전 표시로 사용"""
+    return filter_hash(_computed_configs(schema))[:16]
+
+
+def changed_computed_properties(old_schema: Optional[Dict], new_schema: Optional[Dict]) -> Set[str]:
+    """설정이 추가/변경/삭제된 계산 프로퍼티"""
+    old, new = _computed_configs(old_schema), _computed_configs(new_schema)
+    return {property_name for property_name in set(old) | set(new) if old.get(property_name) != new.get(property_name)}
+
+
+def record_values(record: DatabaseRecord) -> Dict[str, Any]:
+    """수식 계산에 쓰이는 레코드 값 (입력 데이터 + 저장된 계산 값)"""
+    return {**(record.data or {}), **(record.computed or {})}
+
+
+def rollup_fingerprint(config: RollupConfig, target_database_id: Optional[int]) -> str:
+    """롤업 누적 상태를 만든 설정 표시 (설정이 바뀌면 상태를 버리고 다시 계산)"""
+    return filter_hash([
+        config.relation_property_id, target_database_id, config.target_property_id, config.function
+    ])[:8]
+
+
+class DependencyGraph:
+    """워크스페이스의 수식/롤업/관계 프로퍼티 의존 그래프
+
+    간선은 (의존 대상 -> 의존하는 프로퍼티) 방향이다. 수식은 prop()으로 읽는
+    프로퍼티에, 롤업은 같은 데이터베이스의 관계 프로퍼티와 관계 대상 데이터베이스의
+    대상 프로퍼티에 의존한다. 만들 때 위상 순서를 계산하므로 순환은 바로 드러난다.
+    """
+
+    def __init__(self, schemas: Dict[int, Optional[Dict]]):
+        self.formulas: Dict[Node, FormulaConfig] = {}
+        # 롤업 노드 -> (롤업 설정, 관계 대상 데이터베이스 id)
+        self.rollups: Dict[Node, Tuple[RollupConfig, Optional[int]]] = {}
+        self.dependents: Dict[Node, Set[Node]] = defaultdict(set)
+        # 계산 프로퍼티 -> 읽는 프로퍼티
+        self.inputs: Dict[Node, List[Node]] = {}
+        # 데이터베이스별 계산 프로퍼티 설정 버전
+        self.versions: Dict[int, str] = {}
+
+        for database_id, schema in schemas.items():
+            self.versions[database_id] = computed_version(schema)
+            properties = schema_properties(schema)
+            for property_name, config in properties.items():
+                node = (database_id, property_name)
+                if config.get("type") == PropertyType.FORMULA and config.get("formula_config"):
+                    self._add_formula(node, FormulaConfig(**config["formula_config"]))
+                elif config.get("type") == PropertyType.ROLLUP and config.get("rollup_config"):
+                    self._add_rollup(node, RollupConfig(**config["rollup_config"]), properties)
+
+        self.order = self._topological_order()
+        self.rank = {node: index for index, node in enumerate(self.order)}
+        # 같은 단계의 노드끼리는 서로 의존하지 않으므로 한 번에 계산할 수 있다
+        self.level: Dict[Node, int] = defaultdict(int)
+        for node in self.order:
+            for dependent in self.dependents.get(node, ()):
+                self.level[dependent] = max(self.level[dependent], self.level[node] + 1)
+
+    @classmethod
+    def from_databases(cls, databases: Iterable[Database]) -> "DependencyGraph":
+        return cls({database.id: database.schema for database in databases})
+
+    def affected(self, database_id: int, properties: Iterable[str]) -> List[Node]:
+        """바뀐 프로퍼티들에 전이적으로 의존하는 계산 프로퍼티 (위상 순서)"""
+        return self.affected_nodes((database_id, property_name) for property_name in properties)
+
+    def affected_nodes(self, nodes: Iterable[Node]) -> List[Node]:
+        """바뀐 노드들에 전이적으로 의존하는 계산 프로퍼티 (위상 순서)"""
+        pending = list(nodes)
+        seen: Set[Node] = set()
+        while pending:
+            for dependent in self.dependents.get(pending.pop(), ()):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    pending.append(dependent)
+        return sorted(seen, key=self.rank.__getitem__)
+
+    def levels(self, nodes: Iterable[Node]) -> List[List[Node]]:
+        """노드들을 단계별로 묶는다 (앞 단계부터, 단계 안에서는 위상 순서)"""
+        grouped: Dict[int, List[Node]] = defaultdict(list)
+        for node in sorted(nodes, key=self.rank.__getitem__):
+            grouped[self.level[node]].append(node)
+        return [grouped[level] for level in sorted(grouped)]
+
+    def _add_formula(self, node: Node, config: FormulaConfig) -> None:
+        self.formulas[node] = config
+        self.inputs[node] = [(node[0], property_name) for property_name in compile_formula(config.expression).properties]
+        for input_node in self.inputs[node]:
+            self.dependents[input_node].add(node)
+
+    def _add_rollup(self, node: Node, config: RollupConfig, properties: Dict[str, Dict]) -> None:
+        relation = properties.get(config.relation_property_id) or {}
+        target_database_id = parse_database_id((relation.get("relation_config") or {}).get("database_id"))
+
+        self.rollups[node] = (config, target_database_id)
+        self.inputs[node] = [(node[0], config.relation_property_id)]
+        if target_database_id is not None:
+            self.inputs[node].append((target_database_id, config.target_property_id))
+        for input_node in self.inputs[node]:
+            self.dependents[input_node].add(node)
+
+    def _topological_order(self) -> List[Node]:
+        """계산 프로퍼티의 위상 순서 (순환이 있으면 CircularDependencyError)"""
+        order: List[Node] = []
+        state: Dict[Node, int] = {}  # 1: 방문 중, 2: 완료
+        path: List[Node] = []
+
+        def visit(node: Node) -> None:
+            state[node] = 1
+            path.append(node)
+            for dependent in self.dependents.get(node, ()):
+                if state.get(dependent) == 1:
+                    raise CircularDependencyError(path[path.index(dependent):] + [dependent])
+                if dependent not in state:
+                    visit(dependent)
+            path.pop()
+            state[node] = 2
+            order.append(node)
+
+        for node in list(self.dependents):
+            if node not in state:
+                visit(node)
+
+        order.reverse()
+        return [node for node in order if node in self.formulas or node in self.rollups]
+
+
+def workspace_graph(db: Session, owner_id: Any) -> DependencyGraph:
+    """소유자의 데이터베이스 전체로 만든 의존 그래프 (스키마가 바뀔 때까지 캐시)"""
+    versions = tuple(
+        db.query(Database.id, Database.updated_at)
+        .filter(Database.owner_id == owner_id)
+        .order_by(Database.id)
+    )
+    key = (owner_id, versions)
+    cached = _workspace_graphs.get(key)
+    if cached is not None:
+        return cached
+
+    schemas = dict(
+        db.query(Database.id, Database.schema).filter(Database.owner_id == owner_id)
+    )
+    graph = DependencyGraph(schemas)
+    # 같은 소유자의 이전 버전 그래프는 다시 쓰이지 않으므로 바로 버린다
+    _workspace_graphs.discard(lambda cached_key: cached_key[0] == owner_id)
+    _workspace_graphs.set(key, graph)
+    return graph
+
+
+class DependencyRecompute:
+    """계산 프로퍼티 값을 레코드의 computed 컬럼에 저장하고 최신으로 유지
+
+    쓰기 후에는 값이 바뀐 프로퍼티에 의존하는 계산 프로퍼티만 의존 단계 순서대로
+    다시 계산한다. 롤업은 레코드의 rollup_state에 누적 상태(개수/합계/극값)를 두고,
+    관련 레코드 값이나 연결이 바뀌면 바뀐 값만큼 상태를 갱신한다. 상태가 없거나
+    갱신할 수 없으면 (마지막 극값 제거 등) 관련 레코드 전체로 다시 계산한다.
+    한 단계의 롤업은 연결 조회, 관련 레코드 값 조회, 다시 계산이 각각 쿼리 한 번이다.
+
+    계산 프로퍼티 설정이 바뀌면 refresh_configuration으로 (요청 밖의 작업에서)
+    데이터베이스 전체를 다시 계산한다. 그 전에 읽힌 레코드는 computed_version이
+    데이터베이스의 현재 설정 버전과 다르므로 그 레코드만 바로 다시 계산한다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.compute = DatabaseCompute()
+
+    async def run(self,
+                  graph: DependencyGraph,
+                  database_id: int,
+                  record_ids: Iterable[int],
+                  properties: Iterable[str],
+                  previous: Optional[Dict[int, Dict[str, Any]]] = None) -> List[DatabaseRecord]:
+        """바뀐 레코드/프로퍼티에서 시작해 다시 계산하고, 값이 바뀐 레코드 목록을 반환
+
+        previous는 바뀌기 전 레코드 값 {레코드 id: record_values}이다. 있으면 이
+        레코드들을 읽는 롤업을 누적 상태로 갱신한다.
+        """
+        changed = await self.update(graph, database_id, record_ids, properties, previous)
+        self.db.commit()
+        return changed
+
+    async def update(self,
+                     graph: DependencyGraph,
+                     database_id: int,
+                     record_ids: Iterable[int],
+                     properties: Iterable[str],
+                     previous: Optional[Dict[int, Dict[str, Any]]] = None) -> List[DatabaseRecord]:
+        """run과 같지만 커밋은 호출한 쪽에서"""
+        previous = previous or {}
+        record_ids = list(record_ids)
+        changes: Changes = {
+            (database_id, property_name): {
+                record_id: previous[record_id].get(property_name) if record_id in previous else UNKNOWN
+                for record_id in record_ids
+            }
+            for property_name in properties
+        }
+        return await self._propagate(graph, changes, LinkChanges())
+
+    async def run_links(self, graph: DependencyGraph, links: LinkChanges) -> List[DatabaseRecord]:
+        """관계 연결이 바뀐 레코드에서 시작해 그 관계를 읽는 롤업과 의존하는 값을 다시 계산"""
+        changed = await self.update_links(graph, links)
+        self.db.commit()
+        return changed
+
+    async def update_links(self, graph: DependencyGraph, links: LinkChanges) -> List[DatabaseRecord]:
+        """run_links와 같지만 커밋은 호출한 쪽에서"""
+        changes: Changes = {
+            node: dict.fromkeys(sources, UNKNOWN)
+            for node, sources in links.sources.items() if sources
+        }
+        return await self._propagate(graph, changes, links)
+
+    async def _propagate(self, graph: DependencyGraph, changes: Changes, links: LinkChanges) -> List[DatabaseRecord]:
+        nodes = graph.affected_nodes(changes)
+        if not nodes:
+            return []
+
+        records: Dict[int, DatabaseRecord] = {}
+        changed: Dict[int, DatabaseRecord] = {}
+        for level in graph.levels(nodes):
+            await self._compute_level(graph, level, changes, links, records, changed)
+        return list(changed.values())
+
+    async def refresh_stale(self,
+                            graph: DependencyGraph,
+                            database_id: int,
+                            records: List[DatabaseRecord]) -> List[DatabaseRecord]:
+        """계산 값 버전이 현재 설정과 다른 레코드의 계산 프로퍼티를 모두 다시 계산"""
+        refreshed = await self.refresh_records(graph, database_id, records)
+        self.db.commit()
+        return refreshed
+
+    async def refresh_records(self,
+                              graph: DependencyGraph,
+                              database_id: int,
+                              records: List[DatabaseRecord]) -> List[DatabaseRecord]:
+        """refresh_stale과 같지만 커밋은 호출한 쪽에서"""
+        version = graph.versions.get(database_id)
+        stale = {record.id: record for record in records if record.computed_version != version}
+        if not stale:
+            return []
+
+        changed: Dict[int, DatabaseRecord] = {}
+        nodes = [node for node in graph.order if node[0] == database_id]
+        for level in graph.levels(nodes):
+            await self._compute_level(graph, level, {}, LinkChanges(), stale, changed,
+                                      full={database_id: set(stale)})
+
+        computed_names = {name for node_database_id, name in graph.order if node_database_id == database_id}
+        for record in stale.values():
+            # 설정에서 빠진 계산 프로퍼티의 값과 누적 상태는 버린다
+            computed = {
+                name: value for name, value in (record.computed or {}).items()
+                if name in computed_names
+            }
+            if computed != (record.computed or {}):
+                record.computed = computed
+            rollup_state = {
+                name: state for name, state in (record.rollup_state or {}).items()
+                if name in computed_names
+            }
+            if rollup_state != (record.rollup_state or {}):
+                record.rollup_state = rollup_state or None
+            record.computed_version = version
+        return list(stale.values())
+
+    async def refresh_configuration(self,
+                                    graph: DependencyGraph,
+                                    database_id: int,
+                                    properties: Iterable[str]) -> None:
+        """계산 프로퍼티(properties) 설정이 바뀐 뒤 계산 값을 모두 다시 계산 (배치마다 커밋)
+
+        데이터베이스의 오래된 레코드와, 바뀐 프로퍼티를 (롤업으로) 읽는 다른
+        데이터베이스의 계산 프로퍼티를 다시 계산한다.
+        """
+        await self.refresh_database(graph, database_id)
+
+        nodes = [node for node in graph.affected(database_id, properties) if node[0] != database_id]
+        for level in graph.levels(nodes):
+            by_database: Dict[int, List[Node]] = defaultdict(list)
+            for node in level:
+                by_database[node[0]].append(node)
+            for node_database_id, database_nodes in by_database.items():
+                last_id = 0
+                while True:
+                    batch = (
+                        self.db.query(DatabaseRecord)
+                        .filter(DatabaseRecord.database_id == node_database_id, DatabaseRecord.id > last_id)
+                        .order_by(DatabaseRecord.id)
+                        .limit(REFRESH_BATCH_SIZE)
+                        .all()
+                    )
+                    if not batch:
+                        break
+                    last_id = batch[-1].id
+                    records = {record.id: record for record in batch}
+                    await self._compute_level(graph, database_nodes, {}, LinkChanges(), records, {},
+                                              full={node_database_id: set(records)})
+                    self.db.commit()
+
+    async def refresh_database(self, graph: DependencyGraph, database_id: int) -> None:
+        """데이터베이스에서 계산 값 버전이 오래된 레코드를 모두 다시 계산 (배치마다 커밋)"""
+        version = graph.versions.get(database_id)
+        if version is None:
+            return
+
+        last_id = 0
+        while True:
+            batch = (
+                self.db.query(DatabaseRecord)
+                .filter(DatabaseRecord.database_id == database_id,
+                        DatabaseRecord.id > last_id,
+                        or_(DatabaseRecord.computed_version.is_(None),
+                            DatabaseRecord.computed_version != version))
+                .order_by(DatabaseRecord.id)
+                .limit(REFRESH_BATCH_SIZE)
+                .all()
+            )
+            if not batch:
+                break
+            last_id = batch[-1].id
+            await self.refresh_stale(graph, database_id, batch)
+
+    async def _compute_level(self,
+                             graph: DependencyGraph,
+                             nodes: List[Node],
+                             changes: Changes,
+                             links: LinkChanges,
+                             records: Dict[int, DatabaseRecord],
+                             changed: Dict[int, DatabaseRecord],
+                             full: Optional[Dict[int, Set[int]]] = None) -> None:
+        """한 단계의 계산 프로퍼티들을 다시 계산해서 computed(와 rollup_state)에 반영
+
+        full({데이터베이스 id: 레코드 id})을 주면 그 레코드들을 누적 상태 없이 모두 다시
+        계산하고, 없으면 changes에서 입력 값이 바뀐 레코드만 계산한다.
+        바뀐 값은 다음 단계를 위해 changes에 기록한다.
+        """
+        values: Dict[Node, Dict[int, Any]] = defaultdict(dict)
+        states: Dict[Node, Dict[int, Optional[Dict[str, Any]]]] = defaultdict(dict)
+
+        rollups = [node for node in nodes if node in graph.rollups]
+        if rollups:
+            self.db.flush()  # 앞 단계에서 바뀐 관련 레코드 값을 반영한 뒤 조회
+            if full is None:
+                recompute = self._rollup_deltas(graph, rollups, changes, links, records, values, states)
+            else:
+                recompute = {node: full.get(node[0], set()) for node in rollups}
+            self._rollup_values(graph, recompute, values, states)
+
+        formulas = {}
+        for node in nodes:
+            if node in graph.formulas:
+                if full is None:
+                    record_ids = set()
+                    for input_node in graph.inputs[node]:
+                        record_ids.update(changes.get(input_node, ()))
+                else:
+                    record_ids = full.get(node[0], set())
+                if record_ids:
+                    formulas[node] = sorted(record_ids)
+        self._load(records, {record_id for record_ids in formulas.values() for record_id in record_ids})
+        for node, record_ids in formulas.items():
+            values[node] = dict(zip(record_ids, await self.compute.compute_formula_batch(
+                graph.formulas[node], [record_values(records[record_id]) for record_id in record_ids]
+            )))
+
+        for node, node_values in values.items():
+            property_name = node[1]
+            for record_id, value in node_values.items():
+                record = records[record_id]
+                value = _json_value(value)
+                computed = record.computed or {}
+                if property_name not in computed or computed[property_name] != value:
+                    changes.setdefault(node, {})[record_id] = record_values(record).get(property_name)
+                    record.computed = {**computed, property_name: value}
+                    changed[record_id] = record
+
+        for (_, property_name), node_states in states.items():
+            for record_id, state in node_states.items():
+                record = records[record_id]
+                rollup_state = dict(record.rollup_state or {})
+                if state is None:
+                    rollup_state.pop(property_name, None)
+                else:
+                    rollup_state[property_name] = state
+                if rollup_state != (record.rollup_state or {}):
+                    record.rollup_state = rollup_state or None
+
+    def _load(self, records: Dict[int, DatabaseRecord], record_ids: Iterable[int]) -> None:
+        missing = [record_id for record_id in record_ids if record_id not in records]
+        if missing:
+            for record in self.db.query(DatabaseRecord).filter(DatabaseRecord.id.in_(missing)):
+                records[record.id] = record
+
+    def _rollup_deltas(self,
+                       graph: DependencyGraph,
+                       nodes: List[Node],
+                       changes: Changes,
+                       links: LinkChanges,
+                       records: Dict[int, DatabaseRecord],
+                       values: Dict[Node, Dict[int, Any]],
+                       states: Dict[Node, Dict[int, Optional[Dict[str, Any]]]]) -> Dict[Node, Set[int]]:
+        """롤업 노드들을 누적 상태로 갱신하고, 다시 계산해야 하는 레코드를 노드별로 반환
+
+        원본 레코드마다 제거된 연결과 값이 바뀐 관련 레코드의 이전 값을 빼고,
+        추가된 연결과 값이 바뀐 관련 레코드의 현재 값을 더한다.
+        """
+        current = self._changed_links(graph, nodes, changes)
+
+        sources: Dict[Node, Set[int]] = {}
+        related_ids: Set[int] = set()
+        for node in nodes:
+            config = graph.rollups[node][0]
+            relation_node = (node[0], config.relation_property_id)
+            sources[node] = set(current[node]) | set(changes.get(relation_node, ()))
+            for targets in current[node].values():
+                related_ids.update(targets)
+            for change in links.sources.get(relation_node, {}).values():
+                if change is not None:
+                    related_ids.update(change[0])
+                    related_ids.update(change[1])
+        related = self._values(related_ids)
+        self._load(records, {record_id for node_sources in sources.values() for record_id in node_sources})
+
+        recompute: Dict[Node, Set[int]] = defaultdict(set)
+        for node in nodes:
+            config, target_database_id = graph.rollups[node]
+            fingerprint = rollup_fingerprint(config, target_database_id)
+            target_property = config.target_property_id
+            target_changes = changes.get((target_database_id, target_property), {})
+            relation_changes = changes.get((node[0], config.relation_property_id), {})
+            link_changes = links.sources.get((node[0], config.relation_property_id), {})
+
+            def old_value(related_id: int) -> Any:
+                if related_id in target_changes:
+                    return target_changes[related_id]
+                if related_id in links.removed_values:
+                    return links.removed_values[related_id].get(target_property)
+                if related_id in related:
+                    return related[related_id].get(target_property)
+                return UNKNOWN
+
+            for source_id in sources[node]:
+                removed: List[Any] = []
+                added: List[Any] = []
+                added_ids: Set[int] = set()
+                known = True
+                if source_id in relation_changes:
+                    change = link_changes.get(source_id)
+                    if change is None:
+                        known = False
+                    else:
+                        added_ids, removed_ids = change
+                        removed += [old_value(related_id) for related_id in removed_ids]
+                        known = all(related_id in related for related_id in added_ids)
+                        added += [related[related_id].get(target_property) for related_id in added_ids if known]
+                for related_id in current[node].get(source_id, ()):
+                    if related_id not in added_ids:
+                        known = known and related_id in related
+                        removed.append(target_changes[related_id])
+                        added.append(related.get(related_id, {}).get(target_property))
+
+                state = (records[source_id].rollup_state or {}).get(node[1])
+                known = known and not any(value is UNKNOWN for value in removed)
+                if known and state and state.get("config") == fingerprint:
+                    state = RollupState.apply(state, config.function, removed=removed, added=added)
+                    if state is not None:
+                        values[node][source_id] = RollupState.value(state, config.function)
+                        states[node][source_id] = state
+                        continue
+                recompute[node].add(source_id)
+        return recompute
+
+    def _changed_links(self,
+                       graph: DependencyGraph,
+                       nodes: List[Node],
+                       changes: Changes) -> Dict[Node, Dict[int, Set[int]]]:
+        """롤업 노드별로 값이 바뀐 관련 레코드를 지금 참조하는 연결 {노드: {원본 id: 관련 레코드 id}}
+
+        단계의 모든 롤업을 쿼리 한 번으로 찾는다. 관계 프로퍼티 이름은 데이터베이스마다
+        겹칠 수 있으므로 참조하는 레코드의 데이터베이스까지 맞춰 본다.
+        """
+        current: Dict[Node, Dict[int, Set[int]]] = {node: defaultdict(set) for node in nodes}
+        relations: Dict[Tuple[int, str], Set[int]] = defaultdict(set)
+        for node in nodes:
+            config, target_database_id = graph.rollups[node]
+            relations[(node[0], config.relation_property_id)].update(
+                changes.get((target_database_id, config.target_property_id), ())
+            )
+        relations = {relation: target_ids for relation, target_ids in relations.items() if target_ids}
+        if not relations:
+            return current
+
+        columns = DatabaseRelation.c
+        source = DatabaseRecord.__table__
+        conditions = [
+            and_(columns.relation_type == relation_property,
+                 columns.target_record_id.in_(sorted(target_ids)),
+                 source.c.database_id == database_id)
+            for (database_id, relation_property), target_ids in sorted(relations.items())
+        ]
+        found: Dict[Tuple[int, str], List[Tuple[int, int]]] = defaultdict(list)
+        for database_id, relation_type, source_id, target_id in self.db.execute(
+            select([source.c.database_id, columns.relation_type,
+                    columns.source_record_id, columns.target_record_id])
+            .select_from(DatabaseRelation.join(source, source.c.id == columns.source_record_id))
+            .where(or_(*conditions))
+        ):
+            found[(database_id, relation_type)].append((source_id, target_id))
+
+        for node in nodes:
+            config, target_database_id = graph.rollups[node]
+            target_changes = changes.get((target_database_id, config.target_property_id), {})
+            for source_id, target_id in found.get((node[0], config.relation_property_id), ()):
+                if target_id in target_changes:
+                    current[node][source_id].add(target_id)
+        return current
+
+    def _values(self, record_ids: Set[int]) -> Dict[int, Dict[str, Any]]:
+        """레코드별 현재 값 (record_values)"""
+        if not record_ids:
+            return {}
+        table = DatabaseRecord.__table__
+        return {
+            record_id: {**(data or {}), **(computed or {})}
+            for record_id, data, computed in self.db.execute(
+                select([table.c.id, table.c.data, table.c.computed]).where(table.c.id.in_(sorted(record_ids)))
+            )
+        }
+
+    def _rollup_values(self,
+                       graph: DependencyGraph,
+                       recompute: Dict[Node, Set[int]],
+                       values: Dict[Node, Dict[int, Any]],
+                       states: Dict[Node, Dict[int, Optional[Dict[str, Any]]]]) -> None:
+        """롤업 노드별 레코드들의 값과 누적 상태를 관련 레코드 전체로 계산 (쿼리 한 번)"""
+        record_ids: Dict[Tuple[int, str], Set[int]] = defaultdict(set)
+        for node, node_record_ids in recompute.items():
+            record_ids[(node[0], graph.rollups[node][0].relation_property_id)].update(node_record_ids)
+        record_ids = {relation: ids for relation, ids in record_ids.items() if ids}
+        if not record_ids:
+            return
+
+        columns = DatabaseRelation.c
+        target = DatabaseRecord.__table__
+        conditions = [
+            and_(columns.source_record_id.in_(sorted(ids)),
+                 columns.relation_type == relation_property)
+            for (_, relation_property), ids in sorted(record_ids.items())
+        ]
+        # (레코드 id, 관계 프로퍼티) -> 관련 레코드 값들
+        related: Dict[Tuple[int, str], List[Dict[str, Any]]] = defaultdict(list)
+        for source_id, relation_type, data, computed in self.db.execute(
+            select([columns.source_record_id, columns.relation_type, target.c.data, target.c.computed])
+            .select_from(DatabaseRelation.join(target, target.c.id == columns.target_record_id))
+            .where(or_(*conditions))
+        ):
+            related[(source_id, relation_type)].append({**(data or {}), **(computed or {})})
+
+        for node, node_record_ids in recompute.items():
+            config, target_database_id = graph.rollups[node]
+            fingerprint = rollup_fingerprint(config, target_database_id)
+            for record_id in node_record_ids:
+                related_values = [
+                    related_record.get(config.target_property_id)
+                    for related_record in related.get((record_id, config.relation_property_id), ())
+                ]
+                values[node][record_id] = RollupCalculator.calculate(related_values, config.function)
+                state = RollupState.build(related_values, config.function)
+                states[node][record_id] = {**state, "config": fingerprint} if state else None
+
+
+def _json_value(value: Any) -> Any:
+    """JSON 컬럼에 저장할 수 있는 값으로 변환"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
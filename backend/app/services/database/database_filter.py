@@ -1,7 +1,9 @@
 # backend/app/services/database_filter.py
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional
 from datetime import datetime
 from enum import Enum
+import hashlib
+import json
 
 
 class FilterOperator(str, Enum):
@@ -27,24 +29,42 @@ class FilterGroup(str, Enum):
     OR = "or"
 
 
+def normalize_filters(filters: Any) -> Optional[Dict]:
+    """쿼리 파라미터로 받은 필터(조건 목록, 단일 조건, 그룹)를 필터 그룹 형태로 변환"""
+    if not filters:
+        return None
+    if isinstance(filters, list):
+        return {"type": FilterGroup.AND, "conditions": filters}
+    if "conditions" not in filters:
+        return {"type": FilterGroup.AND, "conditions": [filters]}
+    return filters
+
+
+def filter_hash(filters: Any) -> str:
+    """필터 설정(JSON)의 해시값"""
+    encoded = json.dumps(filters, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
 class DatabaseFilter:
     def __init__(self):
-        self.operators = {
-            FilterOperator.EQUALS: lambda x, y: x == y,
-            FilterOperator.NOT_EQUALS: lambda x, y: x != y,
-            FilterOperator.CONTAINS: lambda x, y: str(y).lower() in str(x).lower(),
-            FilterOperator.DOES_NOT_CONTAIN: lambda x, y: str(y).lower() not in str(x).lower(),
-            FilterOperator.STARTS_WITH: lambda x, y: str(x).lower().startswith(str(y).lower()),
-            FilterOperator.ENDS_WITH: lambda x, y: str(x).lower().endswith(str(y).lower()),
-            FilterOperator.GREATER_THAN: lambda x, y: x > y,
-            FilterOperator.LESS_THAN: lambda x, y: x < y,
-            FilterOperator.GREATER_THAN_EQUAL: lambda x, y: x >= y,
-            FilterOperator.LESS_THAN_EQUAL: lambda x, y: x <= y,
-            FilterOperator.BETWEEN: lambda x, y: y[0] <= x <= y[1],
-            FilterOperator.IS_EMPTY: lambda x, y: x is None or x == "",
-            FilterOperator.IS_NOT_EMPTY: lambda x, y: x is not None and x != "",
-            FilterOperator.IN: lambda x, y: x in y,
-            FilterOperator.NOT_IN: lambda x, y: x not in y,
+        # 연산자별로 필터 값을 미리 받아 단항 조건 함수를 만드는 팩토리
+        self.predicate_factories = {
+            FilterOperator.EQUALS: lambda y: lambda x: x == y,
+            FilterOperator.NOT_EQUALS: lambda y: lambda x: x != y,
+            FilterOperator.CONTAINS: self._contains,
+            FilterOperator.DOES_NOT_CONTAIN: self._does_not_contain,
+            FilterOperator.STARTS_WITH: self._starts_with,
+            FilterOperator.ENDS_WITH: self._ends_with,
+            FilterOperator.GREATER_THAN: lambda y: lambda x: x > y,
+            FilterOperator.LESS_THAN: lambda y: lambda x: x < y,
+            FilterOperator.GREATER_THAN_EQUAL: lambda y: lambda x: x >= y,
+            FilterOperator.LESS_THAN_EQUAL: lambda y: lambda x: x <= y,
+            FilterOperator.BETWEEN: self._between,
+            FilterOperator.IS_EMPTY: lambda y: lambda x: x is None or x == "",
+            FilterOperator.IS_NOT_EMPTY: lambda y: lambda x: x is not None and x != "",
+            FilterOperator.IN: lambda y: lambda x: x in y,
+            FilterOperator.NOT_IN: lambda y: lambda x: x not in y,
         }
 
     def apply_filters(self, records: List[Dict], filters: Dict) -> List[Dict]:
@@ -52,50 +72,98 @@ class DatabaseFilter:
         if not filters:
             return records
 
-        filtered_records = []
-        for record in records:
-            if self._evaluate_filter_group(record, filters):
-                filtered_records.append(record)
+        predicate = self.compile(filters)
+        return [record for record in records if predicate(record)]
 
-        return filtered_records
+    def compile(self, filters: Dict) -> Callable[[Dict], bool]:
+        """필터 그룹을 레코드 하나를 받는 조건 함수로 컴파일"""
+        if not filters:
+            return lambda record: True
+        return self._compile_filter_group(filters)
 
-    def _evaluate_filter_group(self, record: Dict, filter_group: Dict) -> bool:
-        """필터 그룹 평가"""
+    def _compile_filter_group(self, filter_group: Dict) -> Callable[[Dict], bool]:
+        """필터 그룹 컴파일"""
         group_type = filter_group.get("type", FilterGroup.AND)
-        conditions = filter_group.get("conditions", [])
+        conditions = [self._compile_condition(condition)
+                      for condition in filter_group.get("conditions", [])]
 
         if group_type == FilterGroup.AND:
-            return all(self._evaluate_condition(record, condition)
-                       for condition in conditions)
+            return lambda record: all(condition(record) for condition in conditions)
         else:  # OR
-            return any(self._evaluate_condition(record, condition)
-                       for condition in conditions)
+            return lambda record: any(condition(record) for condition in conditions)
 
-    def _evaluate_condition(self, record: Dict, condition: Dict) -> bool:
-        """개별 필터 조건 평가"""
+    def _compile_condition(self, condition: Dict) -> Callable[[Dict], bool]:
+        """개별 필터 조건 컴파일 (날짜 파싱, 소문자 변환은 여기서 한 번만 수행)"""
         if "conditions" in condition:  # Nested group
-            return self._evaluate_filter_group(record, condition)
+            return self._compile_filter_group(condition)
 
         property_name = condition["property"]
         operator = condition["operator"]
         value = condition["value"]
 
-        record_value = record.get(property_name)
-
         # 날짜 값 처리
+        parse_dates = False
         if isinstance(value, str) and "date" in property_name.lower():
             try:
                 value = datetime.fromisoformat(value)
-                if isinstance(record_value, str):
-                    record_value = datetime.fromisoformat(record_value)
+                parse_dates = True
             except ValueError:
                 pass
 
-        # 필터 연산자 적용
+        factory = self.predicate_factories.get(operator)
+        if factory is None:
+            return lambda record: False
+        compare = factory(value)
+
+        if parse_dates:
+            def evaluate(record: Dict) -> bool:
+                record_value = record.get(property_name)
+                if isinstance(record_value, str):
+                    try:
+                        record_value = datetime.fromisoformat(record_value)
+                    except ValueError:
+                        pass
+                try:
+                    return compare(record_value)
+                except Exception:
+                    return False
+        else:
+            def evaluate(record: Dict) -> bool:
+                record_value = record.get(property_name)
+                try:
+                    return compare(record_value)
+                except Exception:
+                    return False
+
+        return evaluate
+
+    @staticmethod
+    def _contains(value: Any) -> Callable[[Any], bool]:
+        needle = str(value).lower()
+        return lambda x: needle in str(x).lower()
+
+    @staticmethod
+    def _does_not_contain(value: Any) -> Callable[[Any], bool]:
+        needle = str(value).lower()
+        return lambda x: needle not in str(x).lower()
+
+    @staticmethod
+    def _starts_with(value: Any) -> Callable[[Any], bool]:
+        prefix = str(value).lower()
+        return lambda x: str(x).lower().startswith(prefix)
+
+    @staticmethod
+    def _ends_with(value: Any) -> Callable[[Any], bool]:
+        suffix = str(value).lower()
+        return lambda x: str(x).lower().endswith(suffix)
+
+    @staticmethod
+    def _between(value: Any) -> Callable[[Any], bool]:
         try:
-            return self.operators[operator](record_value, value)
+            low, high = value[0], value[1]
         except Exception:
-            return False
+            return lambda x: False
+        return lambda x: low <= x <= high
 
 
 class FilterBuilder:
@@ -0,0 +1,269 @@
+# backend/app/services/database_filter_sql.py
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from datetime import datetime
+from sqlalchemy import and_, or_, not_, case, func, true, false
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.database import DatabaseRecord
+from app.services.database.database_filter import (
+    FilterOperator, FilterGroup, normalize_filters
+)
+from app.services.database.database_property_index import INDEXED_TEXT_LENGTH, indexed_expression
+
+# 방언별 JSON 타입 이름 (SQLite json_type / MariaDB JSON_TYPE)
+JSON_TYPES = {
+    "sqlite": {
+        "number": ("integer", "real", "true", "false"),
+        "text": ("text",),
+        "null": ("null",),
+    },
+    "mysql": {
+        "number": ("INTEGER", "UNSIGNED INTEGER", "DOUBLE", "DECIMAL", "BOOLEAN"),
+        "text": ("STRING",),
+        "null": ("NULL",),
+    },
+}
+
+# (SQL 조건, 정확히 일치하는지 여부). 정확하지 않은 조건은 결과의 상위 집합이므로
+# 원래 조건을 메모리에서 한 번 더 검사해야 한다.
+Translation = Tuple[Optional[ColumnElement], bool]
+
+
+class JSONProperty:
+    """data 컬럼(계산 프로퍼티는 computed 컬럼)의 한 프로퍼티를 꺼내는 방언별 SQL 식"""
+
+    def __init__(self, dialect: str, property_name: str, indexed: bool = False, computed: bool = False):
+        self.dialect = dialect
+        path = f'$."{property_name}"'
+        column = DatabaseRecord.computed if computed else DatabaseRecord.data
+        raw = func.json_extract(column, path)
+        # indexed 프로퍼티는 보조 인덱스와 같은 식으로 비교해야 인덱스를 탄다
+        self.indexed = indexed_expression(dialect, property_name) if indexed else None
+
+        if dialect == "mysql":
+            # MariaDB의 JSON_EXTRACT는 JSON 텍스트를 돌려주므로 따옴표를 벗겨서 비교
+            json_type = func.json_type(raw)
+            self.text = func.json_unquote(raw)
+            self.number = case(
+                (json_type == "BOOLEAN", case((self.text == "true", 1), else_=0)),
+                else_=self.text + 0
+            )
+        else:
+            # SQLite는 스칼라 값을 그대로 돌려주며, true/false는 1/0이 된다
+            json_type = func.json_type(column, path)
+            self.text = self.indexed if indexed else raw
+            self.number = self.text
+
+        self.type = func.coalesce(json_type, "")
+        self.missing = json_type.is_(None)
+
+    def is_type(self, kind: str) -> ColumnElement:
+        return self.type.in_(JSON_TYPES[self.dialect][kind])
+
+    def is_null(self) -> ColumnElement:
+        return or_(self.missing, self.is_type("null"))
+
+    def text_equals(self, value: str) -> ColumnElement:
+        clause = self.text == value
+        if self.dialect == "mysql" and self.indexed is not None:
+            # 생성 열 인덱스로 후보를 좁힌 뒤 원래 값으로 비교
+            clause = and_(self.indexed == value[:INDEXED_TEXT_LENGTH], clause)
+        return clause
+
+    def text_in(self, values: List[str]) -> ColumnElement:
+        clause = self.text.in_(values)
+        if self.dialect == "mysql" and self.indexed is not None:
+            clause = and_(self.indexed.in_([value[:INDEXED_TEXT_LENGTH] for value in values]), clause)
+        return clause
+
+
+class FilterSQLTranslator:
+    """필터 그룹을 DatabaseRecord.data(JSON)에 대한 SQLAlchemy 조건으로 변환"""
+
+    def __init__(self, dialect_name: str, indexed: Iterable[str] = (), computed: Iterable[str] = ()):
+        self.dialect = "mysql" if dialect_name in ("mysql", "mariadb") else "sqlite"
+        # 보조 인덱스가 있는 프로퍼티 (database_property_index 참고)
+        self.indexed = set(indexed)
+        # 값이 computed 컬럼에 저장되는 수식/롤업 프로퍼티 (database_dependency 참고)
+        self.computed = set(computed)
+        # MariaDB 문자열 비교는 콜레이션(대소문자/후행 공백 무시)을 따르므로 상위 집합만 보장
+        self.exact_text = self.dialect == "sqlite"
+
+        self.translators = {
+            FilterOperator.EQUALS: self._equals,
+            FilterOperator.NOT_EQUALS: self._not_equals,
+            FilterOperator.GREATER_THAN: lambda p, v: self._compare(p, v, "__gt__"),
+            FilterOperator.LESS_THAN: lambda p, v: self._compare(p, v, "__lt__"),
+            FilterOperator.GREATER_THAN_EQUAL: lambda p, v: self._compare(p, v, "__ge__"),
+            FilterOperator.LESS_THAN_EQUAL: lambda p, v: self._compare(p, v, "__le__"),
+            FilterOperator.BETWEEN: self._between,
+            FilterOperator.IS_EMPTY: self._is_empty,
+            FilterOperator.IS_NOT_EMPTY: self._is_not_empty,
+            FilterOperator.IN: self._in,
+            FilterOperator.NOT_IN: self._not_in,
+        }
+
+    def translate(self, filters: Any) -> Tuple[Optional[ColumnElement], Optional[Dict]]:
+        """(SQL 조건, 메모리에서 검사할 잔여 필터 그룹) 반환"""
+        filters = normalize_filters(filters)
+        if not filters:
+            return None, None
+
+        clauses: List[ColumnElement] = []
+        residual: List[Dict] = []
+        self._split_and_group(filters, clauses, residual)
+
+        where = and_(*clauses) if clauses else None
+        residual_group = {"type": FilterGroup.AND, "conditions": residual} if residual else None
+        return where, residual_group
+
+    def _split_and_group(self, group: Dict, clauses: List, residual: List) -> None:
+        """최상위 AND 그룹은 조건별로 나눠서 변환 가능한 조건만 SQL로 보낸다"""
+        if group.get("type", FilterGroup.AND) != FilterGroup.AND:
+            clause, exact = self._translate_node(group)
+            if clause is not None:
+                clauses.append(clause)
+            if not exact:
+                residual.append(group)
+            return
+
+        for condition in group.get("conditions", []):
+            if ("conditions" in condition
+                    and condition.get("type", FilterGroup.AND) == FilterGroup.AND):
+                self._split_and_group(condition, clauses, residual)
+                continue
+
+            clause, exact = self._translate_node(condition)
+            if clause is not None:
+                clauses.append(clause)
+            if not exact:
+                residual.append(condition)
+
+    def _translate_node(self, node: Dict) -> Translation:
+        if "conditions" not in node:
+            return self._translate_condition(node)
+
+        children = [self._translate_node(condition) for condition in node["conditions"]]
+        clauses = [clause for clause, _ in children if clause is not None]
+        exact = all(clause is not None and child_exact for clause, child_exact in children)
+
+        if node.get("type", FilterGroup.AND) == FilterGroup.AND:
+            return (and_(*clauses) if clauses else true()), exact
+
+        # OR 그룹은 한 조건이라도 변환하지 못하면 통째로 메모리에서 검사
+        if len(clauses) != len(children):
+            return None, False
+        return (or_(*clauses) if clauses else false()), exact
+
+    def _translate_condition(self, condition: Dict) -> Translation:
+        property_name = condition["property"]
+        operator = condition["operator"]
+        value = condition["value"]
+
+        if '"' in property_name or "\\" in property_name:
+            return None, False
+
+        # 날짜 프로퍼티는 datetime으로 비교하므로 메모리에서 처리
+        if isinstance(value, str) and "date" in property_name.lower():
+            try:
+                datetime.fromisoformat(value)
+                return None, False
+            except ValueError:
+                pass
+
+        try:
+            operator = FilterOperator(operator)
+        except ValueError:
+            # 알 수 없는 연산자는 메모리 필터에서도 항상 거짓
+            return false(), True
+
+        translator = self.translators.get(operator)
+        if translator is None:  # contains 등 문자열 패턴 연산자
+            return None, False
+        if property_name in self.computed:
+            prop = JSONProperty(self.dialect, property_name, computed=True)
+        else:
+            prop = JSONProperty(self.dialect, property_name, property_name in self.indexed)
+        return translator(prop, _bool_to_int(value))
+
+    def _equals(self, prop: JSONProperty, value: Any) -> Translation:
+        if value is None:
+            return prop.is_null(), True
+        if _is_number(value):
+            return and_(prop.is_type("number"), prop.number == value), True
+        if isinstance(value, str):
+            return and_(prop.is_type("text"), prop.text_equals(value)), self.exact_text
+        return None, False
+
+    def _not_equals(self, prop: JSONProperty, value: Any) -> Translation:
+        clause, exact = self._equals(prop, value)
+        if clause is None or not exact:
+            return None, False
+        return not_(clause), True
+
+    def _compare(self, prop: JSONProperty, value: Any, method: str) -> Translation:
+        if _is_number(value):
+            return and_(prop.is_type("number"), getattr(prop.number, method)(value)), True
+        if isinstance(value, str) and self.exact_text:
+            return and_(prop.is_type("text"), getattr(prop.text, method)(value)), True
+        return None, False
+
+    def _between(self, prop: JSONProperty, value: Any) -> Translation:
+        if not isinstance(value, (list, tuple)) or len(value) < 2:
+            return None, False
+        low, high = value[0], value[1]
+        if _is_number(low) and _is_number(high):
+            return and_(prop.is_type("number"), prop.number >= low, prop.number <= high), True
+        if isinstance(low, str) and isinstance(high, str) and self.exact_text:
+            return and_(prop.is_type("text"), prop.text >= low, prop.text <= high), True
+        return None, False
+
+    def _is_empty(self, prop: JSONProperty, value: Any) -> Translation:
+        return (
+            or_(prop.is_null(), and_(prop.is_type("text"), prop.text == "")),
+            self.exact_text
+        )
+
+    def _is_not_empty(self, prop: JSONProperty, value: Any) -> Translation:
+        clause, exact = self._is_empty(prop, value)
+        if not exact:
+            return None, False
+        return not_(clause), True
+
+    def _in(self, prop: JSONProperty, value: Any) -> Translation:
+        # 문자열에 대한 in 은 부분 문자열 검사이므로 목록일 때만 변환
+        if not isinstance(value, (list, tuple)):
+            return None, False
+
+        numbers = [v for v in value if _is_number(v)]
+        texts = [v for v in value if isinstance(v, str)]
+        if len(numbers) + len(texts) + value.count(None) != len(value):
+            return None, False
+
+        clauses = []
+        if numbers:
+            clauses.append(and_(prop.is_type("number"), prop.number.in_(numbers)))
+        if texts:
+            clauses.append(and_(prop.is_type("text"), prop.text_in(texts)))
+        if None in value:
+            clauses.append(prop.is_null())
+        return (or_(*clauses) if clauses else false()), self.exact_text or not texts
+
+    def _not_in(self, prop: JSONProperty, value: Any) -> Translation:
+        clause, exact = self._in(prop, value)
+        if clause is None or not exact:
+            return None, False
+        return not_(clause), True
+
+
+def _is_number(value: Any) -> bool:
+    return type(value) in (int, float)
+
+
+def _bool_to_int(value: Any) -> Any:
+    """파이썬에서 True == 1 이므로 불리언 필터 값은 정수로 비교"""
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (list, tuple)):
+        return [int(v) if isinstance(v, bool) else v for v in value]
+    return value
@@ -0,0 +1,129 @@
+# backend/app/services/database_patch.py
+from typing import Any, Dict, List, Set
+import copy
+
+
+class PatchError(ValueError):
+    """적용할 수 없는 패치"""
+
+
+def merge_patch(data: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON Merge Patch (RFC 7396) 적용. null 값은 키 삭제, 객체는 재귀적으로 병합"""
+    result = dict(data)
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        elif isinstance(value, dict):
+            current = result.get(key)
+            result[key] = merge_patch(current if isinstance(current, dict) else {}, value)
+        else:
+            result[key] = value
+    return result
+
+
+def apply_json_patch(data: Dict[str, Any], operations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """JSON Patch (RFC 6902) 연산 목록을 순서대로 적용한 새 데이터
+
+    연산 하나라도 실패하면 PatchError를 내고 원본은 바뀌지 않는다.
+    """
+    result = copy.deepcopy(data)
+    for operation in operations:
+        op = operation.get("op")
+        path = _parse_pointer(operation.get("path"))
+        if not path:
+            raise PatchError("Patch must not replace the whole record")
+
+        if op == "add":
+            _add(result, path, copy.deepcopy(_required(operation, "value")))
+        elif op == "remove":
+            _remove(result, path)
+        elif op == "replace":
+            _remove(result, path)
+            _add(result, path, copy.deepcopy(_required(operation, "value")))
+        elif op == "move":
+            source = _parse_pointer(operation.get("from"))
+            if path[:len(source)] == source and path != source:
+                raise PatchError("Cannot move a value into itself")
+            _add(result, path, _remove(result, source))
+        elif op == "copy":
+            _add(result, path, copy.deepcopy(_get(result, _parse_pointer(operation.get("from")))))
+        elif op == "test":
+            if _get(result, path) != _required(operation, "value"):
+                raise PatchError(f"Test failed at {operation.get('path')}")
+        else:
+            raise PatchError(f"Unknown patch operation: {op}")
+    return result
+
+
+def changed_keys(old_data: Dict[str, Any], new_data: Dict[str, Any]) -> Set[str]:
+    """값이 바뀌거나 추가/삭제된 최상위 키"""
+    return {key for key in set(old_data) | set(new_data)
+            if key not in old_data or key not in new_data or old_data[key] != new_data[key]}
+
+
+def _required(operation: Dict[str, Any], name: str) -> Any:
+    if name not in operation:
+        raise PatchError(f"Missing '{name}' in {operation.get('op')} operation")
+    return operation[name]
+
+
+def _parse_pointer(pointer: Any) -> List[str]:
+    """JSON Pointer (RFC 6901) 문자열을 경로 토큰 목록으로 변환"""
+    if not isinstance(pointer, str) or (pointer and not pointer.startswith("/")):
+        raise PatchError(f"Invalid JSON pointer: {pointer!r}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer.split("/")[1:]]
+
+
+def _container(document: Any, path: List[str]) -> Any:
+    """경로의 마지막 토큰을 담고 있는 객체/배열"""
+    for token in path[:-1]:
+        document = _child(document, token)
+    return document
+
+
+def _child(document: Any, token: str) -> Any:
+    if isinstance(document, dict):
+        if token not in document:
+            raise PatchError(f"Path not found: {token}")
+        return document[token]
+    if isinstance(document, list):
+        return document[_index(document, token)]
+    raise PatchError(f"Path not found: {token}")
+
+
+def _index(array: List[Any], token: str, allow_end: bool = False) -> int:
+    if allow_end and token == "-":
+        return len(array)
+    if not token.isdigit() or (token != "0" and token.startswith("0")):
+        raise PatchError(f"Invalid array index: {token}")
+    index = int(token)
+    if index > len(array) or (index == len(array) and not allow_end):
+        raise PatchError(f"Array index out of range: {token}")
+    return index
+
+
+def _get(document: Any, path: List[str]) -> Any:
+    for token in path:
+        document = _child(document, token)
+    return document
+
+
+def _add(document: Any, path: List[str], value: Any) -> None:
+    parent, token = _container(document, path), path[-1]
+    if isinstance(parent, dict):
+        parent[token] = value
+    elif isinstance(parent, list):
+        parent.insert(_index(parent, token, allow_end=True), value)
+    else:
+        raise PatchError(f"Path not found: {token}")
+
+
+def _remove(document: Any, path: List[str]) -> Any:
+    parent, token = _container(document, path), path[-1]
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise PatchError(f"Path not found: {token}")
+        return parent.pop(token)
+    if isinstance(parent, list):
+        return parent.pop(_index(parent, token))
+    raise PatchError(f"Path not found: {token}")
@@ -0,0 +1,206 @@
+# backend/app/services/database_property_index.py
+from typing import Dict, Iterable, Optional, Set
+import hashlib
+from sqlalchemy import column, func, literal_column, text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.database import Database, DatabasePropertyIndex, DatabaseRecord
+from app.services.database.database_schema import computed_properties, schema_properties
+
+# MariaDB 생성 열에 담는 값의 최대 길이 (넘치는 값은 앞부분만 인덱스에 들어간다)
+INDEXED_TEXT_LENGTH = 255
+COLUMN_PREFIX = "prop_"
+INDEX_PREFIX = "ix_database_records_prop_"
+
+
+def indexed_properties(schema: Optional[Dict], views: Optional[Dict] = None) -> Set[str]:
+    """보조 인덱스를 둘 프로퍼티 (JSON 경로로 나타낼 수 있는 것만)
+
+    스키마에서 indexed로 표시된 프로퍼티와 캘린더 뷰의 date_property이다.
+    data에 값이 없는 계산 프로퍼티는 제외한다.
+    """
+    names = {
+        property_name
+        for property_name, config in schema_properties(schema).items()
+        if config.get("indexed")
+    }
+    for view in (views or {}).values():
+        if isinstance(view, dict) and view.get("type") == "calendar" and view.get("date_property"):
+            names.add(view["date_property"])
+    names -= computed_properties(schema)
+    return {name for name in names if '"' not in name and "\\" not in name}
+
+
+def _digest(property_name: str) -> str:
+    return hashlib.sha1(property_name.encode("utf-8")).hexdigest()[:16]
+
+
+def property_column_name(property_name: str) -> str:
+    """프로퍼티의 MariaDB 생성 열 이름"""
+    return COLUMN_PREFIX + _digest(property_name)
+
+
+def property_index_name(property_name: str) -> str:
+    return INDEX_PREFIX + _digest(property_name)
+
+
+def _path_literal(property_name: str, member: str = "") -> str:
+    """JSON 경로 SQL 문자열 리터럴 (인덱스 식과 조회 식이 글자 그대로 같아야 한다)"""
+    path = f'$."{property_name}"{member}'
+    return "'" + path.replace("'", "''") + "'"
+
+
+def index_value_sql(property_name: str) -> str:
+    """보조 인덱스에 넣는 값의 SQL 식
+
+    기간({"start": ..., "end": ...}) 값은 시작 날짜를, 그 밖의 값은 값 그대로를 담는다.
+    스칼라 값에서는 .start 경로가 NULL이므로 문자열/숫자 비교는 원래 값과 같다.
+    """
+    start, value = _path_literal(property_name, ".start"), _path_literal(property_name)
+    return f"coalesce(json_extract(data, {start}), json_extract(data, {value}))"
+
+
+def start_expression(dialect: str, property_name: str) -> ColumnElement:
+    """기간 값은 시작 날짜로 꺼내는 프로퍼티 값 식 (index_value_sql과 같은 식, 텍스트)"""
+    value = func.coalesce(
+        func.json_extract(DatabaseRecord.data, literal_column(_path_literal(property_name, ".start"))),
+        func.json_extract(DatabaseRecord.data, literal_column(_path_literal(property_name))),
+    )
+    # MariaDB의 JSON_EXTRACT는 JSON 텍스트를 돌려주므로 따옴표를 벗긴다
+    return func.json_unquote(value) if dialect == "mysql" else value
+
+
+def indexed_expression(dialect: str, property_name: str) -> ColumnElement:
+    """인덱스를 타는 프로퍼티 값 식
+
+    MariaDB는 생성 열(따옴표를 벗긴 텍스트, 앞 INDEXED_TEXT_LENGTH자),
+    SQLite는 표현식 인덱스와 같은 식이다. 어느 쪽이든 기간 값은 시작 날짜이다.
+    """
+    if dialect == "mysql":
+        return column(property_column_name(property_name))
+    return start_expression(dialect, property_name)
+
+
+class PropertyIndexManager:
+    """indexed 프로퍼티의 보조 인덱스를 스키마와 맞춘다
+
+    database_records는 모든 데이터베이스가 함께 쓰므로 인덱스는 프로퍼티 키마다
+    하나씩 (database_id, 프로퍼티 값)으로 만들고, 어떤 데이터베이스에서도 쓰이지 않게 된
+    인덱스는 지운다. MariaDB는 JSON_EXTRACT 가상 생성 열과 그 인덱스를,
+    SQLite는 json_extract 표현식 인덱스를 사용한다.
+
+    스키마를 저장할 때는 필요한 인덱스만 database_property_indexes에 기록하고(record),
+    DDL은 응답 후 바뀐 프로퍼티에 대해서만 실행한다(apply). 인덱스가 만들어지기 전까지
+    조회는 인덱스 없는 식으로 비교한다 (ready 참고).
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        dialect_name = db.get_bind().dialect.name
+        self.dialect = "mysql" if dialect_name in ("mysql", "mariadb") else "sqlite"
+
+    def record(self, database: Database) -> Set[str]:
+        """데이터베이스에 필요한 인덱스를 기록하고, 인덱스를 만들거나 지워야 할 프로퍼티 반환
+
+        이 데이터베이스의 이전 기록과만 비교한다. 다른 데이터베이스가 이미 쓰고 있는
+        인덱스는 바로 쓸 수 있으므로 ready로 기록한다.
+        """
+        wanted = indexed_properties(database.schema, database.views)
+        rows = {row.property_name: row for row in database.property_indexes}
+        changed = set(rows) - wanted
+        for property_name in changed:
+            database.property_indexes.remove(rows[property_name])
+
+        added = wanted - set(rows)
+        ready = self._ready(added)
+        for property_name in added:
+            database.property_indexes.append(
+                DatabasePropertyIndex(property_name=property_name, ready=property_name in ready)
+            )
+        changed |= added - ready
+        self.db.commit()
+        return changed
+
+    def apply(self, property_names: Iterable[str]) -> Set[int]:
+        """프로퍼티들의 인덱스를 기록과 맞추고, 인덱스를 쓸 수 있게 된 데이터베이스 id 반환"""
+        property_names = set(property_names)
+        if not property_names:
+            return set()
+        wanted = {
+            property_name for property_name, in
+            self.db.query(DatabasePropertyIndex.property_name).distinct()
+            .filter(DatabasePropertyIndex.property_name.in_(property_names))
+        }
+        existing = self._existing()
+        for property_name in sorted(property_names):
+            digest = _digest(property_name)
+            if property_name in wanted and digest not in existing:
+                self._create(property_name)
+            elif property_name not in wanted and digest in existing:
+                self._drop(digest)
+
+        pending = (
+            self.db.query(DatabasePropertyIndex)
+            .filter(DatabasePropertyIndex.property_name.in_(wanted),
+                    DatabasePropertyIndex.ready.is_(False))
+            .all()
+        )
+        for row in pending:
+            row.ready = True
+        self.db.commit()
+        return {row.database_id for row in pending}
+
+    def _ready(self, property_names: Set[str]) -> Set[str]:
+        """인덱스가 이미 만들어진 프로퍼티"""
+        if not property_names:
+            return set()
+        return {
+            property_name for property_name, in
+            self.db.query(DatabasePropertyIndex.property_name).distinct()
+            .filter(DatabasePropertyIndex.property_name.in_(property_names),
+                    DatabasePropertyIndex.ready.is_(True))
+        }
+
+    def _existing(self) -> Set[str]:
+        """이미 만들어진 프로퍼티 인덱스의 해시"""
+        if self.dialect == "mysql":
+            names = self.db.execute(text(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_schema = DATABASE() AND table_name = 'database_records'"
+            ))
+            prefix = COLUMN_PREFIX
+        else:
+            names = self.db.execute(text(
+                "SELECT name FROM sqlite_master "
+                "WHERE type = 'index' AND tbl_name = 'database_records'"
+            ))
+            prefix = INDEX_PREFIX
+        return {name[len(prefix):] for name, in names if name.startswith(prefix)}
+
+    def _create(self, property_name: str) -> None:
+        value = index_value_sql(property_name).replace(":", "\\:")  # text()의 바인드 파라미터로 읽히지 않도록
+        index_name = property_index_name(property_name)
+        if self.dialect == "mysql":
+            column_name = property_column_name(property_name)
+            self.db.execute(text(
+                f"ALTER TABLE database_records "
+                f"ADD COLUMN {column_name} VARCHAR({INDEXED_TEXT_LENGTH}) "
+                f"AS (LEFT(JSON_UNQUOTE({value}), {INDEXED_TEXT_LENGTH})) VIRTUAL, "
+                f"ADD INDEX {index_name} (database_id, {column_name})"
+            ))
+        else:
+            self.db.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {index_name} "
+                f"ON database_records (database_id, {value})"
+            ))
+
+    def _drop(self, digest: str) -> None:
+        index_name = INDEX_PREFIX + digest
+        if self.dialect == "mysql":
+            self.db.execute(text(
+                f"ALTER TABLE database_records DROP INDEX {index_name}, "
+                f"DROP COLUMN {COLUMN_PREFIX + digest}"
+            ))
+        else:
+            self.db.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
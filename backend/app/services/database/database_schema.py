@@ -0,0 +1,54 @@
+# backend/app/services/database_schema.py
+from typing import Any, Dict, List, Optional, Set
+
+
+def schema_properties(schema: Optional[Dict]) -> Dict[str, Dict]:
+    """스키마의 프로퍼티 정의 {프로퍼티명: 설정}
+
+    템플릿은 {"properties": {...}} 형태로, 프론트엔드는 프로퍼티 딕셔너리를 그대로 저장한다.
+    """
+    if not isinstance(schema, dict):
+        return {}
+
+    properties = schema.get("properties", schema)
+    if not isinstance(properties, dict):
+        return {}
+    return {name: config for name, config in properties.items() if isinstance(config, dict)}
+
+
+def option_names(config: Dict[str, Any]) -> List[str]:
+    """선택 옵션 이름 목록 (문자열 또는 {"name": ...} 형태 모두 허용)"""
+    names = []
+    for option in config.get("options") or []:
+        if isinstance(option, dict):
+            option = option.get("name", option.get("value"))
+        if isinstance(option, str):
+            names.append(option)
+    return names
+
+
+def parse_database_id(value: Any) -> Optional[int]:
+    """relation_config.database_id(문자열)를 데이터베이스 id로 변환"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def relation_targets(schema: Optional[Dict]) -> Set[int]:
+    """스키마의 관계 프로퍼티가 가리키는 데이터베이스 id"""
+    targets = set()
+    for config in schema_properties(schema).values():
+        if config.get("type") == "relation":
+            target = parse_database_id((config.get("relation_config") or {}).get("database_id"))
+            if target is not None:
+                targets.add(target)
+    return targets
+
+
+def computed_properties(schema: Optional[Dict]) -> Set[str]:
+    """값이 data가 아닌 computed 컬럼에 저장되는 계산 프로퍼티(수식/롤업)"""
+    return {
+        name for name, config in schema_properties(schema).items()
+        if config.get("type") in ("formula", "rollup")
+    }
@@ -1,7 +1,14 @@
 # backend/app/services/database_sort.py
-from typing import List, Dict, Any, Callable
-from datetime import datetime
+from typing import List, Dict, Any, Callable, Iterable, Optional, Tuple
+from datetime import date, datetime, time, timezone
 from enum import Enum
+from functools import partial
+from operator import itemgetter, neg
+import heapq
+
+from app.core.cursor import encode_cursor, decode_cursor
+from app.services.database.database_filter import filter_hash
+from app.services.database.database_schema import schema_properties, option_names
 
 
 class SortDirection(str, Enum):
@@ -17,18 +24,97 @@ class SortType(str, Enum):
     RELATION = "relation"
     ROLLUP = "rollup"
     SELECT = "select"
+    MULTI_SELECT = "multi_select"
+
+
+# 규칙마다 (순서 구분값, 키) 두 칸을 차지한다.
+# None 값은 방향과 관계없이 항상 마지막
+_NONE_KEY = (2, None)
+# 비교할 수 없는 값(숫자로 변환 불가, 잘못된 날짜 등)은 None 바로 앞에 모은다
+INCOMPARABLE = object()
+_INCOMPARABLE_KEY = (1, None)
+
+# 옵션 순위를 매기는 프로퍼티 타입
+_OPTION_TYPES = ("select", "multi_select")
+
+# 뷰 인덱스 정렬 키 인코딩 버전 (database_view_index). 인코딩이 바뀌면 올려서
+# 서명이 달라진 기존 인덱스를 다음 조회 때 다시 만들게 한다
+SORT_KEY_ENCODING = 2
+
+
+def build_option_ranks(schema: Optional[Dict]) -> Dict[str, Dict[str, int]]:
+    """스키마에 정의된 옵션 순서를 프로퍼티별 순위 정수로 변환"""
+    ranks = {}
+    for property_name, config in schema_properties(schema).items():
+        if config.get("type") in _OPTION_TYPES:
+            order = ranks[property_name] = {}
+            for rank, option in enumerate(option_names(config)):
+                order.setdefault(option, rank)
+    return ranks
+
+
+def sort_signature(sort_config: List[Dict],
+                   option_ranks: Dict[str, Dict[str, int]],
+                   computed_version: Optional[str] = None) -> str:
+    """정렬 설정과 정렬에 쓰이는 옵션 순서(와 계산 프로퍼티 설정 버전)의 해시"""
+    options = {
+        rule["property"]: option_ranks.get(rule["property"])
+        for rule in sort_config
+        if rule.get("type") in _OPTION_TYPES
+    }
+    signature = {"sorts": sort_config, "options": options, "encoding": SORT_KEY_ENCODING}
+    if computed_version is not None:
+        signature["computed"] = computed_version
+    return filter_hash(signature)
+
+
+class _Descending:
+    """내림차순 정렬을 위해 비교 방향을 뒤집는 키 래퍼"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __eq__(self, other: "_Descending") -> bool:
+        return self.value == other.value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.value < self.value
+
+
+def _descending_key(key: Any) -> Any:
+    """오름차순 키를 내림차순 키로 변환 (가능하면 C 수준에서 비교되는 값으로)"""
+    if type(key) in (int, float):
+        return -key
+    if isinstance(key, str):
+        # 코드 포인트를 음수로 바꾸고, 접두사가 더 긴 문자열보다 뒤에 오도록 종료 값 추가
+        return tuple(map(neg, map(ord, key))) + (1,)
+    if isinstance(key, datetime):
+        seconds = key.hour * 3600 + key.minute * 60 + key.second
+        return (-key.toordinal(), -seconds, -key.microsecond)
+    if isinstance(key, tuple):
+        # 길이가 다른 튜플(다중 선택)은 짧은 쪽이 앞이므로, 항목을 (0, 값)으로 감싸고
+        # 끝에 (1,)을 붙여서 접두사가 같으면 긴 튜플이 먼저 오게 한다
+        return tuple((0, _descending_key(item)) for item in key) + ((1,),)
+    return _Descending(key)
 
 
 class DatabaseSort:
-    def __init__(self):
-        self.type_handlers = {
-            SortType.TEXT: self._compare_text,
-            SortType.NUMBER: self._compare_number,
-            SortType.DATE: self._compare_date,
-            SortType.BOOLEAN: self._compare_boolean,
-            SortType.RELATION: self._compare_relation,
-            SortType.ROLLUP: self._compare_rollup,
-            SortType.SELECT: self._compare_select,
+    def __init__(self, option_ranks: Optional[Dict[str, Dict[str, int]]] = None):
+        # 선택/다중 선택 프로퍼티별 {옵션: 순위} (build_option_ranks 결과)
+        self.option_ranks = option_ranks or {}
+
+        # 타입별로 값 하나를 오름차순 정렬 키로 바꾸는 함수
+        self.key_handlers = {
+            SortType.TEXT: self._key_text,
+            SortType.NUMBER: self._key_number,
+            SortType.DATE: self._key_date,
+            SortType.BOOLEAN: self._key_boolean,
+            SortType.RELATION: self._key_relation,
+            SortType.ROLLUP: self._key_rollup,
+            SortType.SELECT: self._key_select,
+            SortType.MULTI_SELECT: self._key_select,
         }
 
     def sort_records(self, records: List[Dict], sort_config: List[Dict]) -> List[Dict]:
@@ -36,102 +122,177 @@ class DatabaseSort:
         if not sort_config:
             return records
 
-        def compare_records(record1: Dict, record2: Dict) -> int:
-            for sort_rule in sort_config:
-                property_name = sort_rule["property"]
-                direction = sort_rule.get("direction", SortDirection.ASCENDING)
-                sort_type = sort_rule.get("type", SortType.TEXT)
+        return sorted(records, key=self.build_sort_key(sort_config))
+
+    def sort_window(self,
+                    records: Iterable[Any],
+                    sort_config: List[Dict],
+                    limit: Optional[int] = 100,
+                    after: Optional[str] = None,
+                    skip: int = 0,
+                    scope: Optional[Any] = None,
+                    get_data: Callable[[Any], Dict] = None,
+                    get_id: Callable[[Any], Any] = None) -> Tuple[List[Any], Optional[str]]:
+        """정렬 결과 중 [skip, skip + limit) 구간만 반환 (O(n log k) 부분 정렬)
 
-                value1 = record1.get(property_name)
-                value2 = record2.get(property_name)
+        레코드는 id 순서로 들어온다고 가정하며, 같은 정렬 키는 id로 구분하므로
+        전체 정렬 후 잘라낸 구간과 같은 레코드를 돌려준다. after에 이전 페이지의
+        커서를 넘기면 그 키 다음부터 이어서 가져오며, 다음 페이지 커서를 함께 반환한다.
+        scope는 레코드를 고른 조건(필터 등)으로, 커서에 해시로 넣어서 정렬이나 조건이
+        다른 조회의 커서는 거부한다. limit이 None이면 전체를 정렬한다.
+        """
+        get_data = get_data or (lambda record: record)
+        get_id = get_id or (lambda record: record.get("id"))
+        sort_key = self.build_sort_key(sort_config)
+        signature = self._window_signature(sort_config, scope)
 
-                # None 값 처리
-                if value1 is None and value2 is None:
-                    continue
-                if value1 is None:
-                    return 1
-                if value2 is None:
-                    return -1
+        keyed = ((sort_key(get_data(record)) + (get_id(record),), record) for record in records)
+        if after:
+            skip = 0
+            after_key = self._decode_sort_cursor(after, sort_config, sort_key, signature)
+            keyed = (item for item in keyed if item[0] > after_key)
 
-                # 비교 함수 호출
-                compare_result = self.type_handlers[sort_type](value1, value2)
+        if limit is None:
+            return [record for _, record in sorted(keyed, key=itemgetter(0))[skip:]], None
 
-                if compare_result != 0:
-                    return compare_result if direction == SortDirection.ASCENDING else -compare_result
+        window = heapq.nsmallest(skip + limit + 1, keyed, key=itemgetter(0))
+        page = window[skip:skip + limit]
 
-            return 0
+        next_cursor = None
+        if len(window) > skip + limit and page:
+            last_record = page[-1][1]
+            last_data = get_data(last_record)
+            next_cursor = encode_cursor({
+                "s": signature,
+                "v": [last_data.get(rule["property"]) for rule in sort_config],
+                "id": get_id(last_record),
+            })
 
-        return sorted(records, key=functools.cmp_to_key(compare_records))
+        return [record for _, record in page], next_cursor
 
-    def _compare_text(self, value1: str, value2: str) -> int:
-        """텍스트 비교"""
-        return (str(value1).lower() > str(value2).lower()) - (str(value1).lower() < str(value2).lower())
+    def _window_signature(self, sort_config: List[Dict], scope: Optional[Any]) -> str:
+        """sort_window 커서에 넣는 정렬 규칙, 옵션 순위, 조회 조건의 해시"""
+        ranks = {rule["property"]: self.option_ranks.get(rule["property"]) for rule in sort_config}
+        return filter_hash({"sorts": sort_config, "ranks": ranks, "scope": scope})[:16]
+
+    @staticmethod
+    def _decode_sort_cursor(cursor: str,
+                            sort_config: List[Dict],
+                            sort_key: Callable[[Dict], Tuple],
+                            signature: str) -> Tuple:
+        """커서에 저장된 정렬 값으로 비교용 키를 다시 계산"""
+        payload = decode_cursor(cursor)
+        values = payload.get("v")
+        if (payload.get("s") != signature or not isinstance(values, list)
+                or len(values) != len(sort_config) or not isinstance(payload.get("id"), int)):
+            raise ValueError("Invalid cursor")
 
-    def _compare_number(self, value1: Any, value2: Any) -> int:
-        """숫자 비교"""
+        data = {rule["property"]: value for rule, value in zip(sort_config, values)}
+        return sort_key(data) + (payload.get("id"),)
+
+    def build_sort_key(self, sort_config: List[Dict]) -> Callable[[Dict], Tuple]:
+        """정렬 규칙 전체를 레코드당 한 번 계산하는 복합 키 함수로 변환"""
+        rule_keys = [self._build_rule_key(*parts) for parts in self.rule_parts(sort_config)]
+
+        if len(rule_keys) == 1:
+            return rule_keys[0]
+
+        # 중첩 튜플보다 평탄한 튜플의 비교가 빠르므로 규칙별 키를 이어 붙인다
+        def sort_key(record: Dict) -> Tuple:
+            key = ()
+            for rule_key in rule_keys:
+                key += rule_key(record)
+            return key
+
+        return sort_key
+
+    def rule_parts(self, sort_config: List[Dict]) -> List[Tuple[str, Callable[[Any], Any], bool]]:
+        """정렬 규칙별 (프로퍼티명, 오름차순 값 키 함수, 내림차순 여부)"""
+        parts = []
+        for sort_rule in sort_config:
+            sort_type = sort_rule.get("type", SortType.TEXT)
+            value_key = self.key_handlers[sort_type]
+            if sort_type in (SortType.SELECT, SortType.MULTI_SELECT):
+                ranks = self.option_ranks.get(sort_rule["property"])
+                value_key = partial(value_key, ranks=ranks) if ranks else self._key_text
+
+            direction = sort_rule.get("direction", SortDirection.ASCENDING)
+            parts.append((sort_rule["property"], value_key, direction != SortDirection.ASCENDING))
+        return parts
+
+    @staticmethod
+    def _build_rule_key(property_name: str,
+                        value_key: Callable[[Any], Any],
+                        descending: bool) -> Callable[[Dict], Tuple]:
+        """정렬 규칙 하나의 키 함수 (방향과 None 처리를 키 안에서 처리)"""
+        def rule_key(record: Dict) -> Tuple:
+            value = record.get(property_name)
+            if value is None:
+                return _NONE_KEY
+
+            key = value_key(value)
+            if key is INCOMPARABLE:
+                return _INCOMPARABLE_KEY
+            if descending:
+                key = _descending_key(key)
+            return (0, key)
+
+        return rule_key
+
+    def _key_text(self, value: Any) -> str:
+        """텍스트 키 (대소문자 무시)"""
+        return str(value).lower()
+
+    def _key_number(self, value: Any) -> Any:
+        """숫자 키"""
         try:
-            num1 = float(value1)
-            num2 = float(value2)
-            return (num1 > num2) - (num1 < num2)
+            number = float(value)
         except (ValueError, TypeError):
-            return 0
+            return INCOMPARABLE
+        return number if number == number else INCOMPARABLE  # NaN 제외
 
-    def _compare_date(self, value1: Any, value2: Any) -> int:
-        """날짜 비교"""
-        try:
-            if isinstance(value1, str):
-                date1 = datetime.fromisoformat(value1)
-            else:
-                date1 = value1
+    def _key_date(self, value: Any) -> Any:
+        """날짜 키"""
+        if isinstance(value, str):
+            try:
+                value = datetime.fromisoformat(value)
+            except ValueError:
+                return INCOMPARABLE
 
-            if isinstance(value2, str):
-                date2 = datetime.fromisoformat(value2)
-            else:
-                date2 = value2
+        if isinstance(value, datetime):
+            if value.tzinfo is not None:
+                value = value.astimezone(timezone.utc).replace(tzinfo=None)
+            return value
+        if isinstance(value, date):
+            return datetime.combine(value, time())
+        return INCOMPARABLE
 
-            return (date1 > date2) - (date1 < date2)
-        except (ValueError, TypeError):
-            return 0
-
-    def _compare_boolean(self, value1: bool, value2: bool) -> int:
-        """불리언 비교"""
-        return (bool(value1) > bool(value2)) - (bool(value1) < bool(value2))
-
-    def _compare_relation(self, value1: List[Dict], value2: List[Dict]) -> int:
-        """관계형 필드 비교 (관련 레코드 수 기준)"""
-        len1 = len(value1) if isinstance(value1, list) else 0
-        len2 = len(value2) if isinstance(value2, list) else 0
-        return (len1 > len2) - (len1 < len2)
-
-    def _compare_rollup(self, value1: Any, value2: Any) -> int:
-        """롤업 값 비교"""
-        # 롤업 타입에 따라 적절한 비교 함수 사용
-        if isinstance(value1, (int, float)) and isinstance(value2, (int, float)):
-            return self._compare_number(value1, value2)
-        return self._compare_text(str(value1), str(value2))
-
-    def _compare_select(self, value1: str, value2: str) -> int:
-        """선택 옵션 비교"""
-        # 옵션의 순서가 정의되어 있다면 그 순서를 사용
-        options_order = self.get_options_order()
-        if options_order:
-            order1 = options_order.get(value1, float('inf'))
-            order2 = options_order.get(value2, float('inf'))
-            return (order1 > order2) - (order1 < order2)
-        return self._compare_text(value1, value2)
-
-    def get_options_order(self) -> Dict[str, int]:
-        """선택 옵션의 정렬 순서 반환"""
-        # 데이터베이스 스키마에서 정의된 옵션 순서 사용
-        return {
-            "높음": 0,
-            "중간": 1,
-            "낮음": 2,
-            "완료": 0,
-            "진행중": 1,
-            "대기중": 2,
-            "취소됨": 3,
-        }
+    def _key_boolean(self, value: Any) -> int:
+        """불리언 키"""
+        return int(bool(value))
+
+    def _key_relation(self, value: Any) -> int:
+        """관계형 필드 키 (관련 레코드 수 기준)"""
+        return len(value) if isinstance(value, list) else 0
+
+    def _key_rollup(self, value: Any) -> Tuple:
+        """롤업 값 키 (숫자는 숫자끼리, 나머지는 텍스트로 비교)"""
+        if isinstance(value, (int, float)) and value == value:
+            return (0, float(value))
+        return (1, self._key_text(value))
+
+    def _key_select(self, value: Any, ranks: Dict[str, int]) -> Tuple:
+        """선택 옵션 키 (스키마의 옵션 순서, 없는 옵션은 맨 뒤)
+
+        다중 선택은 선택된 옵션들의 순위를 정렬한 튜플로 비교한다.
+        """
+        unknown = len(ranks)
+        if isinstance(value, list):
+            return tuple(sorted(
+                ranks.get(option, unknown) if isinstance(option, str) else unknown
+                for option in value
+            ))
+        return (ranks.get(value, unknown) if isinstance(value, str) else unknown,)
 
 
 class SortBuilder:
@@ -0,0 +1,302 @@
+# backend/app/services/database_view_index.py
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from collections import defaultdict
+from datetime import datetime
+import struct
+from sqlalchemy.orm import Query, Session
+
+from app.models.database import Database, DatabaseRecord, DatabaseViewIndex
+from app.services.database.database_dependency import record_values
+from app.services.database.database_sort import INCOMPARABLE
+from app.services.database.database_view_plan import ViewPlan, get_view_plans
+
+# 저장하는 정렬 키 최대 길이 (16진 문자 수, DatabaseViewIndex.sort_key)
+SORT_KEY_LENGTH = 500
+# 이보다 긴 키는 앞부분 + 같은 앞부분을 가진 레코드 사이의 순위(16진 8자리)로 저장
+TIE_RANK_LENGTH = 8
+KEY_PREFIX_LENGTH = SORT_KEY_LENGTH - TIE_RANK_LENGTH
+REBUILD_BATCH_SIZE = 1000
+
+
+def encode_sort_key(rule_parts: List[Tuple[str, Callable[[Any], Any], bool]],
+                    data: Dict[str, Any]) -> str:
+    """정렬 키를 문자열 비교 순서가 정렬 순서와 같은 16진 문자열로 인코딩 (길이 제한 없음)"""
+    encoded = bytearray()
+    for property_name, value_key, descending in rule_parts:
+        value = data.get(property_name)
+        if value is None:  # 방향과 관계없이 항상 마지막
+            encoded += b"\x02"
+            continue
+
+        key = value_key(value)
+        if key is INCOMPARABLE:
+            encoded += b"\x01"
+            continue
+
+        value_bytes = _encode_value(key)
+        if descending:
+            # _encode_value의 결과는 어떤 값도 다른 값의 접두사가 되지 않으므로
+            # (문자열은 종료 바이트, 튜플은 항목/끝 표시 바이트) 비트를 뒤집으면 순서가 반대가 된다
+            value_bytes = bytes(byte ^ 0xFF for byte in value_bytes)
+        encoded += b"\x00" + value_bytes
+
+    return encoded.hex()
+
+
+def tie_ranked_keys(full_keys: Dict[int, str]) -> Dict[int, str]:
+    """전체 정렬 키 {레코드 id: 키}를 저장할 키로 변환
+
+    KEY_PREFIX_LENGTH보다 긴 키는 앞부분 뒤에 같은 앞부분을 가진 레코드들 사이의
+    순위를 붙인다. 순위는 전체 키(같으면 id) 순서이므로 잘린 키끼리도 저장된 키의
+    순서가 전체 키의 순서와 같다. 같은 앞부분을 가진 레코드를 모두 넘겨야 한다.
+    """
+    stored = {}
+    groups: Dict[str, List[Tuple[str, int]]] = defaultdict(list)
+    for record_id, full_key in full_keys.items():
+        if len(full_key) <= KEY_PREFIX_LENGTH:
+            stored[record_id] = full_key
+        else:
+            groups[full_key[:KEY_PREFIX_LENGTH]].append((full_key, record_id))
+    for prefix, members in groups.items():
+        for rank, (_, record_id) in enumerate(sorted(members)):
+            stored[record_id] = f"{prefix}{rank:0{TIE_RANK_LENGTH}x}"
+    return stored
+
+
+def _encode_value(key: Any) -> bytes:
+    """정렬 키 값 하나를 순서를 보존하는 바이트열로 변환"""
+    if isinstance(key, str):
+        raw = key.encode("utf-8")
+        return raw.replace(b"\x00", b"\x00\xff") + b"\x00\x00"
+    if isinstance(key, datetime):
+        seconds = key.hour * 3600 + key.minute * 60 + key.second
+        return struct.pack(">III", key.toordinal(), seconds, key.microsecond)
+    if isinstance(key, tuple):
+        # 항목마다 \x01을 앞에 붙이고 \x00으로 끝내서 짧은 튜플(접두사)이 앞에 오게 한다
+        return b"".join(b"\x01" + _encode_value(item) for item in key) + b"\x00"
+    if isinstance(key, (int, float)):
+        packed = struct.pack(">d", float(key) + 0.0)  # -0.0 을 0.0 으로 맞춤
+        if packed[0] & 0x80:
+            return bytes(byte ^ 0xFF for byte in packed)
+        return bytes([packed[0] | 0x80]) + packed[1:]
+    return _encode_value(str(key))
+
+
+class ViewSortIndex:
+    """뷰의 정렬 설정별로 레코드 순서를 유지하는 보조 인덱스
+
+    정렬된 뷰마다 레코드당 한 행을 두고 (database_id, view_id, sort_key, record_id)
+    인덱스로 범위 조회한다. 레코드가 바뀌면 해당 행만 갱신하고, 뷰의 정렬 설정이
+    바뀌면(해시가 달라지면) 다음 조회 때 전체를 다시 만든다. 선택 옵션 순서도
+    해시에 포함되므로 스키마에서 옵션 순서를 바꾸면 함께 다시 만들어진다.
+    길이 제한을 넘는 키는 앞부분이 같은 레코드들과 함께 순위를 다시 매긴다
+    (tie_ranked_keys 참고).
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def order_query(query: Query, database_id: int, view_id: str) -> Query:
+        """레코드 쿼리를 뷰 인덱스 순서로 정렬 (정렬 연산 없이 인덱스 범위 조회)"""
+        return (
+            query.join(DatabaseViewIndex, DatabaseViewIndex.record_id == DatabaseRecord.id)
+            .filter(DatabaseViewIndex.database_id == database_id,
+                    DatabaseViewIndex.view_id == view_id)
+            .order_by(DatabaseViewIndex.sort_key, DatabaseViewIndex.record_id)
+        )
+
+    def ensure(self, database: Database, view_id: str) -> bool:
+        """뷰 인덱스가 현재 정렬 설정과 맞는지 확인하고 필요하면 다시 만든다
+
+        정렬 설정이 없는 뷰면 False를 반환한다.
+        """
+        plan = get_view_plans(database).view(view_id)
+        if plan is None or not plan.sorts:
+            return False
+
+        stored = self.stored_signature(database.id, view_id)
+        if stored == plan.sort_signature:
+            return True
+        if stored is None and not self._has_records(database.id):
+            return True
+
+        self.rebuild(database, view_id, plan)
+        return True
+
+    def rebuild(self, database: Database, view_id: str, plan: ViewPlan) -> None:
+        """뷰 인덱스 전체 재생성"""
+        database_id = database.id
+        self._view_rows(database_id, view_id).delete(synchronize_session=False)
+
+        rule_parts = plan.rule_parts
+        signature = plan.sort_signature
+        # 길이 제한을 넘는 키는 같은 앞부분을 가진 레코드를 모두 모은 뒤 순위를 매긴다
+        long_keys: Dict[int, str] = {}
+        last_id = 0
+        while True:
+            batch = (
+                self.db.query(DatabaseRecord.id, DatabaseRecord.data, DatabaseRecord.computed)
+                .filter(DatabaseRecord.database_id == database_id,
+                        DatabaseRecord.id > last_id)
+                .order_by(DatabaseRecord.id)
+                .limit(REBUILD_BATCH_SIZE)
+                .all()
+            )
+            if not batch:
+                break
+
+            keys = {}
+            for record_id, data, computed in batch:
+                # 수식/롤업 프로퍼티로도 정렬할 수 있도록 계산 값을 합쳐서 인코딩
+                full_key = encode_sort_key(rule_parts, {**(data or {}), **(computed or {})})
+                if len(full_key) <= KEY_PREFIX_LENGTH:
+                    keys[record_id] = full_key
+                else:
+                    long_keys[record_id] = full_key
+            self._insert_rows(database_id, view_id, signature, keys)
+            last_id = batch[-1][0]
+
+        self._insert_rows(database_id, view_id, signature, tie_ranked_keys(long_keys))
+        self.db.commit()
+
+    def on_record_saved(self, database: Database, record: DatabaseRecord) -> None:
+        """레코드 생성/수정 시 해당 레코드의 인덱스 행만 갱신"""
+        self.save_records(database, [record])
+        self.db.commit()
+
+    def on_records_saved(self, records: Iterable[DatabaseRecord]) -> None:
+        """여러 데이터베이스에 걸친 레코드들의 인덱스 행 갱신"""
+        self.save_all(records)
+        self.db.commit()
+
+    def save_all(self, records: Iterable[DatabaseRecord]) -> None:
+        """여러 데이터베이스에 걸친 레코드들의 인덱스 행 갱신 (커밋은 호출한 쪽에서)"""
+        by_database = defaultdict(list)
+        for record in records:
+            by_database[record.database_id].append(record)
+        if not by_database:
+            return
+
+        for database in self.db.query(Database).filter(Database.id.in_(list(by_database))):
+            self.save_records(database, by_database[database.id])
+
+    def save_records(self, database: Database, records: List[DatabaseRecord]) -> None:
+        """한 데이터베이스 레코드들의 인덱스 행을 뷰마다 일괄 UPDATE/INSERT (커밋은 호출한 쪽에서)"""
+        if not records:
+            return
+
+        for view_id, plan in get_view_plans(database).sorted_views().items():
+            signature = plan.sort_signature
+            # 아직 만들어지지 않았거나 오래된 인덱스는 다음 조회 때 다시 만든다
+            if self.stored_signature(database.id, view_id) != signature:
+                continue
+
+            rule_parts = plan.rule_parts
+            for start in range(0, len(records), REBUILD_BATCH_SIZE):
+                batch = records[start:start + REBUILD_BATCH_SIZE]
+                existing = dict(
+                    self.db.query(DatabaseViewIndex.record_id, DatabaseViewIndex.id)
+                    .filter(DatabaseViewIndex.database_id == database.id,
+                            DatabaseViewIndex.view_id == view_id,
+                            DatabaseViewIndex.record_id.in_([record.id for record in batch]))
+                )
+                keys, updates = self._stored_keys(database.id, view_id, rule_parts, {
+                    record.id: encode_sort_key(rule_parts, record_values(record)) for record in batch
+                })
+                inserts = {}
+                for record_id, sort_key in keys.items():
+                    if record_id in existing:
+                        updates.append({"id": existing[record_id], "sort_key": sort_key})
+                    else:
+                        inserts[record_id] = sort_key
+                self.db.bulk_update_mappings(DatabaseViewIndex, updates)
+                self._insert_rows(database.id, view_id, signature, inserts)
+
+    def _stored_keys(self,
+                     database_id: int,
+                     view_id: str,
+                     rule_parts: List[Tuple[str, Callable[[Any], Any], bool]],
+                     full_keys: Dict[int, str]) -> Tuple[Dict[int, str], List[Dict]]:
+        """바뀐 레코드들의 (저장할 키, 순위가 바뀐 다른 인덱스 행의 UPDATE 매핑)
+
+        길이 제한을 넘는 키는 같은 앞부분을 가진 기존 행의 레코드도 읽어서
+        전체 키를 다시 계산한 뒤 함께 순위를 매긴다.
+        """
+        updates = []
+        prefixes = {key[:KEY_PREFIX_LENGTH] for key in full_keys.values() if len(key) > KEY_PREFIX_LENGTH}
+        others: Dict[int, Tuple[int, str]] = {}  # 레코드 id -> (인덱스 행 id, 저장된 키)
+        for prefix in prefixes:
+            for row_id, record_id, sort_key in (
+                self.db.query(DatabaseViewIndex.id, DatabaseViewIndex.record_id, DatabaseViewIndex.sort_key)
+                .filter(DatabaseViewIndex.database_id == database_id,
+                        DatabaseViewIndex.view_id == view_id,
+                        DatabaseViewIndex.sort_key >= prefix,
+                        DatabaseViewIndex.sort_key < prefix + "g")  # 16진 문자 다음
+            ):
+                if record_id not in full_keys:
+                    others[record_id] = (row_id, sort_key)
+        if not others:
+            return tie_ranked_keys(full_keys), updates
+
+        keys = dict(full_keys)
+        for record_id, data, computed in (
+            self.db.query(DatabaseRecord.id, DatabaseRecord.data, DatabaseRecord.computed)
+            .filter(DatabaseRecord.id.in_(list(others)))
+        ):
+            keys[record_id] = encode_sort_key(rule_parts, {**(data or {}), **(computed or {})})
+        stored = tie_ranked_keys(keys)
+        for record_id, (row_id, sort_key) in others.items():
+            if record_id in stored and stored[record_id] != sort_key:
+                updates.append({"id": row_id, "sort_key": stored[record_id]})
+        return {record_id: stored[record_id] for record_id in full_keys}, updates
+
+    def _insert_rows(self, database_id: int, view_id: str, signature: str, keys: Dict[int, str]) -> None:
+        self.db.bulk_insert_mappings(DatabaseViewIndex, [
+            {
+                "database_id": database_id,
+                "view_id": view_id,
+                "record_id": record_id,
+                "signature": signature,
+                "sort_key": sort_key,
+            }
+            for record_id, sort_key in keys.items()
+        ])
+
+    def on_record_deleted(self, database_id: int, record_id: int) -> None:
+        """레코드 삭제 시 모든 뷰 인덱스에서 제거"""
+        self.delete_records(database_id, [record_id])
+        self.db.commit()
+
+    def delete_records(self, database_id: int, record_ids: List[int]) -> None:
+        """레코드들을 모든 뷰 인덱스에서 제거 (커밋은 호출한 쪽에서)"""
+        for start in range(0, len(record_ids), REBUILD_BATCH_SIZE):
+            (
+                self.db.query(DatabaseViewIndex)
+                .filter(DatabaseViewIndex.database_id == database_id,
+                        DatabaseViewIndex.record_id.in_(record_ids[start:start + REBUILD_BATCH_SIZE]))
+                .delete(synchronize_session=False)
+            )
+
+    def _view_rows(self, database_id: int, view_id: str) -> Query:
+        return self.db.query(DatabaseViewIndex).filter(
+            DatabaseViewIndex.database_id == database_id,
+            DatabaseViewIndex.view_id == view_id
+        )
+
+    def stored_signature(self, database_id: int, view_id: str) -> Optional[str]:
+        """뷰 인덱스를 만들 때 사용한 정렬 서명 (인덱스가 없으면 None)"""
+        row = (
+            self.db.query(DatabaseViewIndex.signature)
+            .filter(DatabaseViewIndex.database_id == database_id,
+                    DatabaseViewIndex.view_id == view_id)
+            .first()
+        )
+        return row[0] if row else None
+
+    def _has_records(self, database_id: int) -> bool:
+        return (
+            self.db.query(DatabaseRecord.id)
+            .filter(DatabaseRecord.database_id == database_id)
+            .first()
+        ) is not None
@@ -0,0 +1,151 @@
+# backend/app/services/database_view_plan.py
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.cache import LRUCache
+from app.models.database import Database
+from app.services.database.database_dependency import computed_version
+from app.services.database.database_filter import DatabaseFilter, filter_hash, normalize_filters
+from app.services.database.database_filter_sql import FilterSQLTranslator
+from app.services.database.database_property_index import indexed_properties
+from app.services.database.database_schema import computed_properties, schema_properties
+from app.services.database.database_sort import DatabaseSort, build_option_ranks, sort_signature
+from app.services.database.database_view_query import ViewQuery
+
+# 캐시에 두는 데이터베이스 버전 수와 컴파일된 뷰 계획 수
+VIEW_PLAN_CACHE_SIZE = 256
+COMPILED_VIEW_CACHE_SIZE = 1024
+
+# 데이터베이스 버전별 뷰 실행 계획 {(database_id, updated_at): DatabasePlans}
+_view_plans = LRUCache(VIEW_PLAN_CACHE_SIZE)
+# 컴파일된 뷰 계획 {(스키마 해시, 뷰 정의 해시): ViewPlan}
+_compiled_views = LRUCache(COMPILED_VIEW_CACHE_SIZE)
+
+# 실행 계획에 영향이 없는 뷰 설정 키 (이 값만 다른 뷰는 계획을 공유한다)
+_PRESENTATION_KEYS = ("name",)
+
+
+class ViewPlan:
+    """뷰 정의 하나를 미리 컴파일한 실행 계획
+
+    필터는 정규화한 뒤 방언별 SQL 조건과 잔여 조건 함수로 한 번만 변환하고,
+    정렬 규칙별 키 함수와 정렬 설정 해시, 표시할 컬럼도 미리 계산해 둔다.
+    """
+
+    def __init__(self,
+                 view: Dict[str, Any],
+                 schema: Optional[Dict],
+                 option_ranks: Dict[str, Dict[str, int]],
+                 indexed: FrozenSet[str],
+                 computed: FrozenSet[str] = frozenset()):
+        self.view = view
+        self.indexed = indexed
+        self.computed = computed
+        self.filters = normalize_filters(view.get("filters"))
+        self.sorts: List[Dict] = view.get("sorts") or []
+        # 정렬 규칙별 (프로퍼티명, 값 키 함수, 내림차순 여부)와 뷰 인덱스 서명
+        self.rule_parts = DatabaseSort(option_ranks).rule_parts(self.sorts)
+        self.sort_signature = None
+        if self.sorts:
+            # 계산 프로퍼티로 정렬하면 수식/롤업 설정이 바뀔 때 인덱스를 다시 만든다
+            sorts_computed = any(rule.get("property") in computed for rule in self.sorts)
+            version = computed_version(schema) if sorts_computed else None
+            self.sort_signature = sort_signature(self.sorts, option_ranks, version)
+        self.columns = view_columns(view, schema)
+        self.query = ViewQuery(view, schema)
+        # 방언별 (SQL 조건, 잔여 조건 함수)
+        self._translations: Dict[str, Tuple[Optional[ColumnElement], Optional[Callable[[Dict], bool]]]] = {}
+
+    def translate(self, dialect_name: str) -> Tuple[Optional[ColumnElement], Optional[Callable[[Dict], bool]]]:
+        """뷰 필터의 (SQL 조건, 메모리에서 검사할 잔여 조건 함수)"""
+        translation = self._translations.get(dialect_name)
+        if translation is None:
+            where, residual = FilterSQLTranslator(
+                dialect_name, self.indexed, self.computed
+            ).translate(self.filters)
+            predicate = DatabaseFilter().compile(residual) if residual is not None else None
+            translation = self._translations[dialect_name] = (where, predicate)
+        return translation
+
+
+class DatabasePlans:
+    """데이터베이스 한 버전(updated_at)의 스키마 해석 결과와 뷰별 실행 계획
+
+    계획은 (스키마 해시, 정의 해시)로 캐시해서 다시 쓰므로 뷰를 복제하거나 다른
+    뷰만 고쳤을 때 바뀌지 않은 계획은 다시 컴파일하지 않는다.
+    """
+
+    def __init__(self, database: Database, built_indexes: Optional[Iterable[str]] = None):
+        self.schema = database.schema
+        self.properties = schema_properties(database.schema)
+        indexed = indexed_properties(database.schema, database.views)
+        if built_indexes is not None:
+            # 인덱스가 아직 만들어지지 않은 프로퍼티는 인덱스 없는 식으로 비교한다
+            indexed &= set(built_indexes)
+        self.indexed = frozenset(indexed)
+        # 값이 computed 컬럼에 있는 수식/롤업 프로퍼티
+        self.computed = frozenset(computed_properties(database.schema))
+        self.option_ranks = build_option_ranks(database.schema)
+        self.digest = filter_hash({"schema": database.schema, "indexed": sorted(self.indexed)})
+
+        # 정의 해시 -> 계획 (정의가 같은 뷰는 같은 계획 객체)
+        self.by_definition: Dict[str, ViewPlan] = {}
+        self.views: Dict[str, ViewPlan] = {}
+        for view_id, view in (database.views or {}).items():
+            if not isinstance(view, dict):
+                continue
+            digest = definition_hash(view)
+            plan = self.by_definition.get(digest) or _compiled_views.get((self.digest, digest))
+            if plan is None:
+                plan = ViewPlan(view, database.schema, self.option_ranks, self.indexed, self.computed)
+                _compiled_views.set((self.digest, digest), plan)
+            self.by_definition[digest] = plan
+            self.views[view_id] = plan
+
+    def view(self, view_id: str) -> Optional[ViewPlan]:
+        return self.views.get(view_id)
+
+    def sorted_views(self) -> Dict[str, ViewPlan]:
+        """정렬 설정이 있는 뷰의 계획 {view_id: plan}"""
+        return {view_id: plan for view_id, plan in self.views.items() if plan.sorts}
+
+
+def definition_hash(view: Dict[str, Any]) -> str:
+    """표시 이름 등을 뺀 뷰 정의의 해시"""
+    return filter_hash({key: value for key, value in view.items() if key not in _PRESENTATION_KEYS})
+
+
+def view_columns(view: Dict[str, Any], schema: Optional[Dict]) -> Optional[List[str]]:
+    """뷰에 표시되는 프로퍼티 (설정이 없으면 None = 전체)
+
+    보드의 group_by와 캘린더의 date_property는 표시 목록에 없어도 포함한다.
+    """
+    visible = view.get("properties")
+    if not isinstance(visible, list):
+        return None
+    properties = schema_properties(schema)
+    columns = [name for name in visible if name in properties]
+    for name in (view.get("group_by"), view.get("date_property")):
+        if name and name not in columns:
+            columns.append(name)
+    return columns
+
+
+def get_view_plans(database: Database) -> DatabasePlans:
+    """데이터베이스의 뷰 실행 계획 (데이터베이스 버전별로 캐시)"""
+    key = (database.id, database.updated_at)
+    plans = _view_plans.get(key)
+    if plans is None:
+        built = {index.property_name for index in database.property_indexes if index.ready}
+        plans = DatabasePlans(database, built)
+        _view_plans.set(key, plans)
+    return plans
+
+
+def invalidate_view_plans(database_id: Any) -> None:
+    """스키마/뷰 변경이나 보조 인덱스 생성 후 데이터베이스의 실행 계획을 만료
+    (바뀌지 않은 뷰 계획은 다시 쓴다)
+
+    updated_at이 초 단위로 저장되면 같은 초 안의 변경은 버전이 같으므로 직접 만료한다.
+    """
+    _view_plans.discard(lambda key: key[0] == database_id)
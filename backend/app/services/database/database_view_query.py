@@ -0,0 +1,156 @@
+# backend/app/services/database_view_query.py
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from collections import Counter, defaultdict
+from datetime import datetime
+
+from app.models.database import DatabaseRecord
+from app.services.database.database_filter import FilterGroup, normalize_filters
+from app.services.database.database_schema import option_names, schema_properties
+
+# 보드로 묶을 수 있는 프로퍼티 타입
+GROUPABLE_TYPES = ("select", "multi_select", "person")
+
+
+def group_keys(value: Any) -> List[Optional[str]]:
+    """보드 그룹 키 목록 (다중 선택/여러 사람은 각 값의 그룹에, 빈 값은 None 그룹에)"""
+    values = value if isinstance(value, list) else [value]
+    keys = []
+    for item in values:
+        if isinstance(item, dict):  # 사람 프로퍼티 {"id": ..., "name": ...}
+            item = item.get("id", item.get("name"))
+        if item is None or item == "":
+            continue
+        key = str(item)
+        if key not in keys:
+            keys.append(key)
+    return keys or [None]
+
+
+def combine_filters(*filters: Any) -> Optional[Dict]:
+    """여러 필터(요청 필터, 그룹 조건 등)를 AND로 결합"""
+    groups = [normalize_filters(item) for item in filters]
+    groups = [group for group in groups if group]
+    if len(groups) < 2:
+        return groups[0] if groups else None
+    return {"type": FilterGroup.AND, "conditions": groups}
+
+
+def record_date(value: Any) -> Optional[datetime]:
+    """날짜 프로퍼티 값을 datetime으로 (해석할 수 없으면 None)
+
+    시간대가 있는 값도 적힌 현지 날짜/시각 그대로 쓴다. 캘린더 범위 조회가 저장된
+    문자열로 비교하므로 월/일 구간도 같은 기준이어야 한다.
+    """
+    if isinstance(value, dict):  # {"start": ..., "end": ...} 형태의 기간
+        value = value.get("start")
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed.replace(tzinfo=None)
+
+
+class ViewQuery:
+    """뷰 설정에 따라 레코드를 한 번 훑으면서 페이지, 그룹별 개수, 월별 개수를 함께 계산
+
+    레코드는 이미 필터가 적용되고 뷰 순서로 정렬된 스트림으로 받는다.
+    그룹은 뷰의 group_by 프로퍼티, 월 구간은 date_property 기준이다.
+    """
+
+    def __init__(self, view: Dict[str, Any], schema: Optional[Dict], group_by: Optional[str] = None):
+        self.view = view
+        self.group_by = group_by or view.get("group_by")
+        self.date_property = view.get("date_property")
+        group_config = schema_properties(schema).get(self.group_by) or {}
+        self.group_type = group_config.get("type")
+        self.group_order = option_names(group_config)
+
+    def query_fields(self, fields: Optional[List[str]]) -> Optional[List[str]]:
+        """fields로 조회할 때 함께 읽어야 하는 프로퍼티 (그룹/날짜 구간 계산용)"""
+        if fields is None:
+            return None
+        extra = [name for name in (self.group_by, self.date_property) if name and name not in fields]
+        return list(fields) + extra
+
+    def run(self, records: Iterable[DatabaseRecord], skip: int = 0, limit: int = 100) -> Dict[str, Any]:
+        """[skip, skip + limit) 구간 레코드와 전체 개수, 그룹/월별 개수"""
+        window: List[DatabaseRecord] = []
+        total = 0
+        groups: Counter = Counter()
+        buckets: Counter = Counter()
+        for record in records:
+            if skip <= total < skip + limit:
+                window.append(record)
+            total += 1
+
+            if self.group_by or self.date_property:
+                values = {**record.field_data(), **(record.computed or {})}
+                if self.group_by:
+                    groups.update(group_keys(values.get(self.group_by)))
+                if self.date_property:
+                    date = record_date(values.get(self.date_property))
+                    if date is not None:
+                        buckets[date.strftime("%Y-%m")] += 1
+
+        return {
+            "records": window,
+            "total": total,
+            "groups": self.ordered_groups(groups) if self.group_by else None,
+            "date_buckets": dict(sorted(buckets.items())) if self.date_property else None,
+        }
+
+    def board(self, records: Iterable[DatabaseRecord], per_group: int) -> List[Dict[str, Any]]:
+        """그룹별 레코드 수와 뷰 순서상 앞쪽 per_group개 카드 (한 번 훑어서 계산)
+
+        다중 선택처럼 값이 여러 개인 레코드는 해당하는 모든 그룹에 들어간다.
+        """
+        counts: Counter = Counter()
+        cards: Dict[Optional[str], List[DatabaseRecord]] = defaultdict(list)
+        for record in records:
+            for key in group_keys(record.field_data().get(self.group_by)):
+                counts[key] += 1
+                if len(cards[key]) < per_group:
+                    cards[key].append(record)
+
+        groups = self.ordered_groups(counts)
+        for group in groups:
+            group["records"] = cards.get(group["value"], [])
+        return groups
+
+    def calendar(self, records: Iterable[DatabaseRecord]) -> Dict[str, List[DatabaseRecord]]:
+        """date_property 기준 날짜별 레코드 {"YYYY-MM-DD": [...]} (날짜를 해석할 수 없으면 제외)"""
+        dated = []
+        for record in records:
+            date = record_date(record.field_data().get(self.date_property))
+            if date is not None:
+                dated.append((date, record.id, record))
+        dated.sort(key=lambda item: item[:2])
+
+        days: Dict[str, List[DatabaseRecord]] = defaultdict(list)
+        for date, _, record in dated:
+            days[date.strftime("%Y-%m-%d")].append(record)
+        return dict(days)
+
+    def group_filter(self, key: Optional[str]) -> Optional[Dict]:
+        """SQL로 내려보낼 수 있는 그룹 조건 (단일 선택 값만)"""
+        if self.group_type == "select" and key is not None:
+            return {"property": self.group_by, "operator": "equals", "value": key}
+        return None
+
+    def group_predicate(self, key: Optional[str]) -> Callable[[Dict], bool]:
+        """레코드 data가 그룹에 속하는지 검사하는 조건"""
+        group_by = self.group_by
+        return lambda data: key in group_keys(data.get(group_by))
+
+    def ordered_groups(self, counts: Dict[Optional[str], int]) -> List[Dict[str, Any]]:
+        """스키마 옵션 순서, 옵션에 없는 값(이름순), 빈 값 그룹 순서로 정렬한 그룹 목록
+
+        레코드가 없는 옵션도 보드 컬럼으로 보여야 하므로 개수 0으로 포함한다.
+        """
+        keys = list(self.group_order)
+        keys += sorted(key for key in counts if key is not None and key not in self.group_order)
+        if None in counts:
+            keys.append(None)
+        return [{"value": key, "count": counts.get(key, 0)} for key in keys]
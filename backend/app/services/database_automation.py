@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 from enum import Enum
 import asyncio
 from app.core.config import settings
+from app.services.database.database_filter import DatabaseFilter
 
 
 class TriggerType(str, Enum):
@@ -66,6 +67,17 @@ class DatabaseAutomation:
             if await self._check_conditions(rule.conditions, record):
                 await self._execute_actions(rule.actions, record, database_id)
 
+    async def handle_events(self, event_type: TriggerType, records: List[Dict], database_id: str):
+        """여러 레코드에 대한 같은 이벤트를 한 번에 처리 (규칙마다 조건을 한 번에 검사)"""
+        rules = [r for r in self._rules if r.enabled and r.trigger["type"] == event_type]
+        if not records or not rules:
+            return
+
+        for rule in rules:
+            matched = DatabaseFilter().apply_filters(records, rule.conditions) if rule.conditions else records
+            for record in matched:
+                await self._execute_actions(rule.actions, record, database_id)
+
     async def _check_conditions(self, conditions: Optional[Dict], record: Dict) -> bool:
         """조건 검사"""
         if not conditions:
@@ -338,4 +350,8 @@ class DatabaseAutomation:
             }
         ]
     )
-    """
\ No newline at end of file
+    """
+
+
+# 레코드 이벤트를 받는 프로세스 공용 자동화 엔진
+database_automation = DatabaseAutomation()
\ No newline at end of file
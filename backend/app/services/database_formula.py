@@ -0,0 +1,304 @@
+# backend/app/services/database_formula.py
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from datetime import datetime
+from functools import lru_cache
+import ast
+import io
+import operator
+import tokenize
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 배치 계산도 행 단위로 처리
+    np = None
+
+# 컴파일된 수식을 보관하는 LRU 캐시 크기
+FORMULA_CACHE_SIZE = 512
+
+FORMULA_FUNCTIONS: Dict[str, Callable] = {
+    'now': lambda: datetime.now(),
+    'today': lambda: datetime.now().date(),
+    'concat': lambda *args: ''.join(str(arg) for arg in args),
+    'length': len,
+    'round': round,
+    'abs': abs,
+}
+
+BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+
+UNARY_OPERATORS = {
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+    ast.Not: operator.not_,
+}
+
+COMPARE_OPERATORS = {
+    ast.Gt: operator.gt,
+    ast.Lt: operator.lt,
+    ast.GtE: operator.ge,
+    ast.LtE: operator.le,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.In: lambda x, y: x in y,
+    ast.NotIn: lambda x, y: x not in y,
+}
+
+# 벡터화 계산이 가능한 연산자 (NumPy 배열에 그대로 적용)
+VECTOR_BINARY_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div)
+VECTOR_COMPARE_OPERATORS = (ast.Gt, ast.Lt, ast.GtE, ast.LtE, ast.Eq, ast.NotEq)
+
+# float64로 정확히 표현되는 정수 범위. 벗어나는 값은 행 단위로 계산
+_EXACT_FLOAT_LIMIT = 2 ** 53
+
+# if 는 파이썬 예약어이므로 파싱 전에 이 이름으로 바꿔서 처리
+_IF_FUNCTION = "if_"
+
+
+class CompiledFormula:
+    """한 번 파싱된 수식. 레코드 데이터에 바로 실행할 수 있다."""
+
+    __slots__ = ("expression", "tree", "properties", "error", "vectorized", "_fn")
+
+    def __init__(self,
+                 expression: str,
+                 tree: Optional[ast.AST] = None,
+                 properties: Tuple[str, ...] = (),
+                 fn: Optional[Callable[[Dict[str, Any]], Any]] = None,
+                 error: Optional[Exception] = None,
+                 vectorized: Optional[Callable] = None):
+        self.expression = expression
+        self.tree = tree
+        self.properties = properties
+        self.error = error
+        self.vectorized = vectorized
+        self._fn = fn
+
+    def __call__(self, record_data: Dict[str, Any]) -> Any:
+        if self.error is not None:
+            raise self.error
+        return self._fn(record_data)
+
+
+@lru_cache(maxsize=FORMULA_CACHE_SIZE)
+def compile_formula(expression: str) -> CompiledFormula:
+    """수식을 AST로 파싱한 뒤 클로저로 컴파일 (수식 텍스트 기준으로 캐시)"""
+    try:
+        tree = ast.parse(_rewrite_keywords(expression), mode="eval").body
+        properties: List[str] = []
+        fn = _compile_node(tree, properties)
+    except (SyntaxError, ValueError, tokenize.TokenError) as e:
+        return CompiledFormula(expression, error=e)
+
+    return CompiledFormula(
+        expression,
+        tree=tree,
+        properties=tuple(dict.fromkeys(properties)),
+        fn=fn,
+        vectorized=_compile_vector_node(tree) if np is not None else None
+    )
+
+
+def evaluate_batch(compiled: CompiledFormula,
+                   records_data: List[Dict[str, Any]],
+                   row_evaluator: Callable[[Dict[str, Any]], Any]) -> List[Any]:
+    """레코드 전체에 수식을 적용 (가능하면 컬럼 단위로 벡터화)
+
+    참조 필드를 컬럼 배열로 뽑아 한 번에 계산하고, 숫자가 아닌 값이 있거나
+    결과가 유한하지 않은 행(0으로 나누기 등)은 row_evaluator로 다시 계산한다.
+    """
+    records_data = [data or {} for data in records_data]
+    if compiled.vectorized is None or not compiled.properties or not records_data:
+        return [row_evaluator(data) for data in records_data]
+
+    valid = np.ones(len(records_data), dtype=bool)
+    columns = {}
+    for field_name in compiled.properties:
+        column, column_valid = _extract_column(records_data, field_name)
+        columns[field_name] = column
+        valid &= column_valid
+
+    with np.errstate(all="ignore"):
+        values = np.broadcast_to(compiled.vectorized(columns), valid.shape)
+    valid &= np.isfinite(values)
+
+    results = values.tolist()
+    for index in np.flatnonzero(~valid).tolist():
+        results[index] = row_evaluator(records_data[index])
+    return results
+
+
+def _extract_column(records_data: List[Dict[str, Any]], field_name: str):
+    """필드 값을 float 배열로 추출하고, 벡터 계산 가능한 행의 마스크를 함께 반환"""
+    raw = [data.get(field_name) for data in records_data]
+    column = np.array(
+        [value if type(value) in (int, float, bool) else None for value in raw],
+        dtype=float
+    )
+    # NaN(숫자가 아닌 값), 무한대, 큰 정수는 행 단위 계산과 결과가 다를 수 있음
+    with np.errstate(invalid="ignore"):
+        column_valid = np.abs(column) < _EXACT_FLOAT_LIMIT
+    return column, column_valid
+
+
+def _compile_vector_node(node: ast.AST) -> Optional[Callable[[Dict[str, Any]], Any]]:
+    """산술/비교 연산만으로 된 수식을 컬럼 배열 함수로 변환 (불가능하면 None)"""
+    if isinstance(node, ast.Constant):
+        if type(node.value) not in (int, float):
+            return None
+        value = float(node.value)
+        return lambda columns: value
+
+    field_name = property_reference(node)
+    if field_name is not None:
+        return lambda columns: columns[field_name]
+
+    if isinstance(node, ast.BinOp) and isinstance(node.op, VECTOR_BINARY_OPERATORS):
+        op = BINARY_OPERATORS[type(node.op)]
+        left = _compile_vector_node(node.left)
+        right = _compile_vector_node(node.right)
+        if left is None or right is None:
+            return None
+        return lambda columns: op(left(columns), right(columns))
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        op = UNARY_OPERATORS[type(node.op)]
+        operand = _compile_vector_node(node.operand)
+        if operand is None:
+            return None
+        return lambda columns: op(operand(columns))
+
+    if (isinstance(node, ast.Compare) and len(node.ops) == 1
+            and isinstance(node.ops[0], VECTOR_COMPARE_OPERATORS)):
+        op = COMPARE_OPERATORS[type(node.ops[0])]
+        left = _compile_vector_node(node.left)
+        right = _compile_vector_node(node.comparators[0])
+        if left is None or right is None:
+            return None
+        return lambda columns: op(left(columns), right(columns))
+
+    # concat, if 등 함수 호출과 문자열 연산은 행 단위로 계산
+    return None
+
+
+def _rewrite_keywords(expression: str) -> str:
+    """if(...) 호출을 파싱 가능한 이름으로 변경"""
+    tokens = list(tokenize.generate_tokens(io.StringIO(expression).readline))
+    rewritten = []
+    for index, token in enumerate(tokens):
+        string = token.string
+        if (token.type == tokenize.NAME and string == "if"
+                and index + 1 < len(tokens) and tokens[index + 1].string == "("):
+            string = _IF_FUNCTION
+        rewritten.append((token.type, string))
+    return tokenize.untokenize(rewritten)
+
+
+def property_reference(node: ast.AST) -> Optional[str]:
+    """prop("필드명") 노드이면 필드명 반환"""
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+            and node.func.id == "prop"):
+        if (len(node.args) != 1 or node.keywords
+                or not isinstance(node.args[0], ast.Constant)
+                or not isinstance(node.args[0].value, str)):
+            raise ValueError("prop()에는 필드명 문자열 하나만 전달할 수 있습니다")
+        return node.args[0].value
+    return None
+
+
+def _compile_node(node: ast.AST, properties: List[str]) -> Callable[[Dict[str, Any]], Any]:
+    """AST 노드를 레코드 데이터를 받는 함수로 변환"""
+    if isinstance(node, ast.Constant):
+        value = node.value
+        return lambda data: value
+
+    field_name = property_reference(node)
+    if field_name is not None:
+        properties.append(field_name)
+        return lambda data: data.get(field_name)
+
+    if isinstance(node, ast.BinOp) and type(node.op) in BINARY_OPERATORS:
+        op = BINARY_OPERATORS[type(node.op)]
+        left = _compile_node(node.left, properties)
+        right = _compile_node(node.right, properties)
+        return lambda data: op(left(data), right(data))
+
+    if isinstance(node, ast.UnaryOp) and type(node.op) in UNARY_OPERATORS:
+        op = UNARY_OPERATORS[type(node.op)]
+        operand = _compile_node(node.operand, properties)
+        return lambda data: op(operand(data))
+
+    if isinstance(node, ast.BoolOp):
+        values = [_compile_node(value, properties) for value in node.values]
+        is_and = isinstance(node.op, ast.And)
+
+        def bool_op(data):
+            result = None
+            for value in values:
+                result = value(data)
+                if bool(result) != is_and:
+                    return result
+            return result
+        return bool_op
+
+    if isinstance(node, ast.Compare):
+        left = _compile_node(node.left, properties)
+        comparisons = []
+        for op_node, comparator in zip(node.ops, node.comparators):
+            if type(op_node) not in COMPARE_OPERATORS:
+                raise ValueError(f"지원하지 않는 비교 연산자: {type(op_node).__name__}")
+            comparisons.append((COMPARE_OPERATORS[type(op_node)],
+                                _compile_node(comparator, properties)))
+
+        def compare(data):
+            left_value = left(data)
+            result = True
+            for op, comparator in comparisons:
+                right_value = comparator(data)
+                result = op(left_value, right_value)
+                if not result:
+                    return result
+                left_value = right_value
+            return result
+        return compare
+
+    if isinstance(node, ast.IfExp):
+        test = _compile_node(node.test, properties)
+        body = _compile_node(node.body, properties)
+        orelse = _compile_node(node.orelse, properties)
+        return lambda data: body(data) if test(data) else orelse(data)
+
+    if isinstance(node, (ast.List, ast.Tuple)):
+        elements = [_compile_node(element, properties) for element in node.elts]
+        container = list if isinstance(node, ast.List) else tuple
+        return lambda data: container(element(data) for element in elements)
+
+    if isinstance(node, ast.Subscript) and not isinstance(node.slice, ast.Slice):
+        value = _compile_node(node.value, properties)
+        index = _compile_node(node.slice, properties)
+        return lambda data: value(data)[index(data)]
+
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+        name = node.func.id
+        args = [_compile_node(arg, properties) for arg in node.args]
+
+        if name == _IF_FUNCTION:
+            if len(args) != 3:
+                raise ValueError("if()에는 조건, 참 값, 거짓 값이 필요합니다")
+            condition, true_val, false_val = args
+            return lambda data: true_val(data) if condition(data) else false_val(data)
+
+        if name in FORMULA_FUNCTIONS:
+            function = FORMULA_FUNCTIONS[name]
+            return lambda data: function(*[arg(data) for arg in args])
+
+        raise ValueError(f"알 수 없는 함수: {name}")
+
+    raise ValueError(f"지원하지 않는 수식 구문: {type(node).__name__}")
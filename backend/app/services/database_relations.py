@@ -1,8 +1,102 @@
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional, Set, Tuple
+from collections import defaultdict
+from sqlalchemy import and_, literal, literal_column, select, tuple_, union_all
 from sqlalchemy.orm import Session
-from app.models import Database, DatabaseRecord, RollupCache
+from app.models.database import Database, DatabaseRecord, DatabaseRelation
 from app.schemas.database import RelationConfig
+from app.services.database.database_schema import relation_targets
+
+# 한 번에 삭제/추가하는 관계 행 수
+RELATION_BATCH_SIZE = 1000
+
+# 원본 레코드의 (추가된 관련 레코드 id, 제거된 관련 레코드 id), None이면 무엇이 바뀌었는지 모름
+LinkChange = Optional[Tuple[Set[int], Set[int]]]
+
+
+class LinkChanges:
+    """관계 연결이 바뀐 레코드 (이 관계를 읽는 롤업을 다시 계산해야 한다, DependencyRecompute.run_links 참고)
+
+    추가/제거된 연결을 알면 롤업을 누적 상태로 증분 갱신하고, 모르면 그 레코드의
+    롤업은 관련 레코드 전체로 다시 계산한다.
+    """
+
+    def __init__(self):
+        # {(데이터베이스 id, 관계 프로퍼티명): {원본 레코드 id: LinkChange}}
+        self.sources: Dict[Tuple[int, str], Dict[int, LinkChange]] = defaultdict(dict)
+        # 연결이 제거된 관련 레코드 중 삭제된 레코드의 삭제 전 값 (record_values)
+        self.removed_values: Dict[int, Dict[str, Any]] = {}
+
+    def link(self, database_id: int, relation_property: str, source_id: int,
+             added: Iterable[int] = (), removed: Iterable[int] = ()) -> None:
+        sources = self.sources[(database_id, relation_property)]
+        if source_id in sources and sources[source_id] is None:
+            return
+        added_ids, removed_ids = sources.setdefault(source_id, (set(), set()))
+        added_ids.update(added)
+        removed_ids.update(removed)
+
+    def touch(self, database_id: int, relation_property: str, source_ids: Iterable[int]) -> None:
+        """연결이 어떻게 바뀌었는지 모르는 레코드 (롤업을 다시 계산한다)"""
+        sources = self.sources[(database_id, relation_property)]
+        for source_id in source_ids:
+            sources[source_id] = None
+
+    def __bool__(self) -> bool:
+        return any(self.sources.values())
+
+
+class RelationGraph:
+    """데이터베이스 간 관계 인접 맵 (스키마의 relation_config 기준, 프로세스 메모리)
+
+    처음 사용할 때 전체 스키마를 한 번 읽고, 이후에는 스키마가 바뀔 때 해당
+    데이터베이스의 간선만 갱신한다.
+    """
+
+    def __init__(self):
+        self.edges: Dict[int, Set[int]] = {}
+        self.loaded = False
+
+    def ensure(self, db: Session) -> "RelationGraph":
+        if not self.loaded:
+            self.edges = {
+                database_id: relation_targets(schema)
+                for database_id, schema in db.query(Database.id, Database.schema)
+            }
+            self.loaded = True
+        return self
+
+    def refresh(self, database_id: int, schema: Optional[Dict]) -> None:
+        """데이터베이스 생성/스키마 변경 시 간선 갱신"""
+        if self.loaded:
+            self.edges[database_id] = relation_targets(schema)
+
+    def remove(self, database_id: int) -> None:
+        self.edges.pop(database_id, None)
+
+    def closes_cycle(self, source_database_id: int, target_database_id: int) -> bool:
+        """source -> target 관계를 추가하면 다른 데이터베이스를 거쳐 돌아오는 순환이 생기는지
+
+        target에서 source로 돌아가는 경로 중 바로 돌아오는 간선(양방향 관계의 역방향)보다
+        긴 것이 있는지 본다. 자기 참조 간선은 무시한다.
+        """
+        if source_database_id == target_database_id:
+            return False
+        seen = {source_database_id, target_database_id}
+        stack = [node for node in self.edges.get(target_database_id, ()) if node not in seen]
+        seen.update(stack)
+        while stack:
+            node = stack.pop()
+            for target in self.edges.get(node, ()):
+                if target == source_database_id:
+                    return True
+                if target not in seen:
+                    seen.add(target)
+                    stack.append(target)
+        return False
+
+
+relation_graph = RelationGraph()
 
 class DatabaseRelationManager:
     def __init__(self, db: Session):
@@ -14,36 +108,30 @@ class DatabaseRelationManager:
                                    related_ids: List[int],
                                    relation_config: RelationConfig) -> None:
         """관계형 프로퍼티 업데이트 처리"""
-        # 기존 관계 삭제
-        self.db.execute(
-            """DELETE FROM database_relations 
-               WHERE source_record_id = :record_id 
-               AND relation_type = :property_name""",
-            {"record_id": record_id, "property_name": property_name}
-        )
+        await self.bulk_link(property_name, {record_id: related_ids}, relation_config)
 
-        # 새로운 관계 추가
-        for related_id in related_ids:
-            self.db.execute(
-                """INSERT INTO database_relations 
-                   (source_record_id, target_record_id, relation_type)
-                   VALUES (:source_id, :target_id, :relation_type)""",
-                {
-                    "source_id": record_id,
-                    "target_id": related_id,
-                    "relation_type": property_name
-                }
-            )
+    async def bulk_link(self,
+                        property_name: str,
+                        links: Dict[int, List[int]],
+                        relation_config: RelationConfig) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """여러 레코드의 관계를 한 트랜잭션에서 갱신 {원본 레코드 id: 관련 레코드 id 목록}
 
-        # 양방향 관계 처리
-        if relation_config.reverse_property:
-            await self._handle_reverse_relation(
-                record_id, related_ids,
-                relation_config.reverse_property
-            )
+        기존 관계와 비교해서 바뀐 연결만 일괄 삭제/추가하고,
+        추가/삭제된 (원본 레코드 id, 관련 레코드 id) 목록을 반환한다.
+        """
+        try:
+            added, removed = self._sync_links(links, property_name)
+
+            # 양방향 관계 처리
+            if relation_config.reverse_property:
+                await self._handle_reverse_relation(links, relation_config.reverse_property)
+
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
 
-        # 관련 롤업 값 업데이트
-        await self._update_related_rollups(record_id, property_name)
+        return added, removed
 
     async def get_related_records(self,
                                   record_id: int,
@@ -61,158 +149,182 @@ class DatabaseRelationManager:
         return [dict(record) for record in records]
 
     async def _handle_reverse_relation(self,
-                                       source_id: int,
-                                       target_ids: List[int],
+                                       links: Dict[int, List[int]],
                                        reverse_property: str) -> None:
-        """양방향 관계 처리"""
-        # 기존 역방향 관계 삭제
-        self.db.execute(
-            """DELETE FROM database_relations 
-               WHERE target_record_id = :source_id 
-               AND relation_type = :reverse_property""",
-            {"source_id": source_id, "reverse_property": reverse_property}
-        )
-
-        # 새로운 역방향 관계 추가
-        for target_id in target_ids:
-            self.db.execute(
-                """INSERT INTO database_relations 
-                   (source_record_id, target_record_id, relation_type)
-                   VALUES (:target_id, :source_id, :reverse_property)""",
-                {
-                    "target_id": target_id,
-                    "source_id": source_id,
-                    "reverse_property": reverse_property
-                }
+        """양방향 관계 처리 (관련 레코드 -> 원본 레코드 방향의 연결)"""
+        self._sync_links(links, reverse_property, reverse=True)
+
+    def _sync_links(self,
+                    links: Dict[int, List[int]],
+                    relation_type: str,
+                    reverse: bool = False) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """레코드별 연결 목록을 저장된 관계와 비교해서 차이만 반영
+
+        추가/삭제된 (links 키, 상대 레코드 id) 목록을 반환한다.
+
+        reverse이면 links의 키가 target_record_id 쪽인 역방향 관계를 다룬다.
+        """
+        columns = DatabaseRelation.c
+        owner, other = columns.source_record_id, columns.target_record_id
+        if reverse:
+            owner, other = other, owner
+
+        desired = {record_id: set(related_ids) for record_id, related_ids in links.items()}
+        existing = defaultdict(set)
+        owner_ids = list(desired)
+        for start in range(0, len(owner_ids), RELATION_BATCH_SIZE):
+            rows = self.db.execute(
+                select([owner, other]).where(and_(
+                    owner.in_(owner_ids[start:start + RELATION_BATCH_SIZE]),
+                    columns.relation_type == relation_type
+                ))
             )
-
-    async def _update_related_rollups(self,
-                                      record_id: int,
-                                      relation_property: str) -> None:
-        """관련된 롤업 값들 업데이트"""
-        # 해당 레코드와 관련된 모든 롤업 프로퍼티 찾기
-        rollups = self.db.execute(
-            """SELECT rc.* FROM rollup_cache rc
-               JOIN database_relations rel 
-               ON rc.record_id = rel.source_record_id
-               WHERE rel.target_record_id = :record_id
-               AND rel.relation_type = :relation_property""",
-            {"record_id": record_id, "relation_property": relation_property}
-        ).fetchall()
-
-        # 각 롤업 값 재계산
-        from app.services.database_compute import DatabaseCompute
-        compute_service = DatabaseCompute()
-
-        for rollup in rollups:
-            record = self.db.query(DatabaseRecord).get(rollup.record_id)
-            if not record:
-                continue
-
-            # 관련 레코드들 가져오기
-            related_records = await self.get_related_records(
-                record.id,
-                rollup.property_name
+            for owner_id, other_id in rows:
+                existing[owner_id].add(other_id)
+
+        removed = [
+            (owner_id, other_id)
+            for owner_id, other_ids in existing.items()
+            for other_id in other_ids - desired[owner_id]
+        ]
+        added = [
+            (owner_id, other_id)
+            for owner_id, related_ids in links.items()
+            for other_id in dict.fromkeys(related_ids)
+            if other_id not in existing[owner_id]
+        ]
+
+        for start in range(0, len(removed), RELATION_BATCH_SIZE):
+            self.db.execute(
+                DatabaseRelation.delete().where(and_(
+                    columns.relation_type == relation_type,
+                    tuple_(owner, other).in_(removed[start:start + RELATION_BATCH_SIZE])
+                ))
             )
 
-            # 롤업 값 재계산
-            new_value = await compute_service.compute_rollup(
-                record.rollup_cache.get(rollup.property_name, {}),
-                related_records,
-                rollup.property_name
+        # executemany: 드라이버가 여러 행 VALUES 하나로 묶어서 전송
+        for start in range(0, len(added), RELATION_BATCH_SIZE):
+            self.db.execute(DatabaseRelation.insert(), [
+                {owner.name: owner_id, other.name: other_id, "relation_type": relation_type}
+                for owner_id, other_id in added[start:start + RELATION_BATCH_SIZE]
+            ])
+
+        return added, removed
+
+    async def handle_record_removal(self, record_id: int) -> LinkChanges:
+        """레코드 삭제 전에 관계를 정리하고, 이 레코드를 참조하던 레코드의 연결 변경을 반환"""
+        try:
+            referrers = self.detach_records([record_id])
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return referrers
+
+    def detach_records(self, record_ids: Iterable[int]) -> LinkChanges:
+        """삭제할 레코드들의 관계 행 제거 (커밋은 호출한 쪽에서)
+
+        삭제되지 않는 레코드 중 이 레코드들을 관계로 참조하던 레코드의 연결 변경
+        (삭제된 레코드의 값 포함)을 반환한다.
+        """
+        columns = DatabaseRelation.c
+        record_ids = list(record_ids)
+        referrers = self.referrers(record_ids)
+        for start in range(0, len(record_ids), RELATION_BATCH_SIZE):
+            batch = record_ids[start:start + RELATION_BATCH_SIZE]
+            self.db.execute(DatabaseRelation.delete().where(
+                columns.source_record_id.in_(batch) | columns.target_record_id.in_(batch)
+            ))
+        return referrers
+
+    def referrers(self, record_ids: List[int]) -> LinkChanges:
+        """record_ids를 관계로 참조하는 (record_ids 밖의) 레코드를 관계별로 한 번에 조회
+
+        record_ids로의 연결이 제거되는 것으로 보고, 제거되는 레코드의 현재 값을 함께 담는다.
+        """
+        columns = DatabaseRelation.c
+        source = DatabaseRecord.__table__.alias("source")
+        target = DatabaseRecord.__table__.alias("target")
+        removing = set(record_ids)
+        referrers = LinkChanges()
+        for start in range(0, len(record_ids), RELATION_BATCH_SIZE):
+            batch = record_ids[start:start + RELATION_BATCH_SIZE]
+            rows = self.db.execute(
+                select([source.c.database_id, columns.relation_type, columns.source_record_id,
+                        target.c.id, target.c.data, target.c.computed])
+                .select_from(
+                    DatabaseRelation
+                    .join(source, source.c.id == columns.source_record_id)
+                    .join(target, target.c.id == columns.target_record_id)
+                )
+                .where(columns.target_record_id.in_(batch))
             )
-
-            # 캐시 업데이트
-            self.db.query(RollupCache).filter_by(
-                id=rollup.id
-            ).update({
-                "value": new_value,
-                "updated_at": datetime.utcnow()
-            })
+            for database_id, relation_type, source_id, target_id, data, computed in rows:
+                if source_id not in removing:
+                    referrers.link(database_id, relation_type, source_id, removed=[target_id])
+                    referrers.removed_values[target_id] = {**(data or {}), **(computed or {})}
+        return referrers
 
     async def get_bidirectional_relations(self,
                                           record_id: int) -> Dict[str, List[int]]:
         """양방향 관계 정보 조회"""
-        forward_relations = self.db.execute(
-            """SELECT relation_type, target_record_id 
-               FROM database_relations
-               WHERE source_record_id = :record_id""",
-            {"record_id": record_id}
-        ).fetchall()
-
-        backward_relations = self.db.execute(
-            """SELECT relation_type, source_record_id 
-               FROM database_relations
-               WHERE target_record_id = :record_id""",
-            {"record_id": record_id}
-        ).fetchall()
-
-        relations = {}
-
-        # 정방향 관계 처리
-        for rel_type, target_id in forward_relations:
-            if rel_type not in relations:
-                relations[rel_type] = []
-            relations[rel_type].append(target_id)
-
-        # 역방향 관계 처리
-        for rel_type, source_id in backward_relations:
-            reverse_key = f"reverse_{rel_type}"
-            if reverse_key not in relations:
-                relations[reverse_key] = []
-            relations[reverse_key].append(source_id)
+        relations = await self.get_bidirectional_relations_batch([record_id])
+        return relations[record_id]
+
+    async def get_bidirectional_relations_batch(self,
+                                                record_ids: Iterable[int]) -> Dict[int, Dict[str, List[int]]]:
+        """여러 레코드의 양방향 관계 정보를 UNION 쿼리 한 번으로 조회
+
+        레코드별로 정방향은 {관계명: [대상 id]}, 역방향은 {reverse_관계명: [원본 id]}로 반환한다.
+        """
+        record_ids = list(dict.fromkeys(record_ids))
+        relations: Dict[int, Dict[str, List[int]]] = {record_id: {} for record_id in record_ids}
+        if not record_ids:
+            return relations
+
+        columns = DatabaseRelation.c
+        forward = select([
+            columns.source_record_id.label("record_id"),
+            columns.relation_type,
+            columns.target_record_id.label("related_id"),
+            literal(0).label("direction"),
+        ]).where(columns.source_record_id.in_(record_ids))
+        backward = select([
+            columns.target_record_id.label("record_id"),
+            columns.relation_type,
+            columns.source_record_id.label("related_id"),
+            literal(1).label("direction"),
+        ]).where(columns.target_record_id.in_(record_ids))
+
+        rows = self.db.execute(
+            union_all(forward, backward).order_by(literal_column("direction"))
+        )
+        for record_id, rel_type, related_id, direction in rows:
+            # 정방향 관계를 먼저, 역방향 관계는 reverse_ 접두사로
+            key = f"reverse_{rel_type}" if direction else rel_type
+            relations[record_id].setdefault(key, []).append(related_id)
 
         return relations
 
     async def validate_relation(self,
-                                source_database_id: int,
+                                source_database_id: Optional[int],
                                 target_database_id: int,
                                 relation_config: RelationConfig) -> bool:
-        """관계 유효성 검증"""
-        source_db = self.db.query(Database).get(source_database_id)
-        target_db = self.db.query(Database).get(target_database_id)
-
-        if not source_db or not target_db:
+        """관계 유효성 검증 (source_database_id가 None이면 새로 만드는 데이터베이스)"""
+        graph = relation_graph.ensure(self.db)
+        if target_database_id not in graph.edges:
+            return False
+        if source_database_id is None:
+            # 아직 아무도 가리키지 않는 데이터베이스이므로 순환이 생길 수 없다
+            return True
+        if source_database_id not in graph.edges:
             return False
 
-        # 순환 참조 검사
-        if source_database_id == target_database_id:
-            # 자기 참조는 허용하되, 순환 참조는 금지
-            if relation_config.reverse_property:
-                existing_relations = self._check_circular_reference(
-                    source_database_id,
-                    target_database_id
-                )
-                if existing_relations:
-                    return False
-
-        return True
+        # 자기 참조는 허용하되, 다른 데이터베이스를 거치는 순환 참조는 금지
+        return not self._check_circular_reference(source_database_id, target_database_id)
 
     def _check_circular_reference(self,
                                   source_db_id: int,
-                                  target_db_id: int,
-                                  visited: set = None) -> bool:
-        """순환 참조 검사"""
-        if visited is None:
-            visited = set()
-
-        if source_db_id in visited:
-            return True
-
-        visited.add(source_db_id)
-
-        relations = self.db.execute(
-            """SELECT DISTINCT target_database_id 
-               FROM database_relations dr
-               JOIN database_records r ON dr.target_record_id = r.id
-               WHERE r.database_id = :db_id""",
-            {"db_id": source_db_id}
-        ).fetchall()
-
-        for relation in relations:
-            related_db_id = relation[0]
-            if self._check_circular_reference(related_db_id, target_db_id, visited):
-                return True
-
-        visited.remove(source_db_id)
-        return False
\ No newline at end of file
+                                  target_db_id: int) -> bool:
+        """순환 참조 검사 (메모리의 관계 그래프에서 도달 가능성 확인)"""
+        return relation_graph.ensure(self.db).closes_cycle(source_db_id, target_db_id)
@@ -0,0 +1,145 @@
+# backend/app/services/database_rollup.py
+from typing import Any, Dict, Iterable, Optional
+
+from app.schemas.database import RollupFunction
+
+# 합계가 필요한 함수
+_SUM_FUNCTIONS = (RollupFunction.SUM, RollupFunction.AVERAGE)
+# 최솟값/최댓값이 필요한 함수
+_MIN_FUNCTIONS = (RollupFunction.MIN, RollupFunction.RANGE)
+_MAX_FUNCTIONS = (RollupFunction.MAX, RollupFunction.RANGE)
+
+# 누적 상태로 갱신할 수 있는 함수 (SHOW_ORIGINAL은 관계 순서에 따라 달라지므로 제외)
+INCREMENTAL_FUNCTIONS = (
+    RollupFunction.COUNT,
+    RollupFunction.COUNT_VALUES,
+) + _SUM_FUNCTIONS + _MIN_FUNCTIONS + (RollupFunction.MAX,)
+
+
+class RollupState:
+    """롤업 값을 전체 재계산 없이 갱신하기 위한 누적 상태 (DatabaseRecord.rollup_state에 저장)
+
+    count는 관련 레코드 수, values는 값이 있는 레코드 수이다. 합계/평균은 sum을,
+    최솟값/최댓값은 현재 극값과 그 개수만 보관하며, 마지막 극값이 제거되면
+    다음 극값을 알 수 없으므로 재계산이 필요하다고 알린다.
+    """
+
+    @staticmethod
+    def build(values: Iterable[Any], function: RollupFunction) -> Optional[Dict[str, Any]]:
+        """관련 값 전체로 초기 상태 생성 (증분 갱신을 지원하지 않으면 None)"""
+        if function not in INCREMENTAL_FUNCTIONS:
+            return None
+
+        state = {"count": 0, "values": 0}
+        if function in _SUM_FUNCTIONS:
+            state["sum"] = 0.0
+        return RollupState.apply(state, function, added=values)
+
+    @staticmethod
+    def apply(state: Optional[Dict[str, Any]],
+              function: RollupFunction,
+              removed: Iterable[Any] = (),
+              added: Iterable[Any] = ()) -> Optional[Dict[str, Any]]:
+        """관련 값의 추가/제거를 상태에 반영한 새 상태 (재계산이 필요하면 None)"""
+        if not state or function not in INCREMENTAL_FUNCTIONS:
+            return None
+
+        state = dict(state)
+        try:
+            # 새 극값이 먼저 들어가야 기존 극값 제거 시 재계산을 피할 수 있다
+            for value in added:
+                RollupState._add(state, function, value)
+            for value in removed:
+                if not RollupState._remove(state, function, value):
+                    return None
+        except (TypeError, ValueError):  # 숫자로 바꿀 수 없거나 비교할 수 없는 값
+            return None
+
+        if state["count"] < 0 or state["values"] < 0:
+            return None
+        return state
+
+    @staticmethod
+    def value(state: Dict[str, Any], function: RollupFunction) -> Any:
+        """상태로부터 롤업 값 계산 (RollupCalculator.calculate와 같은 결과)"""
+        if not state["count"]:
+            return None
+
+        try:
+            return RollupState._value(state, function)
+        except (TypeError, ValueError):  # 빼기를 할 수 없는 값 (RollupCalculator와 같이 None)
+            return None
+
+    @staticmethod
+    def _value(state: Dict[str, Any], function: RollupFunction) -> Any:
+        if function == RollupFunction.COUNT:
+            return state["count"]
+        elif function == RollupFunction.COUNT_VALUES:
+            return state["values"]
+        elif function == RollupFunction.SUM:
+            return state["sum"]
+        elif function == RollupFunction.AVERAGE:
+            return state["sum"] / state["values"] if state["values"] else None
+
+        if not state["values"]:
+            return None
+        if function == RollupFunction.MIN:
+            return state["min"]
+        elif function == RollupFunction.MAX:
+            return state["max"]
+        elif function == RollupFunction.RANGE:
+            return state["max"] - state["min"]
+        return None
+
+    @staticmethod
+    def _add(state: Dict[str, Any], function: RollupFunction, value: Any) -> None:
+        state["count"] += 1
+        if value is None:
+            return
+
+        if function in _SUM_FUNCTIONS:
+            state["sum"] += float(value)
+        if function in _MIN_FUNCTIONS:
+            RollupState._add_extreme(state, "min", value, lambda a, b: a < b)
+        if function in _MAX_FUNCTIONS:
+            RollupState._add_extreme(state, "max", value, lambda a, b: a > b)
+        state["values"] += 1
+
+    @staticmethod
+    def _remove(state: Dict[str, Any], function: RollupFunction, value: Any) -> bool:
+        state["count"] -= 1
+        if value is None:
+            return True
+
+        state["values"] -= 1
+        if function in _SUM_FUNCTIONS:
+            state["sum"] -= float(value)
+        if function in _MIN_FUNCTIONS:
+            if not RollupState._remove_extreme(state, "min", value, lambda a, b: a < b):
+                return False
+        if function in _MAX_FUNCTIONS:
+            if not RollupState._remove_extreme(state, "max", value, lambda a, b: a > b):
+                return False
+        return True
+
+    @staticmethod
+    def _add_extreme(state: Dict[str, Any], key: str, value: Any, better) -> None:
+        count_key = f"{key}_count"
+        if not state["values"] or better(value, state[key]):
+            state[key], state[count_key] = value, 1
+        elif value == state[key]:
+            state[count_key] += 1
+
+    @staticmethod
+    def _remove_extreme(state: Dict[str, Any], key: str, value: Any, better) -> bool:
+        """극값이 아닌 값은 상태에 영향이 없다. 마지막 극값이 빠지면 False"""
+        count_key = f"{key}_count"
+        if better(value, state[key]):  # 저장된 극값보다 더 극단적인 값은 있을 수 없음
+            return False
+        if value == state[key]:
+            state[count_key] -= 1
+            if not state[count_key]:
+                if state["values"]:
+                    return False
+                state[key] = None
+        return True
@@ -0,0 +1,73 @@
+# backend/benchmarks/formula_benchmark.py
+"""수식 평가 벤치마크 (기존 regex + eval 방식 vs 컴파일 캐시 방식)
+
+실행: cd backend && python -m benchmarks.formula_benchmark
+"""
+from typing import Any, Dict, List
+import random
+import re
+import time
+
+from app.services.database.database_compute import FormulaEvaluator
+
+RECORD_COUNT = 50_000
+EXPRESSIONS = [
+    'prop("price") * prop("quantity")',
+    'if(prop("quantity") > 10, "대량", "소량")',
+    'round(prop("price") * 1.1, 2) >= 100 and prop("status") == "완료"',
+]
+
+
+def legacy_evaluate(formula: str, record_data: Dict[str, Any]) -> Any:
+    """기존 FormulaEvaluator.evaluate 구현 (비교용)"""
+    def replacer(match):
+        return repr(record_data.get(match.group(1)))
+
+    formula = re.sub(r'prop\("([^"]*)"\)', replacer, formula)
+    try:
+        return eval(formula, {"__builtins__": {}}, {
+            'if': lambda condition, true_val, false_val: true_val if condition else false_val,
+            'concat': lambda *args: ''.join(str(arg) for arg in args),
+            'length': len,
+            'round': round,
+            'abs': abs,
+        })
+    except Exception:
+        return None
+
+
+def make_records(count: int) -> List[Dict[str, Any]]:
+    rng = random.Random(42)
+    return [
+        {
+            "price": round(rng.uniform(1, 200), 2),
+            "quantity": rng.randint(0, 30),
+            "status": rng.choice(["완료", "진행중", "대기중"]),
+        }
+        for _ in range(count)
+    ]
+
+
+def per_record_us(fn, expression: str, records: List[Dict[str, Any]]) -> float:
+    start = time.perf_counter()
+    for record in records:
+        fn(expression, record)
+    return (time.perf_counter() - start) / len(records) * 1_000_000
+
+
+def main():
+    records = make_records(RECORD_COUNT)
+    evaluator = FormulaEvaluator()
+
+    print(f"records: {RECORD_COUNT}")
+    print(f"{'expression':<70} {'before(us)':>11} {'after(us)':>10} {'speedup':>8}")
+    for expression in EXPRESSIONS:
+        before = per_record_us(legacy_evaluate, expression, records)
+        after = per_record_us(evaluator.evaluate, expression, records)
+        print(f"{expression:<70} {before:>11.2f} {after:>10.2f} {before / after:>7.1f}x")
+
+    print(f"cache: {FormulaEvaluator.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# backend/benchmarks/sort_benchmark.py
+"""레코드 정렬 벤치마크 (기존 cmp_to_key 비교 함수 vs 복합 정렬 키)
+
+실행: cd backend && python -m benchmarks.sort_benchmark
+"""
+from typing import Any, Dict, List
+from datetime import datetime, timedelta
+import functools
+import random
+import time
+
+from app.services.database.database_sort import (
+    DatabaseSort, SortBuilder, SortDirection, SortType, build_option_ranks
+)
+
+RECORD_COUNT = 100_000
+
+SCHEMA = {
+    "properties": {
+        "priority": {"type": "select", "options": ["높음", "중간", "낮음"]},
+    }
+}
+
+
+def legacy_sort(options_order: Dict[str, int], records: List[Dict], sort_config: List[Dict]) -> List[Dict]:
+    """기존 DatabaseSort.sort_records 구현 (비교용)"""
+    def compare_text(value1, value2):
+        return (str(value1).lower() > str(value2).lower()) - (str(value1).lower() < str(value2).lower())
+
+    def compare_number(value1, value2):
+        try:
+            num1, num2 = float(value1), float(value2)
+            return (num1 > num2) - (num1 < num2)
+        except (ValueError, TypeError):
+            return 0
+
+    def compare_date(value1, value2):
+        try:
+            date1 = datetime.fromisoformat(value1) if isinstance(value1, str) else value1
+            date2 = datetime.fromisoformat(value2) if isinstance(value2, str) else value2
+            return (date1 > date2) - (date1 < date2)
+        except (ValueError, TypeError):
+            return 0
+
+    def compare_select(value1, value2):
+        if options_order:
+            order1 = options_order.get(value1, float('inf'))
+            order2 = options_order.get(value2, float('inf'))
+            return (order1 > order2) - (order1 < order2)
+        return compare_text(value1, value2)
+
+    handlers = {
+        SortType.TEXT: compare_text,
+        SortType.NUMBER: compare_number,
+        SortType.DATE: compare_date,
+        SortType.BOOLEAN: lambda v1, v2: (bool(v1) > bool(v2)) - (bool(v1) < bool(v2)),
+        SortType.SELECT: compare_select,
+    }
+
+    def compare_records(record1: Dict, record2: Dict) -> int:
+        for sort_rule in sort_config:
+            property_name = sort_rule["property"]
+            direction = sort_rule.get("direction", SortDirection.ASCENDING)
+            value1 = record1.get(property_name)
+            value2 = record2.get(property_name)
+            if value1 is None and value2 is None:
+                continue
+            if value1 is None:
+                return 1
+            if value2 is None:
+                return -1
+            compare_result = handlers[sort_rule.get("type", SortType.TEXT)](value1, value2)
+            if compare_result != 0:
+                return compare_result if direction == SortDirection.ASCENDING else -compare_result
+        return 0
+
+    return sorted(records, key=functools.cmp_to_key(compare_records))
+
+
+def make_records(count: int) -> List[Dict[str, Any]]:
+    rng = random.Random(42)
+    start = datetime(2024, 1, 1)
+
+    def maybe(value):
+        return None if rng.random() < 0.05 else value
+
+    return [
+        {
+            "priority": maybe(rng.choice(["높음", "중간", "낮음"])),
+            "due_date": maybe((start + timedelta(minutes=rng.randint(0, 500_000))).isoformat()),
+            "title": maybe(rng.choice(["Alpha", "beta", "Gamma", "delta"]) + str(rng.randint(0, 999))),
+            "score": maybe(rng.randint(0, 1000) / 10),
+            "done": maybe(rng.random() < 0.5),
+        }
+        for _ in range(count)
+    ]
+
+
+def main():
+    option_ranks = build_option_ranks(SCHEMA)
+    sorter = DatabaseSort(option_ranks)
+    records = make_records(RECORD_COUNT)
+    rule = SortBuilder.create_sort_rule
+    configs = {
+        "select asc, date desc": [
+            rule("priority", SortDirection.ASCENDING, SortType.SELECT),
+            rule("due_date", SortDirection.DESCENDING, SortType.DATE),
+        ],
+        "text asc": [rule("title")],
+        "number desc, boolean asc": [
+            rule("score", SortDirection.DESCENDING, SortType.NUMBER),
+            rule("done", SortDirection.ASCENDING, SortType.BOOLEAN),
+        ],
+    }
+
+    print(f"records: {RECORD_COUNT}")
+    print(f"{'sort config':<28} {'before(s)':>10} {'after(s)':>9} {'speedup':>8} {'same':>5}")
+    for name, sort_config in configs.items():
+        start = time.perf_counter()
+        expected = legacy_sort(option_ranks["priority"], records, sort_config)
+        before = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = sorter.sort_records(records, sort_config)
+        after = time.perf_counter() - start
+
+        same = all(a is b for a, b in zip(expected, result))
+        print(f"{name:<28} {before:>10.3f} {after:>9.3f} {before / after:>7.1f}x {str(same):>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import pytest
+
+from app.services.database.database_sort import DatabaseSort, build_option_ranks
+
+TAGGED_SCHEMA = {
+    "tags": {"type": "multi_select", "options": ["a", "b", "c"]},
+    "name": {"type": "text"},
+}
+
+TAGGED_RECORDS = [
+    {"id": 1, "tags": ["a"], "name": "x"},
+    {"id": 2, "tags": ["a", "b"], "name": "y"},
+    {"id": 3, "tags": ["c"], "name": "z"},
+    {"id": 4, "tags": [], "name": "w"},
+    {"id": 5, "name": "v"},
+    {"id": 6, "tags": ["a", "b"], "name": "yy"},
+]
+
+
+@pytest.fixture
+def tagged_records():
+    """다중 선택 태그(빈 값, 값 없음 포함)와 이름을 가진 정렬용 레코드"""
+    return [dict(record) for record in TAGGED_RECORDS]
+
+
+@pytest.fixture
+def tagged_sort():
+    """TAGGED_SCHEMA의 옵션 순서로 정렬하는 DatabaseSort"""
+    return DatabaseSort(build_option_ranks(TAGGED_SCHEMA))
@@ -0,0 +1,44 @@
+from types import SimpleNamespace
+
+from app.services.database.database_bulk import batched, delete_results, plan_updates
+
+
+def patch(record_id, data):
+    return SimpleNamespace(id=record_id, data=data)
+
+
+def test_batched_splits_without_losing_items():
+    ids = list(range(7))
+    assert [list(batch) for batch in batched(ids, 3)] == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(batched([], 3)) == []
+    assert [list(batch) for batch in batched(ids)] == [ids]
+
+
+def test_failed_updates_do_not_stop_the_others():
+    current = {1: {"title": "a", "tags": ["x"]}, 2: {"title": "b"}, 3: {"title": "c"}}
+    results, updated = plan_updates(current, [
+        patch(1, {"title": "A", "tags": None}),
+        patch(9, {"title": "없는 레코드"}),
+        patch(3, {"title": "지워질 레코드"}),
+        patch(1, {"done": True}),
+    ], removing={3})
+
+    assert [(result["id"], result["success"], result.get("error")) for result in results] == [
+        (1, True, None),
+        (9, False, "Record not found"),
+        (3, False, "Record is deleted in the same request"),
+        (1, True, None),
+    ]
+    assert [result["index"] for result in results] == [0, 1, 2, 3]
+    # 같은 레코드의 수정은 순서대로 병합되고, 실패한 항목은 data를 건드리지 않는다
+    assert updated == {1: {"title": "A", "done": True}}
+    assert current == {1: {"title": "A", "done": True}, 2: {"title": "b"}, 3: {"title": "c"}}
+
+
+def test_delete_results_report_missing_records():
+    results = delete_results([4, 8, 4], deleted={4})
+    assert [(result["index"], result["id"], result["success"]) for result in results] == [
+        (0, 4, True), (1, 8, False), (2, 4, True),
+    ]
+    assert results[1]["error"] == "Record not found"
+    assert all(result["action"] == "delete" for result in results)
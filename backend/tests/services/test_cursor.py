@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.cursor import decode_cursor, encode_cursor
+from app.services.database.database_cursor import (
+    decode_records_cursor, encode_records_cursor, records_cursor_hash
+)
+
+FILTERS = [{"property": "status", "operator": "equals", "value": "완료"}]
+
+
+def test_cursor_round_trip():
+    payload = {"v": "table", "k": "0aÿ", "id": 42, "s": "상태"}
+    token = encode_cursor(payload)
+    assert "=" not in token
+    assert decode_cursor(token) == payload
+
+
+@pytest.mark.parametrize("token", ["", "not a cursor", encode_cursor({"id": 1})[:-3], "WzEsMl0"])
+def test_malformed_cursors_are_rejected(token):
+    with pytest.raises(ValueError):
+        decode_cursor(token)
+
+
+def test_records_cursor_resumes_the_same_query():
+    cursor_hash = records_cursor_hash(FILTERS, None, None)
+    after = encode_records_cursor(7, None, cursor_hash)
+    assert decode_records_cursor(after, None, cursor_hash)["id"] == 7
+
+    # 같은 조건을 다른 형태(단일 조건, 그룹)로 넘겨도 같은 조회이다
+    group = {"type": "and", "conditions": FILTERS}
+    assert records_cursor_hash(FILTERS[0], None, None) == records_cursor_hash(group, None, None) == cursor_hash
+
+
+def test_records_cursor_is_rejected_under_other_filters_or_sorts():
+    cursor_hash = records_cursor_hash(FILTERS, None, "sorts-a")
+    after = encode_records_cursor(7, "table", cursor_hash, sort_key="0001")
+    assert decode_records_cursor(after, "table", cursor_hash)["k"] == "0001"
+
+    other_filters = [{"property": "status", "operator": "equals", "value": "진행중"}]
+    view_plan = SimpleNamespace(filters={"type": "and", "conditions": other_filters})
+    for replayed in [
+        records_cursor_hash(other_filters, None, "sorts-a"),
+        records_cursor_hash(None, None, "sorts-a"),
+        records_cursor_hash(FILTERS, view_plan, "sorts-a"),
+        records_cursor_hash(FILTERS, None, "sorts-b"),
+    ]:
+        with pytest.raises(ValueError):
+            decode_records_cursor(after, "table", replayed)
+
+    with pytest.raises(ValueError):
+        decode_records_cursor(after, "board", cursor_hash)
+    with pytest.raises(ValueError):
+        decode_records_cursor(after, None, cursor_hash)
+
+
+@pytest.mark.parametrize("payload", [
+    {"v": "table", "h": "x", "id": "7", "k": "0001"},
+    {"v": "table", "h": "x", "id": 7},
+    {"v": "table", "h": "x", "id": 7, "k": 1},
+])
+def test_tampered_records_cursor_is_rejected(payload):
+    with pytest.raises(ValueError):
+        decode_records_cursor(encode_cursor(payload), "table", "x")
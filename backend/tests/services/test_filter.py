@@ -0,0 +1,99 @@
+import random
+from datetime import datetime
+
+import pytest
+
+from app.services.database.database_filter import DatabaseFilter, FilterOperator
+
+OPERATORS = {
+    FilterOperator.EQUALS: lambda x, y: x == y,
+    FilterOperator.NOT_EQUALS: lambda x, y: x != y,
+    FilterOperator.CONTAINS: lambda x, y: str(y).lower() in str(x).lower(),
+    FilterOperator.DOES_NOT_CONTAIN: lambda x, y: str(y).lower() not in str(x).lower(),
+    FilterOperator.STARTS_WITH: lambda x, y: str(x).lower().startswith(str(y).lower()),
+    FilterOperator.ENDS_WITH: lambda x, y: str(x).lower().endswith(str(y).lower()),
+    FilterOperator.GREATER_THAN: lambda x, y: x > y,
+    FilterOperator.LESS_THAN: lambda x, y: x < y,
+    FilterOperator.GREATER_THAN_EQUAL: lambda x, y: x >= y,
+    FilterOperator.LESS_THAN_EQUAL: lambda x, y: x <= y,
+    FilterOperator.BETWEEN: lambda x, y: y[0] <= x <= y[1],
+    FilterOperator.IS_EMPTY: lambda x, y: x is None or x == "",
+    FilterOperator.IS_NOT_EMPTY: lambda x, y: x is not None and x != "",
+    FilterOperator.IN: lambda x, y: x in y,
+    FilterOperator.NOT_IN: lambda x, y: x not in y,
+}
+
+VALUES = {
+    "status": ["Done", "doing", "", None, "done later"],
+    "priority": [0, 1, 3, 4.5, None, "3"],
+    "due_date": ["2024-01-01", "2024-03-05T10:00:00", "2023-12-31", "soon", None],
+    "tags": [["a"], ["a", "b"], [], None],
+}
+
+
+def evaluate_group(record, group):
+    """컴파일 전의 평가 방식: 레코드마다 조건을 해석"""
+    results = (evaluate_condition(record, condition) for condition in group.get("conditions", []))
+    return all(results) if group.get("type", "and") == "and" else any(results)
+
+
+def evaluate_condition(record, condition):
+    if "conditions" in condition:
+        return evaluate_group(record, condition)
+    property_name, value = condition["property"], condition["value"]
+    record_value = record.get(property_name)
+    if isinstance(value, str) and "date" in property_name.lower():
+        try:
+            value = datetime.fromisoformat(value)
+            if isinstance(record_value, str):
+                record_value = datetime.fromisoformat(record_value)
+        except ValueError:
+            pass
+    try:
+        return OPERATORS[condition["operator"]](record_value, value)
+    except Exception:
+        return False
+
+
+def random_condition(rng, depth=0):
+    if depth < 2 and rng.random() < 0.3:
+        return {
+            "type": rng.choice(["and", "or"]),
+            "conditions": [random_condition(rng, depth + 1) for _ in range(rng.randint(0, 3))],
+        }
+    property_name = rng.choice(list(VALUES))
+    operator = rng.choice(list(FilterOperator))
+    candidates = VALUES[property_name]
+    if operator == FilterOperator.BETWEEN:
+        value = rng.choice([sorted(rng.sample(candidates[:3], 2)), [1], None])
+    elif operator in (FilterOperator.IN, FilterOperator.NOT_IN):
+        value = rng.sample(candidates, 2)
+    else:
+        value = rng.choice(candidates)
+    return {"property": property_name, "operator": operator.value, "value": value}
+
+
+@pytest.fixture
+def records():
+    rng = random.Random(11)
+    return [{name: rng.choice(values) for name, values in VALUES.items()} for _ in range(40)]
+
+
+def test_compiled_filters_match_interpreted_filters(records):
+    rng = random.Random(5)
+    for _ in range(300):
+        filters = random_condition(rng)
+        filters = filters if "conditions" in filters else {"type": "and", "conditions": [filters]}
+        predicate = DatabaseFilter().compile(filters)
+        expected = [record for record in records if evaluate_group(record, filters)]
+        assert [record for record in records if predicate(record)] == expected, filters
+
+
+def test_unknown_operator_matches_nothing(records):
+    filters = {"conditions": [{"property": "status", "operator": "sounds_like", "value": "done"}]}
+    assert DatabaseFilter().apply_filters(records, filters) == []
+
+
+def test_empty_filters_match_everything(records):
+    assert DatabaseFilter().apply_filters(records, None) == records
+    assert all(DatabaseFilter().compile({})(record) for record in records)
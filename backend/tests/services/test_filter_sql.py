@@ -0,0 +1,121 @@
+import random
+
+import pytest
+from sqlalchemy import create_engine, select, text
+
+from app.models.database import DatabaseRecord
+from app.services.database.database_dependency import record_values
+from app.services.database.database_filter import DatabaseFilter, FilterOperator
+from app.services.database.database_filter_sql import FilterSQLTranslator
+from app.services.database.database_property_index import index_value_sql, property_index_name
+
+VALUES = {
+    "status": ["Done", "done", "doing", "", None, "Done "],
+    "priority": [0, 1, 3, 4.5, -2, None, "3", True],
+    "flag": [True, False, None, 1],
+    "due_date": ["2024-01-01", "2024-03-05T10:00:00", "soon", None],
+    "tags": [["a"], ["a", "b"], [], None],
+}
+INDEXED = {"priority"}
+COMPUTED = {"score"}
+SCORES = [0, 2.5, 7, None, "high"]
+
+
+def random_condition(rng, depth=0):
+    if depth < 2 and rng.random() < 0.3:
+        return {
+            "type": rng.choice(["and", "or"]),
+            "conditions": [random_condition(rng, depth + 1) for _ in range(rng.randint(0, 3))],
+        }
+    property_name = rng.choice(list(VALUES) + ["score", "missing"])
+    candidates = VALUES.get(property_name, SCORES)
+    operator = rng.choice(list(FilterOperator))
+    if operator == FilterOperator.BETWEEN:
+        value = rng.choice([[0, 3], ["a", "e"], [1], None])
+    elif operator in (FilterOperator.IN, FilterOperator.NOT_IN):
+        value = rng.choice([rng.sample(candidates, 2), "done"])
+    else:
+        value = rng.choice(candidates)
+    return {"property": property_name, "operator": operator.value, "value": value}
+
+
+@pytest.fixture
+def engine():
+    rng = random.Random(17)
+    engine = create_engine("sqlite://")
+    table = DatabaseRecord.__table__
+    table.create(engine)
+    rows = []
+    for id_ in range(1, 61):
+        data = {name: rng.choice(values) for name, values in VALUES.items() if rng.random() < 0.9}
+        rows.append({"id": id_, "database_id": 1, "data": data, "computed": {"score": rng.choice(SCORES)}})
+    with engine.begin() as connection:
+        connection.execute(table.insert(), rows)
+        connection.execute(text(
+            f"CREATE INDEX {property_index_name('priority')} "
+            f"ON database_records (database_id, {index_value_sql('priority')})"
+        ))
+    return engine
+
+
+def pushed_down(engine, filters):
+    """SQL 조건으로 읽은 뒤 잔여 조건을 메모리에서 검사한 레코드 id"""
+    table = DatabaseRecord.__table__
+    where, residual = FilterSQLTranslator("sqlite", INDEXED, COMPUTED).translate(filters)
+    query = select([table.c.id, table.c.data, table.c.computed]).where(table.c.database_id == 1)
+    if where is not None:
+        query = query.where(where)
+    check = DatabaseFilter().compile(residual)
+    with engine.connect() as connection:
+        rows = connection.execute(query.order_by(table.c.id)).fetchall()
+    return [row.id for row in rows if check(record_values(row))]
+
+
+def in_memory(engine, filters):
+    table = DatabaseRecord.__table__
+    check = DatabaseFilter().compile(filters)
+    with engine.connect() as connection:
+        rows = connection.execute(select([table.c.id, table.c.data, table.c.computed]).order_by(table.c.id))
+        return [row.id for row in rows if check(record_values(row))]
+
+
+def test_pushdown_returns_the_same_rows_as_memory_filtering(engine):
+    rng = random.Random(23)
+    for _ in range(400):
+        filters = random_condition(rng)
+        filters = filters if "conditions" in filters else {"type": "and", "conditions": [filters]}
+        assert pushed_down(engine, filters) == in_memory(engine, filters), filters
+
+
+def test_translatable_conditions_leave_no_residual():
+    where, residual = FilterSQLTranslator("sqlite", INDEXED, COMPUTED).translate([
+        {"property": "priority", "operator": "greater_than", "value": 1},
+        {"property": "score", "operator": "in", "value": [2.5, None]},
+        {"type": "or", "conditions": [
+            {"property": "status", "operator": "equals", "value": "Done"},
+            {"property": "flag", "operator": "equals", "value": True},
+        ]},
+    ])
+    assert where is not None and residual is None
+
+
+def test_pattern_and_date_conditions_stay_in_memory():
+    conditions = [
+        {"property": "status", "operator": "contains", "value": "do"},
+        {"property": "due_date", "operator": "less_than", "value": "2024-02-01"},
+    ]
+    where, residual = FilterSQLTranslator("sqlite").translate(conditions)
+    assert where is None
+    assert residual["conditions"] == conditions
+
+
+def test_indexed_property_uses_its_index(engine):
+    table = DatabaseRecord.__table__
+    where, _ = FilterSQLTranslator("sqlite", INDEXED).translate(
+        [{"property": "priority", "operator": "equals", "value": "3"}]
+    )
+    query = select([table.c.id]).where(table.c.database_id == 1).where(where)
+    compiled = query.compile(engine, compile_kwargs={"literal_binds": True})
+    with engine.connect() as connection:
+        plan = " ".join(str(row) for row in connection.execute(text(f"EXPLAIN QUERY PLAN {compiled}")))
+    assert property_index_name("priority") in plan
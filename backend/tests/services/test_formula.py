@@ -0,0 +1,115 @@
+import asyncio
+import re
+import warnings
+
+import pytest
+
+from app.schemas.database import FormulaType
+from app.services import database_formula
+from app.services.database.database_compute import DatabaseCompute, FormulaEvaluator
+from app.services.database_formula import FORMULA_FUNCTIONS, compile_formula, evaluate_batch
+
+RECORDS = [
+    {"a": 3, "b": 0, "name": "x", "flag": True},
+    {"a": -2.5, "b": 4, "name": "hello", "flag": False},
+    {"a": None, "b": 2, "name": "", "flag": None},
+    {},
+]
+
+
+def interpret(formula, record_data):
+    """컴파일 전의 계산 방식: prop()을 값의 repr로 바꾼 뒤 eval (오류는 None)"""
+    formula = re.sub(r'prop\("([^"]*)"\)', lambda match: repr(record_data.get(match.group(1))), formula)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", SyntaxWarning)
+            return eval(formula, {"__builtins__": {}}, dict(FORMULA_FUNCTIONS))
+    except Exception:
+        return None
+
+
+@pytest.mark.parametrize("formula", [
+    'prop("a") + prop("b")',
+    'prop("a") * 2 - prop("b") / 4',
+    'prop("a") / prop("b")',
+    'prop("a") > prop("b")',
+    '1 < prop("b") <= 4',
+    'prop("a") if prop("flag") else prop("b")',
+    'prop("flag") and prop("name") or "none"',
+    'concat(prop("name"), "-", prop("a"))',
+    'length(prop("name"))',
+    'round(prop("a") / 3, 2)',
+    'abs(prop("b") - prop("a"))',
+    'prop("name")[0]',
+    'prop("missing") + 1',
+])
+@pytest.mark.parametrize("record_data", RECORDS)
+def test_compiled_formula_matches_interpreter(formula, record_data):
+    assert FormulaEvaluator().evaluate(formula, record_data) == interpret(formula, record_data)
+
+
+def test_if_function():
+    formula = 'if(prop("a") > 1, "big", concat("small ", prop("a")))'
+    assert [FormulaEvaluator().evaluate(formula, data) for data in RECORDS[:2]] == ["big", "small -2.5"]
+
+
+@pytest.mark.parametrize("formula", [
+    'prop("a" +',
+    'prop("a", "b")',
+    'unknown(prop("a"))',
+    'if(prop("a"), 1)',
+    'prop("a").real',
+])
+def test_invalid_formulas_evaluate_to_none(formula):
+    assert compile_formula(formula).error is not None
+    assert FormulaEvaluator().evaluate(formula, RECORDS[0]) is None
+
+
+def test_formulas_are_compiled_once():
+    formula = 'prop("a") * 3'
+    assert compile_formula(formula) is compile_formula(formula)
+    assert compile_formula(formula).properties == ("a",)
+
+
+BATCH_RECORDS = RECORDS + [
+    {"a": 2 ** 60, "b": 1},
+    {"a": True, "b": 0.5},
+    {"a": "7", "b": 1},
+    {"a": 1e308, "b": 1e308},
+    None,
+] + [{"a": value, "b": value % 5} for value in range(50)]
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "rows"])
+def vectorize(request, monkeypatch):
+    """NumPy 벡터 계산을 쓰는 경우와 쓰지 않는 경우 (수식 캐시는 앞뒤로 비운다)"""
+    if not request.param:
+        monkeypatch.setattr(database_formula, "np", None)
+    compile_formula.cache_clear()
+    yield request.param
+    compile_formula.cache_clear()
+
+
+@pytest.mark.parametrize("formula", [
+    'prop("a") * 2 + prop("b")',
+    'prop("a") / prop("b")',
+    '-prop("a") - 0.5',
+    'prop("a") >= prop("b")',
+    'concat(prop("a"), prop("b"))',
+])
+def test_batch_matches_row_evaluation(formula, vectorize):
+    evaluator = FormulaEvaluator()
+    row = lambda data: evaluator.evaluate(formula, data)
+
+    compiled = compile_formula(formula)
+    assert (compiled.vectorized is not None) == (vectorize and "concat" not in formula)
+    results = evaluate_batch(compiled, BATCH_RECORDS, row)
+    assert results == [row(data or {}) for data in BATCH_RECORDS]
+
+
+def test_batch_compute_converts_like_single_records():
+    compute = DatabaseCompute()
+    config = {"expression": 'prop("a") * prop("b")', "output_type": FormulaType.NUMBER}
+    batch = asyncio.run(compute.compute_formula_batch(config, BATCH_RECORDS))
+    single = [asyncio.run(compute.compute_formula(config, data or {})) for data in BATCH_RECORDS]
+    assert batch == single
@@ -0,0 +1,94 @@
+import copy
+
+import pytest
+
+from app.services.database.database_patch import PatchError, apply_json_patch, changed_keys, merge_patch
+
+DATA = {
+    "title": "Goodbye!",
+    "author": {"givenName": "John", "familyName": "Doe"},
+    "tags": ["example", "sample"],
+    "content": "This will be unchanged",
+}
+
+
+def test_merge_patch_deletes_null_keys_and_merges_objects():
+    patch = {
+        "title": "Hello!",
+        "phoneNumber": "+01-123-456-7890",
+        "author": {"familyName": None},
+        "tags": ["example"],
+        "missing": None,
+    }
+    assert merge_patch(DATA, patch) == {
+        "title": "Hello!",
+        "author": {"givenName": "John"},
+        "tags": ["example"],
+        "content": "This will be unchanged",
+        "phoneNumber": "+01-123-456-7890",
+    }
+    assert DATA["author"] == {"givenName": "John", "familyName": "Doe"}
+
+
+def test_merge_patch_replaces_non_objects_with_objects():
+    assert merge_patch({"a": "b"}, {"a": {"c": None, "d": 1}}) == {"a": {"d": 1}}
+    assert merge_patch({"a": {"b": 1}}, {"a": [1]}) == {"a": [1]}
+
+
+@pytest.mark.parametrize("operations, expected", [
+    ([{"op": "add", "path": "/tags/1", "value": "new"}], ["example", "new", "sample"]),
+    ([{"op": "add", "path": "/tags/-", "value": "last"}], ["example", "sample", "last"]),
+    ([{"op": "remove", "path": "/tags/0"}], ["sample"]),
+    ([{"op": "replace", "path": "/tags/1", "value": "other"}], ["example", "other"]),
+    ([{"op": "move", "from": "/tags/0", "path": "/tags/1"}], ["sample", "example"]),
+    ([{"op": "copy", "from": "/tags/1", "path": "/tags/0"}], ["sample", "example", "sample"]),
+])
+def test_json_patch_array_operations(operations, expected):
+    assert apply_json_patch(DATA, operations)["tags"] == expected
+
+
+def test_json_patch_applies_operations_in_order():
+    result = apply_json_patch(DATA, [
+        {"op": "test", "path": "/author/givenName", "value": "John"},
+        {"op": "move", "from": "/author/familyName", "path": "/surname"},
+        {"op": "copy", "from": "/surname", "path": "/author/a~1b"},
+        {"op": "remove", "path": "/content"},
+        {"op": "replace", "path": "/title", "value": {"text": "Hello!"}},
+    ])
+    assert result == {
+        "title": {"text": "Hello!"},
+        "author": {"givenName": "John", "a/b": "Doe"},
+        "tags": ["example", "sample"],
+        "surname": "Doe",
+    }
+
+
+@pytest.mark.parametrize("operation", [
+    {"op": "test", "path": "/title", "value": "Hello!"},
+    {"op": "remove", "path": "/missing"},
+    {"op": "replace", "path": "/missing", "value": 1},
+    {"op": "add", "path": "/tags/4", "value": "x"},
+    {"op": "add", "path": "/tags/01", "value": "x"},
+    {"op": "add", "path": "/missing/child", "value": "x"},
+    {"op": "add", "path": "/title"},
+    {"op": "move", "from": "/author", "path": "/author/copy"},
+    {"op": "replace", "path": "", "value": {}},
+    {"op": "add", "path": "title", "value": "x"},
+    {"op": "increment", "path": "/title"},
+])
+def test_failed_json_patch_leaves_data_unchanged(operation):
+    # 앞선 연산이 성공했더라도 원본은 그대로여야 한다
+    data = copy.deepcopy(DATA)
+    with pytest.raises(PatchError):
+        apply_json_patch(data, [{"op": "add", "path": "/tags/-", "value": "x"}, operation])
+    assert data == DATA
+
+
+def test_changed_keys():
+    new = apply_json_patch(DATA, [
+        {"op": "remove", "path": "/content"},
+        {"op": "add", "path": "/author/middleName", "value": "Q"},
+        {"op": "add", "path": "/extra", "value": 0},
+        {"op": "replace", "path": "/title", "value": "Goodbye!"},
+    ])
+    assert changed_keys(DATA, new) == {"content", "author", "extra"}
@@ -0,0 +1,59 @@
+import pytest
+from sqlalchemy import create_engine, select, text
+
+from app.models.database import DatabaseRecord
+from app.services.database.database_property_index import (
+    index_value_sql, indexed_expression, property_index_name, start_expression
+)
+
+RECORDS = [
+    {"id": 1, "data": {"due": "2024-03-05"}},
+    {"id": 2, "data": {"due": {"start": "2024-03-10T09:00:00", "end": "2024-04-02"}}},
+    {"id": 3, "data": {"due": {"start": "2024-02-20", "end": "2024-03-08"}}},
+    {"id": 4, "data": {"due": {"end": "2024-03-15"}}},
+    {"id": 5, "data": {"due": "2024-03-31T23:00:00"}},
+    {"id": 6, "data": {}},
+]
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    table = DatabaseRecord.__table__
+    table.create(engine)
+    with engine.begin() as connection:
+        connection.execute(table.insert(), [{"database_id": 1, **record} for record in RECORDS])
+    return engine
+
+
+def in_march(engine, value):
+    table = DatabaseRecord.__table__
+    query = (
+        select([table.c.id])
+        .where(table.c.database_id == 1)
+        .where(value >= "2024-03-01")
+        .where(value < "2024-04-01")
+        .order_by(value, table.c.id)
+    )
+    with engine.connect() as connection:
+        return [id_ for id_, in connection.execute(query)], query
+
+
+def test_date_ranges_compare_by_start(engine):
+    ids, _ = in_march(engine, start_expression("sqlite", "due"))
+    assert ids == [1, 2, 5]
+
+
+def test_index_covers_date_ranges(engine):
+    with engine.begin() as connection:
+        connection.execute(text(
+            f"CREATE INDEX {property_index_name('due')} "
+            f"ON database_records (database_id, {index_value_sql('due')})"
+        ))
+    ids, query = in_march(engine, indexed_expression("sqlite", "due"))
+    assert ids == [1, 2, 5]
+
+    with engine.connect() as connection:
+        compiled = query.compile(engine, compile_kwargs={"literal_binds": True})
+        plan = " ".join(str(row) for row in connection.execute(text(f"EXPLAIN QUERY PLAN {compiled}")))
+    assert property_index_name("due") in plan
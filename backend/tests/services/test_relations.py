@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+from app.schemas.database import RelationConfig
+from app.services import database_relations
+from app.services.database_relations import DatabaseRelationManager, RelationGraph
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    # 1 <-> 2 (양방향 관계), 2 -> 3, 3 -> 3 (자기 참조), 4는 관계 없음
+    graph = RelationGraph()
+    graph.edges = {1: {2}, 2: {1, 3}, 3: {3}, 4: set()}
+    graph.loaded = True
+    monkeypatch.setattr(database_relations, "relation_graph", graph)
+    return graph
+
+
+def validate(source_id, target_id):
+    config = RelationConfig(database_id=str(target_id))
+    return asyncio.run(DatabaseRelationManager(None).validate_relation(source_id, target_id, config))
+
+
+def test_reverse_side_of_two_way_relation_is_not_a_cycle(graph):
+    assert not graph.closes_cycle(2, 1)
+    assert validate(2, 1)
+
+
+def test_cycle_through_other_databases_is_rejected(graph):
+    # 3 -> 1 을 추가하면 1 -> 2 -> 3 -> 1
+    assert graph.closes_cycle(3, 1)
+    assert not validate(3, 1)
+
+
+def test_self_and_unrelated_relations_are_allowed(graph):
+    assert validate(3, 3)
+    assert validate(4, 1)
+    assert validate(1, 4)
+
+
+def test_new_database_only_needs_an_existing_target(graph):
+    assert validate(None, 1)
+    assert not validate(None, 99)
+    assert not validate(1, 99)
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from app.schemas.database import RollupFunction
+from app.services.database.database_compute import RollupCalculator
+from app.services.database_rollup import INCREMENTAL_FUNCTIONS, RollupState
+
+
+def same(a, b):
+    if isinstance(a, float) and isinstance(b, float):
+        return a == pytest.approx(b)
+    return a == b
+
+
+@pytest.mark.parametrize("function", INCREMENTAL_FUNCTIONS)
+def test_deltas_match_full_recompute(function):
+    rng = random.Random(7)
+    values = [rng.choice([None, 0, 1, 2, 5, 9]) for _ in range(5)]
+    state = RollupState.build(values, function)
+
+    for _ in range(200):
+        removed = rng.sample(values, k=min(len(values), rng.randint(0, 2)))
+        for value in removed:
+            values.remove(value)
+        added = [rng.choice([None, 0, 1, 2, 5, 9]) for _ in range(rng.randint(0, 2))]
+        values += added
+
+        state = RollupState.apply(state, function, removed=removed, added=added)
+        if state is None:  # 마지막 극값이 빠졌으면 다시 계산
+            state = RollupState.build(values, function)
+        assert same(RollupState.value(state, function), RollupCalculator.calculate(values, function))
+
+
+def test_removing_last_extreme_needs_recompute():
+    state = RollupState.build([1, 3, 3], RollupFunction.MAX)
+    state = RollupState.apply(state, RollupFunction.MAX, removed=[3])
+    assert RollupState.value(state, RollupFunction.MAX) == 3
+    assert RollupState.apply(state, RollupFunction.MAX, removed=[3]) is None
+
+
+def test_show_original_is_not_incremental():
+    assert RollupState.build([1, 2], RollupFunction.SHOW_ORIGINAL) is None
+
+
+def test_values_that_cannot_be_summed_need_recompute():
+    state = RollupState.build([1, 2], RollupFunction.SUM)
+    assert RollupState.apply(state, RollupFunction.SUM, added=["x"]) is None
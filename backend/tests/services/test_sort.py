@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+
+def sorted_ids(sort, records, sort_config):
+    return [record["id"] for record in sort.sort_records(records, sort_config)]
+
+
+def test_multi_select_ascending(tagged_sort, tagged_records):
+    sort_config = [{"property": "tags", "type": "multi_select"}]
+    assert sorted_ids(tagged_sort, tagged_records, sort_config) == [4, 1, 2, 6, 3, 5]
+
+
+def test_multi_select_descending_puts_longer_prefix_first(tagged_sort, tagged_records):
+    sort_config = [{"property": "tags", "type": "multi_select", "direction": "descending"}]
+    assert sorted_ids(tagged_sort, tagged_records, sort_config) == [3, 2, 6, 1, 4, 5]
+
+
+def test_multi_select_descending_then_text(tagged_sort, tagged_records):
+    sort_config = [
+        {"property": "tags", "type": "multi_select", "direction": "descending"},
+        {"property": "name", "type": "text", "direction": "descending"},
+    ]
+    assert sorted_ids(tagged_sort, tagged_records, sort_config) == [3, 6, 2, 1, 4, 5]
+
+
+TAGS_THEN_NAME = [
+    {"property": "tags", "type": "multi_select", "direction": "descending"},
+    {"property": "name", "type": "text"},
+]
+
+
+def test_window_matches_full_sort(tagged_sort):
+    rng = random.Random(3)
+    records = [
+        {"id": id_, "tags": rng.sample("abc", rng.randint(0, 2)), "name": rng.choice("xyz")}
+        for id_ in range(1, 201)
+    ]
+    full = tagged_sort.sort_records(records, TAGS_THEN_NAME)
+    for skip, limit in [(0, 10), (37, 25), (190, 50)]:
+        window, _ = tagged_sort.sort_window(records, TAGS_THEN_NAME, limit=limit, skip=skip)
+        assert window == full[skip:skip + limit]
+
+
+def test_window_cursor_pages_through_sort_order(tagged_sort, tagged_records):
+    pages, after = [], None
+    while True:
+        page, after = tagged_sort.sort_window(tagged_records, TAGS_THEN_NAME, limit=4, after=after, scope="f")
+        pages += [record["id"] for record in page]
+        if after is None:
+            break
+    assert pages == sorted_ids(tagged_sort, tagged_records, TAGS_THEN_NAME)
+
+
+def test_window_cursor_rejects_other_sorts_and_scopes(tagged_sort, tagged_records):
+    _, after = tagged_sort.sort_window(tagged_records, TAGS_THEN_NAME, limit=2, scope="f")
+    with pytest.raises(ValueError):
+        tagged_sort.sort_window(tagged_records, TAGS_THEN_NAME, limit=2, after=after, scope="g")
+    with pytest.raises(ValueError):
+        tagged_sort.sort_window(tagged_records, TAGS_THEN_NAME[:1], limit=2, after=after, scope="f")
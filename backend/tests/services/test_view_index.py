@@ -0,0 +1,58 @@
+from app.services.database.database_sort import DatabaseSort
+from app.services.database.database_view_index import SORT_KEY_LENGTH, encode_sort_key, tie_ranked_keys
+
+
+def index_order(sort, records, sort_config):
+    rule_parts = sort.rule_parts(sort_config)
+    keyed = sorted((encode_sort_key(rule_parts, record), record["id"]) for record in records)
+    return [record_id for _, record_id in keyed]
+
+
+def memory_order(sort, records, sort_config):
+    return [record["id"] for record in sort.sort_records(records, sort_config)]
+
+
+def test_multi_select_ascending(tagged_sort, tagged_records):
+    sort_config = [{"property": "tags", "type": "multi_select"}]
+    index = index_order(tagged_sort, tagged_records, sort_config)
+    assert index == memory_order(tagged_sort, tagged_records, sort_config) == [4, 1, 2, 6, 3, 5]
+
+
+def test_multi_select_descending(tagged_sort, tagged_records):
+    sort_config = [{"property": "tags", "type": "multi_select", "direction": "descending"}]
+    index = index_order(tagged_sort, tagged_records, sort_config)
+    assert index == memory_order(tagged_sort, tagged_records, sort_config) == [3, 2, 6, 1, 4, 5]
+
+
+def test_multi_select_descending_then_text(tagged_sort, tagged_records):
+    sort_config = [
+        {"property": "tags", "type": "multi_select", "direction": "descending"},
+        {"property": "name", "type": "text"},
+    ]
+    index = index_order(tagged_sort, tagged_records, sort_config)
+    assert index == memory_order(tagged_sort, tagged_records, sort_config) == [3, 2, 6, 1, 4, 5]
+
+
+def test_long_text_keys_keep_full_order():
+    prefix = "x" * 300
+    records = [
+        {"id": 1, "name": prefix + "c", "rank": 1},
+        {"id": 2, "name": prefix + "a", "rank": 2},
+        {"id": 3, "name": prefix + "b", "rank": 1},
+        {"id": 4, "name": prefix + "a", "rank": 1},
+        {"id": 5, "name": "y"},
+        {"id": 6, "name": prefix},
+    ]
+    sort_config = [
+        {"property": "name", "type": "text", "direction": "descending"},
+        {"property": "rank", "type": "number"},
+    ]
+    sort = DatabaseSort()
+    rule_parts = sort.rule_parts(sort_config)
+    full_keys = {record["id"]: encode_sort_key(rule_parts, record) for record in records}
+    stored = tie_ranked_keys(full_keys)
+
+    assert all(len(key) <= SORT_KEY_LENGTH for key in stored.values())
+    index_order = [record_id for _, record_id in sorted((key, record_id) for record_id, key in stored.items())]
+    assert index_order == [record["id"] for record in sort.sort_records(records, sort_config)]
+    assert index_order == [5, 1, 3, 4, 2, 6]
@@ -0,0 +1,98 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, select
+
+from app.models.database import DatabaseRecord
+from app.services.database.database_dependency import record_values
+from app.services.database.database_view_index import encode_sort_key
+from app.services.database.database_view_plan import DatabasePlans
+
+SCHEMA = {
+    "price": {"type": "number"},
+    "qty": {"type": "number"},
+    "total": {
+        "type": "formula",
+        "indexed": True,
+        "formula_config": {"expression": 'prop("price") * prop("qty")', "output_type": "number"},
+    },
+    "label": {
+        "type": "formula",
+        "formula_config": {"expression": 'concat("item ", prop("qty"))', "output_type": "text"},
+    },
+}
+
+VIEW = {
+    "filters": {
+        "type": "and",
+        "conditions": [
+            {"property": "total", "operator": "greater_than", "value": 10},
+            {"property": "label", "operator": "contains", "value": "item"},
+        ],
+    },
+    "sorts": [{"property": "total", "direction": "descending", "type": "number"}],
+}
+
+RECORDS = [
+    {"id": 1, "data": {"price": 5, "qty": 3}, "computed": {"total": 15, "label": "item 3"}},
+    {"id": 2, "data": {"price": 1, "qty": 4}, "computed": {"total": 4, "label": "item 4"}},
+    {"id": 3, "data": {"price": 10, "qty": 4}, "computed": {"total": 40, "label": "item 4"}},
+    {"id": 4, "data": {"price": 6, "qty": 2}, "computed": {"total": 12, "label": "other"}},
+    {"id": 5, "data": {"price": 7, "qty": 3}, "computed": {"total": 21, "label": "item 3"}},
+]
+
+
+def make_plans(schema=SCHEMA, views=None):
+    database = SimpleNamespace(id=1, schema=schema, views=views or {"table": VIEW}, updated_at=None)
+    return DatabasePlans(database)
+
+
+@pytest.fixture
+def records_table():
+    engine = create_engine("sqlite://")
+    table = DatabaseRecord.__table__
+    table.create(engine)
+    with engine.begin() as connection:
+        connection.execute(table.insert(), [{"database_id": 1, **record} for record in RECORDS])
+    return engine, table
+
+
+def test_computed_properties_are_not_indexed():
+    plans = make_plans()
+    assert plans.computed == {"total", "label"}
+    assert "total" not in plans.indexed
+
+
+def test_view_filters_and_sorts_on_formula_values(records_table):
+    engine, table = records_table
+    plan = make_plans().view("table")
+
+    where, predicate = plan.translate("sqlite")
+    with engine.connect() as connection:
+        rows = connection.execute(select([table.c.id, table.c.data, table.c.computed]).where(where))
+        candidates = [SimpleNamespace(id=id_, data=data, computed=computed) for id_, data, computed in rows]
+    # total > 10은 computed 컬럼에 대한 SQL로, contains는 합친 값에 대한 잔여 조건으로 검사
+    assert sorted(record.id for record in candidates) == [1, 3, 4, 5]
+    matched = [record for record in candidates if predicate(record_values(record))]
+
+    ordered = sorted(matched, key=lambda record: (encode_sort_key(plan.rule_parts, record_values(record)), record.id))
+    assert [record.id for record in ordered] == [3, 5, 1]
+
+
+def test_sort_signature_follows_formula_config():
+    plan = make_plans().view("table")
+    changed = dict(SCHEMA, total={**SCHEMA["total"], "formula_config": {
+        "expression": 'prop("price") + prop("qty")', "output_type": "number",
+    }})
+    assert make_plans(changed).view("table").sort_signature != plan.sort_signature
+
+    unsorted_formula = {"table": {**VIEW, "sorts": [{"property": "price", "type": "number"}]}}
+    assert (make_plans(views=unsorted_formula).view("table").sort_signature
+            == make_plans(changed, unsorted_formula).view("table").sort_signature)
+
+
+def test_unchanged_views_reuse_compiled_plans():
+    plan = make_plans().view("table")
+    cloned = make_plans(views={"table": VIEW, "copy": {**VIEW, "name": "Copy"}})
+    assert cloned.view("table") is plan
+    assert cloned.view("copy") is plan
@@ -0,0 +1,114 @@
+from types import SimpleNamespace
+
+from app.services.database.database_view_query import ViewQuery, combine_filters, group_keys, record_date
+
+SCHEMA = {
+    "status": {"type": "select", "options": ["todo", {"name": "doing"}, "done"]},
+    "tags": {"type": "multi_select", "options": ["a", "b"]},
+    "due": {"type": "date"},
+}
+ROWS = [
+    {"status": "done", "tags": ["a", "c"], "due": "2024-02-29T10:00:00"},
+    {"status": "todo", "tags": [], "due": "2024-01-05"},
+    {"status": "weird", "tags": ["b", "b"], "due": "bad"},
+    {"status": "", "tags": None, "due": {"start": "2024-01-31T23:30:00-02:00"}},
+    {"status": "done", "due": None},
+    {"status": None, "tags": ["c"]},
+]
+
+
+def make_record(id_, data, computed=None):
+    return SimpleNamespace(id=id_, data=data, computed=computed, field_data=lambda: data)
+
+
+def records():
+    return [make_record(id_, data) for id_, data in enumerate(ROWS, start=1)]
+
+
+def test_run_returns_the_window_with_totals_over_all_records():
+    query = ViewQuery({"group_by": "status", "date_property": "due"}, SCHEMA)
+    result = query.run(iter(records()), skip=2, limit=3)
+
+    assert [record.id for record in result["records"]] == [3, 4, 5]
+    assert result["total"] == len(ROWS)
+    # 스키마 옵션 순서 (레코드가 없는 옵션도 0으로), 옵션에 없는 값, 빈 값 순서
+    assert result["groups"] == [
+        {"value": "todo", "count": 1},
+        {"value": "doing", "count": 0},
+        {"value": "done", "count": 2},
+        {"value": "weird", "count": 1},
+        {"value": None, "count": 2},
+    ]
+    # 시간대가 있는 값도 적힌 현지 날짜 기준, 해석할 수 없는 날짜는 제외
+    assert result["date_buckets"] == {"2024-01": 2, "2024-02": 1}
+
+
+def test_run_pages_past_the_end_and_without_grouping():
+    result = ViewQuery({}, SCHEMA).run(iter(records()), skip=5, limit=10)
+    assert [record.id for record in result["records"]] == [6]
+    assert result["total"] == len(ROWS)
+    assert result["groups"] is None and result["date_buckets"] is None
+
+    assert ViewQuery({}, SCHEMA).run(iter(records()), skip=10)["records"] == []
+
+
+def test_multi_select_records_count_in_every_group():
+    result = ViewQuery({}, SCHEMA, group_by="tags").run(iter(records()))
+    assert result["groups"] == [
+        {"value": "a", "count": 1},
+        {"value": "b", "count": 1},
+        {"value": "c", "count": 2},
+        {"value": None, "count": 3},
+    ]
+
+
+def test_group_by_computed_values():
+    rows = [make_record(1, {}, {"stage": "x"}), make_record(2, {"stage": "y"}, {"stage": "x"})]
+    result = ViewQuery({"group_by": "stage"}, None).run(rows)
+    assert result["groups"] == [{"value": "x", "count": 2}]
+
+
+def test_query_fields_adds_the_group_and_date_properties():
+    query = ViewQuery({"group_by": "status", "date_property": "due"}, SCHEMA)
+    assert query.query_fields(None) is None
+    assert query.query_fields(["title"]) == ["title", "status", "due"]
+    assert query.query_fields(["due", "status"]) == ["due", "status"]
+    assert ViewQuery({}, SCHEMA).query_fields(["title"]) == ["title"]
+
+
+def test_group_keys_and_dates():
+    assert group_keys([{"id": 3, "name": "kim"}, {"name": "lee"}, "", 3]) == ["3", "lee"]
+    assert group_keys(None) == group_keys([]) == [None]
+    assert record_date("2024-03-05T10:00:00+09:00").isoformat() == "2024-03-05T10:00:00"
+    assert record_date(20240305) is None
+
+
+def test_combine_filters():
+    condition = {"property": "status", "operator": "equals", "value": "done"}
+    assert combine_filters(None, []) is None
+    assert combine_filters(condition, None) == {"type": "and", "conditions": [condition]}
+    combined = combine_filters(condition, [condition])
+    assert combined["type"] == "and" and len(combined["conditions"]) == 2
+
+
+def test_board_keeps_the_first_cards_of_each_group_in_view_order():
+    rows = records() + [make_record(7, {"status": "done"}), make_record(8, {"status": "done"})]
+    groups = ViewQuery({"group_by": "status"}, SCHEMA).board(iter(rows), per_group=2)
+
+    assert [(group["value"], group["count"]) for group in groups] == [
+        ("todo", 1), ("doing", 0), ("done", 4), ("weird", 1), (None, 2),
+    ]
+    cards = {group["value"]: [record.id for record in group["records"]] for group in groups}
+    assert cards == {"todo": [2], "doing": [], "done": [1, 5], "weird": [3], None: [4, 6]}
+
+
+def test_group_filter_and_predicate_select_the_same_records():
+    query = ViewQuery({"group_by": "status"}, SCHEMA)
+    assert query.group_filter("done") == {"property": "status", "operator": "equals", "value": "done"}
+    # 빈 값 그룹은 SQL 조건으로 나타내지 않고 메모리에서 검사
+    assert query.group_filter(None) is None
+    assert [id_ for id_, data in enumerate(ROWS, 1) if query.group_predicate(None)(data)] == [4, 6]
+
+    tags = ViewQuery({"group_by": "tags"}, SCHEMA)
+    assert tags.group_filter("c") is None
+    assert [id_ for id_, data in enumerate(ROWS, 1) if tags.group_predicate("c")(data)] == [1, 6]